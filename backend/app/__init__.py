@@ -1 +1,7 @@
-﻿
+﻿import os
+import sys
+
+# Services import the shared ``src`` package from the repository root; put it on the path once.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+_CACHE_CLEARERS: list[Callable[[], None]] = []
+
+
+def clear_async_ttl_caches() -> None:
+    for clear in _CACHE_CLEARERS:
+        clear()
+
+
+def async_ttl_cache(
+    ttl_seconds: float,
+    *,
+    maxsize: int = 256,
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Cache an async function's results per argument set for ``ttl_seconds``.
+
+    Concurrent misses for the same key share one in-flight call (singleflight), so a
+    burst of identical dashboard polls costs a single query. The call runs in its own
+    task, so a caller that is cancelled leaves it running for the others. Arguments must
+    be hashable. Expired entries are swept once ``maxsize`` keys are held, and the
+    oldest entry is evicted if that is not enough. The wrapper exposes ``cache_clear()``
+    like ``functools.lru_cache``.
+    """
+
+    def decorator(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        entries: dict[Hashable, tuple[float, _T]] = {}
+        inflight: dict[Hashable, asyncio.Task[_T]] = {}
+
+        def store(key: Hashable, task: asyncio.Task[_T]) -> None:
+            if inflight.get(key) is task:
+                del inflight[key]
+            if task.cancelled() or task.exception() is not None:  # also marks the error retrieved
+                return
+            now = time.monotonic()
+            if len(entries) >= maxsize:
+                for stale_key in [k for k, (expires_at, _) in entries.items() if expires_at <= now]:
+                    del entries[stale_key]
+                if len(entries) >= maxsize:
+                    del entries[next(iter(entries))]
+            entries[key] = (now + ttl_seconds, task.result())
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            key = (args, tuple(sorted(kwargs.items())))
+            cached = entries.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            # The call runs in its own task and every caller, the first included, awaits it
+            # through shield(): cancelling one request never cancels the shared call.
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                inflight[key] = task
+                task.add_done_callback(functools.partial(store, key))
+            return await asyncio.shield(task)
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        _CACHE_CLEARERS.append(entries.clear)
+        return wrapper
+
+    return decorator
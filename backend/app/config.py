@@ -1,14 +1,26 @@
 ﻿import logging
-from functools import lru_cache
+import re
+from functools import cached_property
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = logging.getLogger("app.config")
 
+# Above this many origins CORS matching switches from a list scan to one regex.
+CORS_REGEX_THRESHOLD = 8
+
 
 class Settings(BaseSettings):
     database_url: str
+    db_pool_size: int = 25
+    db_max_overflow: int = 10
+    # Recycle pooled connections before typical NAT/firewall idle timeouts.
+    db_pool_recycle: int = 1800
+    # Seconds to wait for a pooled connection before failing the request.
+    db_pool_timeout: float = 5.0
+    # Per-checkout liveness ping; enable only where idle connections get dropped early.
+    db_pool_pre_ping: bool = False
     cors_origins: str = ""
     cors_allow_origins: str | None = None
     environment: str = "development"
@@ -27,13 +39,13 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    @property
-    def cors_list(self) -> list[str]:
+    @cached_property
+    def cors_list(self) -> tuple[str, ...]:
         raw_origins = self.cors_allow_origins if self.cors_allow_origins else self.cors_origins
         origins = [item.strip() for item in raw_origins.split(",") if item.strip()]
         if self.environment.lower() == "production":
             # In production we only trust explicitly configured allowlist origins.
-            return origins
+            return tuple(origins)
 
         if self.environment.lower() != "production":
             dev_origins = [
@@ -48,9 +60,19 @@ class Settings(BaseSettings):
                 "Set ENVIRONMENT=production to restrict CORS to configured origins only.",
                 self.environment,
             )
-        return origins
+        return tuple(origins)
+
+    @cached_property
+    def cors_origin_regex(self) -> str | None:
+        origins = self.cors_list
+        if len(origins) <= CORS_REGEX_THRESHOLD:
+            return None
+        return "^(?:" + "|".join(re.escape(origin) for origin in origins) + ")$"
+
+
+# Built once at import; modules read this directly instead of calling get_settings().
+settings: Settings = Settings()
 
 
-@lru_cache
 def get_settings() -> Settings:
-    return Settings()
+    return settings
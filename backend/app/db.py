@@ -1,18 +1,31 @@
-﻿import sqlalchemy as sa
+﻿from collections.abc import Mapping, Sequence
+from typing import Any
 
-from app.config import get_settings
+import sqlalchemy as sa
 
-settings = get_settings()
-engine = sa.create_engine(settings.database_url, future=True, pool_pre_ping=True)
+from app.config import settings
 
+def _engine_options(database_url: str) -> dict:
+    options: dict = {"future": True, "pool_pre_ping": settings.db_pool_pre_ping}
+    # SQLite (tests, local tooling) uses its own single-connection pools that
+    # do not accept QueuePool sizing arguments.
+    if sa.engine.make_url(database_url).get_backend_name() != "sqlite":
+        options["pool_size"] = settings.db_pool_size
+        options["max_overflow"] = settings.db_max_overflow
+        options["pool_recycle"] = settings.db_pool_recycle
+        options["pool_timeout"] = settings.db_pool_timeout
+    return options
 
-def fetch_all(query: sa.sql.elements.TextClause, params: dict | None = None) -> list[dict]:
+
+engine = sa.create_engine(settings.database_url, **_engine_options(settings.database_url))
+
+
+def fetch_all(query: sa.sql.elements.TextClause, params: dict | None = None) -> Sequence[Mapping[str, Any]]:
+    """Return result rows as read-only ``RowMapping`` objects (no per-row dict copy)."""
     with engine.connect() as conn:
-        rows = conn.execute(query, params or {}).mappings().all()
-    return [dict(row) for row in rows]
+        return conn.execute(query, params or {}).mappings().all()
 
 
-def fetch_one(query: sa.sql.elements.TextClause, params: dict | None = None) -> dict | None:
+def fetch_one(query: sa.sql.elements.TextClause, params: dict | None = None) -> Mapping[str, Any] | None:
     with engine.connect() as conn:
-        row = conn.execute(query, params or {}).mappings().first()
-    return dict(row) if row else None
+        return conn.execute(query, params or {}).mappings().first()
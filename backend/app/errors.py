@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import functools
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from fastapi import HTTPException
+
+ErrorStatusMap = tuple[tuple[type[Exception], int], ...]
+
+_T = TypeVar("_T")
+
+logger = logging.getLogger("app.errors")
+
+
+def map_service_errors(
+    status_by_error: ErrorStatusMap,
+    *,
+    fallback_detail: str | None = None,
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Translate service exceptions raised by an async endpoint into ``HTTPException``.
+
+    ``status_by_error`` is checked in order, so list subclasses before their bases.
+    The exception message becomes the response detail. When ``fallback_detail`` is
+    set, any other exception is logged with its traceback and maps to a 500 whose
+    detail is exactly ``fallback_detail``, so internals never reach the client.
+    """
+
+    handled = tuple(error_type for error_type, _ in status_by_error)
+
+    def decorator(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except handled as exc:
+                status_code = next(code for error_type, code in status_by_error if isinstance(exc, error_type))
+                raise HTTPException(status_code=status_code, detail=str(exc)) from exc
+            except Exception:
+                if fallback_detail is None:
+                    raise
+                logger.exception("Unhandled service error in %s", func.__name__)
+                raise HTTPException(status_code=500, detail=fallback_detail) from None
+
+        return wrapper
+
+    return decorator
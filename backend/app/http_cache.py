@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.exceptions import ResponseValidationError
+from pydantic import BaseModel, ValidationError
+
+DASHBOARD_CACHE_CONTROL = "private, max-age=5, stale-while-revalidate=10"
+
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = {item.strip().removeprefix("W/") for item in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def model_json_body(payload: Any, model: type[BaseModel]) -> bytes:
+    """Validate ``payload`` as ``model`` and serialize it to JSON in pydantic-core.
+
+    A payload that does not fit the model is a server bug, so it surfaces as
+    ``ResponseValidationError`` rather than a ``ValueError`` that error maps would
+    turn into a 400.
+    """
+
+    try:
+        return model.model_validate(payload).model_dump_json().encode("utf-8")
+    except ValidationError as exc:
+        raise ResponseValidationError(exc.errors(include_url=False)) from exc
+
+
+def json_response(payload: Any, model: type[BaseModel]) -> Response:
+    return Response(content=model_json_body(payload, model), media_type="application/json")
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    *,
+    cache_control: str,
+    etag: str | None = None,
+) -> Response:
+    """Serve ``body`` as JSON with an ETag, or a bodiless 304 when the client already has it."""
+
+    resolved_etag = etag or body_etag(body)
+    headers = {"ETag": resolved_etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, resolved_etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def conditional_json(
+    request: Request,
+    payload: Any,
+    model: type[BaseModel],
+    *,
+    cache_control: str = DASHBOARD_CACHE_CONTROL,
+) -> Response:
+    return conditional_response(request, model_json_body(payload, model), cache_control=cache_control)
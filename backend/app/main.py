@@ -1,8 +1,12 @@
-﻿import logging
+﻿import asyncio
+import json
+import logging
 import os
+import queue
+import threading
 import time
-import uuid
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -10,14 +14,15 @@ from dotenv import load_dotenv
 # Load .env before any ETL/registry modules so os.getenv("DATABASE_URL") resolves.
 load_dotenv(Path(__file__).resolve().parents[2] / ".env", override=False)
 
-from fastapi import Depends, FastAPI, Request
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.gzip import GZipMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
-from app.config import get_settings
+from app.config import settings
 from app.routers import (
     auth,
     chat,
@@ -34,9 +39,10 @@ from app.routers import (
     system,
 )
 from app.security.jwt import get_current_user
+from app.services.chat_service import preload_intent_model
+from app.services.forecast_service import preload_artifact as preload_forecast_artifact
 from app.services.preflight_alerts_scheduler import PreflightAlertsScheduler
 
-settings = get_settings()
 
 # ── Rate limiter (in-memory, keyed by client IP) ──────────────────────────────
 limiter = Limiter(key_func=get_remote_address, default_limits=["200/minute"])
@@ -47,20 +53,107 @@ logging.basicConfig(
 )
 logger = logging.getLogger("app.api")
 
-_preflight_alerts_scheduler: PreflightAlertsScheduler | None = None
+# Static response headers, pre-encoded once for the ASGI middleware.
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"no-referrer"),
+)
+
+# Pre-rendered 500 body; only the (JSON-escaped) request id is substituted per error.
+_ERROR_BODY_TEMPLATE = b'{"detail":"Internal server error","request_id":%s}'
+
+# Request ids are sliced from a process-local entropy buffer instead of one
+# getrandom() syscall per uuid4(). They are correlation ids, not secrets.
+_REQUEST_ID_BYTES = 16
+_RAND_BUF_SIZE = 4096
+_rand_buf = os.urandom(_RAND_BUF_SIZE)
+_rand_off = 0
+_rand_lock = threading.Lock()
+
+
+def _reset_request_id_buffer() -> None:
+    global _rand_buf, _rand_off
+    _rand_buf = os.urandom(_RAND_BUF_SIZE)
+    _rand_off = 0
+
+
+# Forked workers must not replay the parent's buffer.
+os.register_at_fork(after_in_child=_reset_request_id_buffer)
+
+
+def _next_request_id() -> str:
+    global _rand_buf, _rand_off
+    with _rand_lock:
+        if _rand_off + _REQUEST_ID_BYTES > _RAND_BUF_SIZE:
+            _rand_buf = os.urandom(_RAND_BUF_SIZE)
+            _rand_off = 0
+        chunk = _rand_buf[_rand_off:_rand_off + _REQUEST_ID_BYTES]
+        _rand_off += _REQUEST_ID_BYTES
+    return chunk.hex()
+
+
+def _accepts_streaming_media(scope) -> bool:
+    for key, value in scope["headers"]:
+        if key == b"accept":
+            return any(media_type in value for media_type in _STREAMING_MEDIA_TYPES)
+    return False
+
+
+def _request_id_from_scope(scope) -> str | None:
+    # ASGI header names are already lower-cased bytes, so a plain scan avoids
+    # building a Starlette Headers object for a single lookup.
+    for key, value in scope["headers"]:
+        if key == b"x-request-id":
+            return value.decode("latin-1") or None
+    return None
+
+
+# JSON bodies (timeseries, batch forecasts, experiments) compress well; small ones
+# are not worth the CPU. Artifact downloads, the Prometheus scrape and streamed
+# NDJSON/SSE bodies skip compression.
+_GZIP_MINIMUM_SIZE = 1024
+_GZIP_COMPRESS_LEVEL = 4
+_UNCOMPRESSED_PATHS = frozenset({"/api/v1/diagnostics/metrics"})
+_UNCOMPRESSED_PATH_MARKERS = ("/download/",)
+_STREAMING_MEDIA_TYPES = (b"application/x-ndjson", b"text/event-stream")
+
+# High-frequency probe/static paths: headers are still added, access logging is skipped.
+_UNLOGGED_PATHS = frozenset({"/api/v1/health"})
+_UNLOGGED_PREFIXES = ("/static",)
+
+
+def _enqueue_access_logs(stack: AsyncExitStack) -> None:
+    """Route ``app.api`` records through a queue so handler I/O runs off the event loop."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+    logger.addHandler(handler)
+    logger.propagate = False
+    listener.start()
+
+    def _restore() -> None:
+        logger.removeHandler(handler)
+        logger.propagate = True
+        listener.stop()
+
+    stack.callback(_restore)
 
 
 @asynccontextmanager
-async def app_lifespan(_: FastAPI):
-    global _preflight_alerts_scheduler
-    _preflight_alerts_scheduler = PreflightAlertsScheduler.from_env()
-    _preflight_alerts_scheduler.start()
-    try:
+async def app_lifespan(app_: FastAPI):
+    # Deserialize model artifacts before serving traffic so the first requests
+    # (and a burst of them after a restart) do not each pay for joblib.load.
+    await asyncio.to_thread(preload_forecast_artifact)
+    await asyncio.to_thread(preload_intent_model)
+
+    async with AsyncExitStack() as stack:
+        _enqueue_access_logs(stack)
+        scheduler = PreflightAlertsScheduler.from_env()
+        stack.callback(scheduler.shutdown)
+        scheduler.start()
+        app_.state.preflight_scheduler = scheduler
         yield
-    finally:
-        if _preflight_alerts_scheduler is not None:
-            _preflight_alerts_scheduler.shutdown()
-            _preflight_alerts_scheduler = None
 
 
 app = FastAPI(
@@ -68,6 +161,7 @@ app = FastAPI(
     description="API for KPI analytics, timeseries exploration, and sales forecasting",
     version="2.0.0",
     lifespan=app_lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Attach rate limiter state and handler
@@ -76,61 +170,122 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_list,
+    allow_origins=() if settings.cors_origin_regex else settings.cors_list,
+    allow_origin_regex=settings.cors_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=600,
 )
 
-@app.middleware("http")
-async def observability_middleware(request: Request, call_next):
-    request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
-    started = time.perf_counter()
-    try:
-        response = await call_next(request)
-    except Exception:  # noqa: BLE001
-        logger.exception(
-            "Unhandled error: method=%s path=%s request_id=%s",
-            request.method,
-            request.url.path,
-            request_id,
-        )
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "Internal server error", "request_id": request_id},
-            headers={"X-Request-ID": request_id},
+class ObservabilityMiddleware:
+    """Pure ASGI middleware adding request ids, security headers and access logs."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _request_id_from_scope(scope) or _next_request_id()
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+        path = scope["path"]
+        log_access = (
+            path not in _UNLOGGED_PATHS
+            and not path.startswith(_UNLOGGED_PREFIXES)
+            and logger.isEnabledFor(logging.INFO)
         )
+        started = time.perf_counter() if log_access else 0.0
+        response_started = False
+        status_code = 500
 
-    duration_ms = (time.perf_counter() - started) * 1000.0
-    response.headers["X-Request-ID"] = request_id
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["Referrer-Policy"] = "no-referrer"
-    logger.info(
-        "Request completed: method=%s path=%s status=%s duration_ms=%.2f request_id=%s",
-        request.method,
-        request.url.path,
-        response.status_code,
-        duration_ms,
-        request_id,
-    )
-    return response
+        async def send_wrapper(message) -> None:
+            nonlocal response_started, status_code
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), request_id_header, *_SECURITY_HEADERS]
+            await send(message)
+            if log_access and message["type"] == "http.response.body" and not message.get("more_body", False):
+                duration_ms = (time.perf_counter() - started) * 1000.0
+                logger.info(
+                    "Request completed: method=%s path=%s status=%s duration_ms=%.2f request_id=%s",
+                    scope["method"],
+                    path,
+                    status_code,
+                    duration_ms,
+                    request_id,
+                )
 
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:  # noqa: BLE001
+            logger.exception(
+                "Unhandled error: method=%s path=%s request_id=%s",
+                scope["method"],
+                scope["path"],
+                request_id,
+            )
+            if response_started:
+                raise
+            body = _ERROR_BODY_TEMPLATE % json.dumps(request_id).encode()
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 500,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                        request_id_header,
+                        *_SECURITY_HEADERS,
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """``GZipMiddleware`` that passes downloads, metrics and streamed responses through untouched."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and (
+            scope["path"] in _UNCOMPRESSED_PATHS
+            or any(marker in scope["path"] for marker in _UNCOMPRESSED_PATH_MARKERS)
+            or _accepts_streaming_media(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=_GZIP_MINIMUM_SIZE, compresslevel=_GZIP_COMPRESS_LEVEL)
+app.add_middleware(ObservabilityMiddleware)
+
+_API_PREFIX = "/api/v1"
 _protected = [Depends(get_current_user)]
 
-# Public — no auth required
-app.include_router(health.router, prefix="/api/v1", tags=["health"])
-app.include_router(auth.router,   prefix="/api/v1", tags=["auth"])
+# (router module, tag) pairs, included in order under the shared API prefix.
+_PUBLIC_ROUTERS = ((health, "health"), (auth, "auth"))
+_PROTECTED_ROUTERS = (
+    (stores, "stores"),
+    (kpi, "kpi"),
+    (sales, "sales"),
+    (forecast, "forecast"),
+    (scenario, "scenario"),
+    (system, "system"),
+    (data_sources, "data_sources"),
+    (contracts, "contracts"),
+    (ml, "ml"),
+    (chat, "chat"),
+    (diagnostics, "diagnostics"),
+)
+
+# Public — no auth required. The health probe is kept out of the OpenAPI schema.
+for module, tag in _PUBLIC_ROUTERS:
+    app.include_router(module.router, prefix=_API_PREFIX, tags=[tag], include_in_schema=module is not health)
 
 # Protected — valid JWT required
-app.include_router(stores.router,       prefix="/api/v1", tags=["stores"],       dependencies=_protected)
-app.include_router(kpi.router,          prefix="/api/v1", tags=["kpi"],          dependencies=_protected)
-app.include_router(sales.router,        prefix="/api/v1", tags=["sales"],        dependencies=_protected)
-app.include_router(forecast.router,     prefix="/api/v1", tags=["forecast"],     dependencies=_protected)
-app.include_router(scenario.router,     prefix="/api/v1", tags=["scenario"],     dependencies=_protected)
-app.include_router(system.router,       prefix="/api/v1", tags=["system"],       dependencies=_protected)
-app.include_router(data_sources.router, prefix="/api/v1", tags=["data_sources"], dependencies=_protected)
-app.include_router(contracts.router,    prefix="/api/v1", tags=["contracts"],    dependencies=_protected)
-app.include_router(ml.router,           prefix="/api/v1", tags=["ml"],           dependencies=_protected)
-app.include_router(chat.router,         prefix="/api/v1", tags=["chat"],         dependencies=_protected)
-app.include_router(diagnostics.router,  prefix="/api/v1", tags=["diagnostics"],  dependencies=_protected)
+for module, tag in _PROTECTED_ROUTERS:
+    app.include_router(module.router, prefix=_API_PREFIX, tags=[tag], dependencies=_protected)
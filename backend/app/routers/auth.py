@@ -6,6 +6,7 @@ from typing import Any
 
 import sqlalchemy as sa
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
@@ -26,6 +27,8 @@ _limiter = Limiter(key_func=get_remote_address)
 
 logger = logging.getLogger("app.auth")
 
+_USER_LIST_ADAPTER = TypeAdapter(list[UserResponse])
+
 
 def _get_user_by_email(email: str) -> dict[str, Any] | None:
     return fetch_one(
@@ -155,7 +158,7 @@ def list_users(admin: dict[str, Any] = Depends(get_admin_user)) -> list[UserResp
     rows = fetch_all(
         sa.text("SELECT id, email, username, role, is_active, created_at, created_by FROM users ORDER BY created_at DESC")
     )
-    return [UserResponse(**r) for r in rows]
+    return _USER_LIST_ADAPTER.validate_python(rows)
 
 
 @router.patch("/auth/users/{user_id}/deactivate", response_model=UserResponse)
@@ -1,18 +1,16 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
 
+from app.errors import map_service_errors
 from app.schemas import ChatQueryRequest, ChatResponse
 from app.services.chat_service import answer_chat_query
 
 router = APIRouter()
 
+_CHAT_ERRORS = ((ValueError, 400), (FileNotFoundError, 404))
+
 
 @router.post("/chat/query", response_model=ChatResponse)
-def chat_query(payload: ChatQueryRequest) -> ChatResponse:
-    try:
-        return answer_chat_query(payload.message)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Chat error: {exc}") from exc
+@map_service_errors(_CHAT_ERRORS, fallback_detail="Chat error")
+async def chat_query(payload: ChatQueryRequest) -> ChatResponse:
+    return await run_in_threadpool(answer_chat_query, payload.message)
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import time
 
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+
+from app.errors import map_service_errors
+from app.http_cache import body_etag, conditional_response
 from app.schemas import (
     ContractDetailResponse,
     ContractSummaryResponse,
@@ -17,62 +24,72 @@ from app.services.contract_service import (
 
 router = APIRouter()
 
+# Missing registry/schema files are 404s; a malformed registry is a server error.
+_CONTRACT_ERRORS = ((FileNotFoundError, 404), (ValueError, 500))
+
+# Validate and serialize the whole list in one pydantic-core call instead of one model_validate per row.
+_CONTRACT_LIST_ADAPTER = TypeAdapter(list[ContractSummaryResponse])
+
+
+# Serialized GET /contracts body + ETag, reused for a short TTL (the registry is a
+# rarely-edited YAML file). Clients revalidate with If-None-Match and get a 304.
+_CONTRACT_LIST_CACHE_TTL_SECONDS = 60.0
+_CONTRACT_LIST_CACHE_CONTROL = "private, max-age=30"
+_CONTRACT_LIST_CACHE: dict[str, tuple[float, str, bytes]] = {}
+
+
+def clear_contract_list_cache() -> None:
+    _CONTRACT_LIST_CACHE.clear()
+
+
+async def _contract_list_body() -> tuple[str, bytes]:
+    cached = _CONTRACT_LIST_CACHE.get("contracts")
+    now = time.monotonic()
+    if cached is not None and cached[0] > now:
+        return cached[1], cached[2]
+
+    rows = await run_in_threadpool(list_contracts)
+    body = _CONTRACT_LIST_ADAPTER.dump_json(_CONTRACT_LIST_ADAPTER.validate_python(rows))
+    etag = body_etag(body)
+    _CONTRACT_LIST_CACHE["contracts"] = (now + _CONTRACT_LIST_CACHE_TTL_SECONDS, etag, body)
+    return etag, body
+
 
 @router.get("/contracts", response_model=list[ContractSummaryResponse])
-def get_contract_list() -> list[ContractSummaryResponse]:
-    try:
-        rows = list_contracts()
-        return [ContractSummaryResponse.model_validate(row) for row in rows]
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except ValueError as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+@map_service_errors(_CONTRACT_ERRORS)
+async def get_contract_list(request: Request) -> Response:
+    etag, body = await _contract_list_body()
+    return conditional_response(request, body, cache_control=_CONTRACT_LIST_CACHE_CONTROL, etag=etag)
 
 
 @router.get("/contracts/{contract_id}", response_model=ContractDetailResponse)
-def get_contract_by_id(contract_id: str) -> ContractDetailResponse:
-    try:
-        row = get_contract(contract_id)
-        if row is None:
-            raise HTTPException(status_code=404, detail=f"Contract not found: {contract_id}")
-        return ContractDetailResponse.model_validate(row)
-    except HTTPException:
-        raise
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except ValueError as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+@map_service_errors(_CONTRACT_ERRORS)
+async def get_contract_by_id(contract_id: str) -> ContractDetailResponse:
+    row = await run_in_threadpool(get_contract, contract_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Contract not found: {contract_id}")
+    return row
 
 
 @router.get("/contracts/{contract_id}/versions", response_model=list[ContractVersionSummaryResponse])
-def get_contract_versions(contract_id: str) -> list[ContractVersionSummaryResponse]:
-    try:
-        contract = get_contract(contract_id)
-        if contract is None:
-            raise HTTPException(status_code=404, detail=f"Contract not found: {contract_id}")
-        rows = list_contract_versions(contract_id)
-        return [ContractVersionSummaryResponse.model_validate(row) for row in rows]
-    except HTTPException:
-        raise
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except ValueError as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+@map_service_errors(_CONTRACT_ERRORS)
+async def get_contract_versions(contract_id: str) -> list[ContractVersionSummaryResponse]:
+    contract, rows = await asyncio.gather(
+        run_in_threadpool(get_contract, contract_id),
+        run_in_threadpool(list_contract_versions, contract_id),
+    )
+    if contract is None:
+        raise HTTPException(status_code=404, detail=f"Contract not found: {contract_id}")
+    return rows
 
 
 @router.get(
     "/contracts/{contract_id}/versions/{version}",
     response_model=ContractVersionDetailResponse,
 )
-def get_contract_version_by_id(contract_id: str, version: str) -> ContractVersionDetailResponse:
-    try:
-        row = get_contract_version(contract_id, version)
-        if row is None:
-            raise HTTPException(status_code=404, detail=f"Contract version not found: {contract_id}/{version}")
-        return ContractVersionDetailResponse.model_validate(row)
-    except HTTPException:
-        raise
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except ValueError as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+@map_service_errors(_CONTRACT_ERRORS)
+async def get_contract_version_by_id(contract_id: str, version: str) -> ContractVersionDetailResponse:
+    row = await run_in_threadpool(get_contract_version, contract_id, version)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Contract version not found: {contract_id}/{version}")
+    return row
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
-from typing import Literal
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
-from fastapi.responses import FileResponse
-
+import time
+from collections.abc import Callable, Iterator
+from typing import Annotated, Any, Literal
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
+
+from app.cache import async_ttl_cache
+from app.errors import map_service_errors
+from app.http_cache import conditional_json, json_response
 from app.security.diagnostics_auth import (
     SCOPE_ADMIN,
+    SCOPE_OPERATE,
     SCOPE_READ,
     DiagnosticsPrincipal,
     authenticate_diagnostics_principal,
     require_scope,
 )
-from app.services.metrics_export_service import render_prometheus_metrics
+from app.services.metrics_export_service import metrics_version, render_prometheus_metrics
 from app.schemas import (
+    PreflightAnalyticsQuery,
+    PreflightNotificationAnalyticsQuery,
+    PreflightNotificationTrendsQuery,
+    PreflightTopRulesQuery,
+    PreflightTrendsQuery,
     DataAvailabilityResponse,
     NotificationDeliveryPageResponse,
     NotificationEndpointsResponse,
@@ -37,6 +52,7 @@ from app.schemas import (
     PreflightNotificationStatsResponse,
     PreflightNotificationTrendsResponse,
     PreflightNotificationOutboxResponse,
+    PreflightNotificationOverviewResponse,
     PreflightSilencesResponse,
     PreflightRunDetailResponse,
     PreflightRunsListResponse,
@@ -86,30 +102,169 @@ from app.services.preflight_notifications_service import (
     get_notification_endpoints,
     get_notification_history,
     get_notification_outbox,
+    get_notification_overview,
     get_notification_stats,
     get_notification_trends,
     replay_dead_notification_outbox,
     replay_notification_outbox_item,
     run_notification_dispatch,
+    stream_notification_attempts,
+    stream_notification_outbox,
 )
 
 router = APIRouter()
 
+# One dependency object per scope, shared by every route signature.
+_DEP_READ = Depends(require_scope(SCOPE_READ))
+_DEP_OPERATE = Depends(require_scope(SCOPE_OPERATE))
+_DEP_ADMIN = Depends(require_scope(SCOPE_ADMIN))
+
+_SourceName = Literal["train", "store"]
+_RunMode = Literal["off", "report_only", "enforce"]
+_FinalStatus = Literal["PASS", "WARN", "FAIL"]
+
+_FALLBACK_DETAIL = "Diagnostics error"
+# Status maps for map_service_errors, checked in order. DiagnosticsPayloadError is a
+# ValueError and DiagnosticsNotFoundError a LookupError, so list them before their bases.
+_PAYLOAD_ERRORS = ((DiagnosticsPayloadError, 400),)
+_ALERT_READ_ERRORS = ((DiagnosticsPayloadError, 400), (DiagnosticsNotFoundError, 400))
+_ALERT_INPUT_ERRORS = ((ValueError, 400), (DiagnosticsNotFoundError, 400))
+_ALERT_MUTATION_ERRORS = ((DiagnosticsNotFoundError, 404), (ValueError, 400))
+_NOTIFICATION_ERRORS = ((ValueError, 400),)
+_NOTIFICATION_CONFIG_ERRORS = ((ValueError, 400), (FileNotFoundError, 400))
+_REPLAY_ERRORS = ((LookupError, 404), (ValueError, 400))
+_ARTIFACT_ERRORS = (
+    (DiagnosticsNotFoundError, 404),
+    (DiagnosticsAccessError, 403),
+    (DiagnosticsPayloadError, 400),
+)
+
+
+# Read-only aggregations are polled by dashboards every few seconds; identical
+# queries inside this window (including concurrent ones) share one service call.
+_ANALYTICS_CACHE_TTL_SECONDS = 5.0
+
+
+@async_ttl_cache(_ANALYTICS_CACHE_TTL_SECONDS)
+async def _cached_analytics(func: Callable[..., dict[str, Any]], **filters: Any) -> dict[str, Any]:
+    return await run_in_threadpool(func, **filters)
+
+
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Artifacts of a finished run never change. Proxies should pass them straight through.
+_ARTIFACT_DOWNLOAD_HEADERS = {"X-Accel-Buffering": "no", "Cache-Control": "private, max-age=300"}
+
+
+class _ArtifactFileResponse(FileResponse):
+    # Preflight CSV/JSON artifacts can be large; read them in 1 MiB chunks rather than 64 KiB.
+    chunk_size = 1024 * 1024
+
+
+# The per-source artifact routes differ only in the loader; URLs and response models stay per route.
+_SOURCE_ARTIFACT_LOADERS: dict[str, Callable[..., dict[str, Any]]] = {
+    "artifacts": get_preflight_source_artifacts,
+    "validation": get_preflight_source_validation,
+    "semantic": get_preflight_source_semantic,
+    "manifest": get_preflight_source_manifest,
+}
+
+
+async def _source_artifact(kind: str, *, run_id: str, source_name: str) -> dict[str, Any]:
+    return await run_in_threadpool(_SOURCE_ARTIFACT_LOADERS[kind], run_id=run_id, source_name=source_name)
+
+
+def _artifact_download(**kwargs: Any) -> tuple[dict[str, Any], os.stat_result]:
+    payload = get_preflight_source_artifact_download(**kwargs)
+    return payload, os.stat(payload["path"])
+
+
+def _wants_ndjson(request: Request) -> bool:
+    return _NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _ndjson_response(rows: Iterator[dict[str, Any]]) -> StreamingResponse:
+    # Sync iterators are drained in the threadpool, one registry batch at a time. Row keys
+    # are SQLAlchemy quoted_name str subclasses, which orjson only accepts as non-str keys.
+    lines = (orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS) + b"\n" for row in rows)
+    return StreamingResponse(lines, media_type=_NDJSON_MEDIA_TYPE)
+
+
+@functools.lru_cache(maxsize=32)
+def _flag_enabled(raw: str) -> bool:
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
 
 def _metrics_auth_disabled() -> bool:
-    raw = str(os.getenv("DIAGNOSTICS_METRICS_AUTH_DISABLED", "0")).strip().lower()
-    return raw in {"1", "true", "yes", "on"}
+    return _flag_enabled(os.getenv("DIAGNOSTICS_METRICS_AUTH_DISABLED", "0"))
+
+
+# Rendered exposition reused for a short TTL (keep it below the scrape interval) so
+# concurrent scrapes share one render.
+# Entries also record metrics_version(), so a mutation made by this process (alert
+# evaluation, dispatch, replays) forces a fresh render before the TTL runs out.
+_DEFAULT_METRICS_CACHE_TTL_SECONDS = 2.0
+_METRICS_CACHE_KEY = "exposition"
+_METRICS_CACHE: dict[str, tuple[float, int, bytes]] = {}
+_METRICS_CACHE_LOCK = asyncio.Lock()
+
+
+def clear_metrics_cache() -> None:
+    _METRICS_CACHE.clear()
+
+
+def _metrics_cache_ttl_seconds() -> float:
+    raw = str(os.getenv("DIAGNOSTICS_METRICS_CACHE_TTL_SECONDS", "")).strip()
+    if not raw:
+        return _DEFAULT_METRICS_CACHE_TTL_SECONDS
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return _DEFAULT_METRICS_CACHE_TTL_SECONDS
+
+
+def _fresh_metrics_entry() -> bytes | None:
+    cached = _METRICS_CACHE.get(_METRICS_CACHE_KEY)
+    if cached is None:
+        return None
+    expires_at, version, payload = cached
+    if expires_at <= time.monotonic() or version != metrics_version():
+        return None
+    return payload
+
+
+async def _metrics_payload() -> bytes:
+    ttl_seconds = _metrics_cache_ttl_seconds()
+    if ttl_seconds <= 0:
+        return (await run_in_threadpool(render_prometheus_metrics)).encode("utf-8")
 
+    cached = _fresh_metrics_entry()
+    if cached is not None:
+        return cached
 
-async def _require_metrics_scope(request: Request) -> DiagnosticsPrincipal | None:
+    async with _METRICS_CACHE_LOCK:
+        cached = _fresh_metrics_entry()
+        if cached is not None:
+            return cached
+        version = metrics_version()
+        payload = (await run_in_threadpool(render_prometheus_metrics)).encode("utf-8")
+        _METRICS_CACHE[_METRICS_CACHE_KEY] = (time.monotonic() + ttl_seconds, version, payload)
+        return payload
+
+
+async def _require_metrics_scope(
+    request: Request,
+    background_tasks: BackgroundTasks,
+) -> DiagnosticsPrincipal | None:
     if _metrics_auth_disabled():
         return None
 
     principal = await authenticate_diagnostics_principal(
         request,
+        background_tasks,
         api_key=request.headers.get("X-API-Key"),
     )
-    scopes = {str(scope).strip() for scope in principal.scopes}
+    scopes = principal.normalized_scopes
     if SCOPE_READ in scopes or SCOPE_ADMIN in scopes:
         return principal
 
@@ -123,489 +278,372 @@ async def _require_metrics_scope(request: Request) -> DiagnosticsPrincipal | Non
 async def diagnostics_metrics(
     _principal: DiagnosticsPrincipal | None = Depends(_require_metrics_scope),
 ) -> Response:
-    payload = render_prometheus_metrics()
+    payload = await _metrics_payload()
     return Response(
         content=payload,
         media_type="text/plain",
-        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        headers={
+            "Content-Type": "text/plain; version=0.0.4; charset=utf-8",
+            "Cache-Control": "no-store",
+        },
     )
 
 
 @router.get("/diagnostics/preflight/runs", response_model=PreflightRunsListResponse)
-def diagnostics_preflight_runs(
+@map_service_errors((), fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_runs(
     limit: int = Query(20, ge=1, le=100),
-    source_name: Literal["train", "store"] | None = Query(default=None),
+    source_name: _SourceName | None = Query(default=None),
     data_source_id: int | None = Query(default=None, gt=0),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightRunsListResponse:
-    try:
-        kwargs: dict[str, object] = {"limit": limit, "source_name": source_name}
-        if data_source_id is not None:
-            kwargs["data_source_id"] = data_source_id
-        items = list_preflight_run_summaries(**kwargs)
-        return PreflightRunsListResponse(items=items, limit=limit, source_name=source_name)
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    kwargs: dict[str, object] = {"limit": limit, "source_name": source_name}
+    if data_source_id is not None:
+        kwargs["data_source_id"] = data_source_id
+    items = await run_in_threadpool(list_preflight_run_summaries, **kwargs)
+    return json_response({"items": items, "limit": limit, "source_name": source_name}, PreflightRunsListResponse)
 
 
 @router.get("/diagnostics/preflight/data-availability", response_model=DataAvailabilityResponse)
-def diagnostics_preflight_data_availability(
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+@map_service_errors((), fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_data_availability(
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> DataAvailabilityResponse:
-    try:
-        payload = get_data_availability()
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return DataAvailabilityResponse.model_validate(payload)
+    return await run_in_threadpool(get_data_availability)
 
 
 @router.get("/diagnostics/preflight/runs/{run_id}", response_model=PreflightRunDetailResponse)
-def diagnostics_preflight_run_details(
+@map_service_errors((), fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_run_details(
     run_id: str,
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> PreflightRunDetailResponse:
-    try:
-        payload = get_preflight_run_details(run_id)
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
+    payload = await run_in_threadpool(get_preflight_run_details, run_id)
 
     if payload is None:
         raise HTTPException(status_code=404, detail=f"Preflight run not found: {run_id}")
-    return PreflightRunDetailResponse.model_validate(payload)
+    return payload
 
 
 @router.get("/diagnostics/preflight/latest", response_model=PreflightRunDetailResponse)
-def diagnostics_preflight_latest(
+@map_service_errors((), fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_latest(
     data_source_id: int | None = Query(default=None, gt=0),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> PreflightRunDetailResponse:
-    try:
-        if data_source_id is None:
-            payload = get_latest_preflight_run()
-        else:
-            payload = get_latest_preflight_run(data_source_id=data_source_id)
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
+    if data_source_id is None:
+        payload = await run_in_threadpool(get_latest_preflight_run)
+    else:
+        payload = await run_in_threadpool(get_latest_preflight_run, data_source_id=data_source_id)
 
     if payload is None:
         raise HTTPException(status_code=404, detail="No preflight runs found")
-    return PreflightRunDetailResponse.model_validate(payload)
+    return payload
 
 
 @router.get("/diagnostics/preflight/latest/{source_name}", response_model=PreflightRunSummary)
-def diagnostics_preflight_latest_by_source(
-    source_name: Literal["train", "store"],
+@map_service_errors((), fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_latest_by_source(
+    source_name: _SourceName,
     data_source_id: int | None = Query(default=None, gt=0),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> PreflightRunSummary:
-    try:
-        if data_source_id is None:
-            payload = get_latest_preflight_for_source(source_name)
-        else:
-            payload = get_latest_preflight_for_source(source_name, data_source_id=data_source_id)
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
+    if data_source_id is None:
+        payload = await run_in_threadpool(get_latest_preflight_for_source, source_name)
+    else:
+        payload = await run_in_threadpool(
+            get_latest_preflight_for_source,
+            source_name,
+            data_source_id=data_source_id,
+        )
 
     if payload is None:
         raise HTTPException(status_code=404, detail=f"No preflight runs found for source '{source_name}'")
-    return PreflightRunSummary.model_validate(payload)
+    return payload
 
 
 @router.get("/diagnostics/preflight/stats", response_model=PreflightStatsResponse)
-def diagnostics_preflight_stats(
-    source_name: Literal["train", "store"] | None = Query(default=None),
-    data_source_id: int | None = Query(default=None, gt=0),
-    mode: Literal["off", "report_only", "enforce"] | None = Query(default=None),
-    final_status: Literal["PASS", "WARN", "FAIL"] | None = Query(default=None),
-    date_from: str | None = Query(default=None),
-    date_to: str | None = Query(default=None),
-    days: int | None = Query(default=None, ge=1, le=3650),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightStatsResponse:
-    try:
-        payload = get_preflight_stats(
-            source_name=source_name,
-            data_source_id=data_source_id,
-            mode=mode,
-            final_status=final_status,
-            date_from=date_from,
-            date_to=date_to,
-            days=days,
-        )
-    except DiagnosticsPayloadError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightStatsResponse.model_validate(payload)
+@map_service_errors(_PAYLOAD_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_stats(
+    request: Request,
+    filters: Annotated[PreflightAnalyticsQuery, Query()],
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await _cached_analytics(
+        get_preflight_stats,
+        **filters.model_dump(),
+    )
+    return conditional_json(request, payload, PreflightStatsResponse)
 
 
 @router.get("/diagnostics/preflight/trends", response_model=PreflightTrendsResponse)
-def diagnostics_preflight_trends(
-    source_name: Literal["train", "store"] | None = Query(default=None),
-    data_source_id: int | None = Query(default=None, gt=0),
-    mode: Literal["off", "report_only", "enforce"] | None = Query(default=None),
-    final_status: Literal["PASS", "WARN", "FAIL"] | None = Query(default=None),
-    date_from: str | None = Query(default=None),
-    date_to: str | None = Query(default=None),
-    days: int | None = Query(default=None, ge=1, le=3650),
-    bucket: Literal["day", "hour"] = Query(default="day"),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightTrendsResponse:
-    try:
-        payload = get_preflight_trends(
-            source_name=source_name,
-            data_source_id=data_source_id,
-            mode=mode,
-            final_status=final_status,
-            date_from=date_from,
-            date_to=date_to,
-            days=days,
-            bucket=bucket,
-        )
-    except DiagnosticsPayloadError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightTrendsResponse.model_validate(payload)
+@map_service_errors(_PAYLOAD_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_trends(
+    request: Request,
+    filters: Annotated[PreflightTrendsQuery, Query()],
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await _cached_analytics(
+        get_preflight_trends,
+        **filters.model_dump(),
+    )
+    return conditional_json(request, payload, PreflightTrendsResponse)
 
 
 @router.get("/diagnostics/preflight/rules/top", response_model=PreflightTopRulesResponse)
-def diagnostics_preflight_rules_top(
-    source_name: Literal["train", "store"] | None = Query(default=None),
-    data_source_id: int | None = Query(default=None, gt=0),
-    mode: Literal["off", "report_only", "enforce"] | None = Query(default=None),
-    final_status: Literal["PASS", "WARN", "FAIL"] | None = Query(default=None),
-    date_from: str | None = Query(default=None),
-    date_to: str | None = Query(default=None),
-    days: int | None = Query(default=None, ge=1, le=3650),
-    limit: int = Query(default=10, ge=1, le=100),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightTopRulesResponse:
-    try:
-        payload = get_preflight_top_rules(
-            source_name=source_name,
-            data_source_id=data_source_id,
-            mode=mode,
-            final_status=final_status,
-            date_from=date_from,
-            date_to=date_to,
-            days=days,
-            limit=limit,
-        )
-    except DiagnosticsPayloadError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightTopRulesResponse.model_validate(payload)
+@map_service_errors(_PAYLOAD_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_rules_top(
+    request: Request,
+    filters: Annotated[PreflightTopRulesQuery, Query()],
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await _cached_analytics(
+        get_preflight_top_rules,
+        **filters.model_dump(),
+    )
+    return conditional_json(request, payload, PreflightTopRulesResponse)
 
 
 @router.get("/diagnostics/preflight/alerts/active", response_model=PreflightActiveAlertsResponse)
-def diagnostics_preflight_alerts_active(
+@map_service_errors(_ALERT_READ_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_active(
     auto_evaluate: bool = Query(default=False),
-    principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightActiveAlertsResponse:
-    try:
-        payload = get_active_alerts(auto_evaluate=auto_evaluate, evaluation_actor=principal.actor)
-    except (DiagnosticsPayloadError, DiagnosticsNotFoundError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightActiveAlertsResponse.model_validate(payload)
+    principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await run_in_threadpool(
+        get_active_alerts,
+        auto_evaluate=auto_evaluate,
+        evaluation_actor=principal.actor,
+    )
+    return json_response(payload, PreflightActiveAlertsResponse)
 
 
 @router.get("/diagnostics/preflight/alerts/history", response_model=PreflightAlertHistoryResponse)
-def diagnostics_preflight_alerts_history(
+@map_service_errors(_ALERT_READ_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_history(
     limit: int = Query(default=50, ge=1, le=500),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightAlertHistoryResponse:
-    try:
-        payload = get_alert_history(limit=limit)
-    except (DiagnosticsPayloadError, DiagnosticsNotFoundError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightAlertHistoryResponse.model_validate(payload)
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    return json_response(await run_in_threadpool(get_alert_history, limit=limit), PreflightAlertHistoryResponse)
 
 
 @router.get("/diagnostics/preflight/alerts/policies", response_model=PreflightAlertPoliciesResponse)
-def diagnostics_preflight_alerts_policies(
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+@map_service_errors(_ALERT_READ_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_policies(
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> PreflightAlertPoliciesResponse:
-    try:
-        payload = list_alert_policies()
-    except (DiagnosticsPayloadError, DiagnosticsNotFoundError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightAlertPoliciesResponse.model_validate(payload)
+    return await run_in_threadpool(list_alert_policies)
 
 
 @router.get("/diagnostics/preflight/alerts/silences", response_model=PreflightSilencesResponse)
-def diagnostics_preflight_alerts_silences(
+@map_service_errors(_ALERT_READ_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_silences(
     limit: int = Query(default=100, ge=1, le=1000),
     include_expired: bool = Query(default=False),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightSilencesResponse:
-    try:
-        payload = list_silences(limit=limit, include_expired=include_expired)
-    except (DiagnosticsPayloadError, DiagnosticsNotFoundError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightSilencesResponse.model_validate(payload)
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await run_in_threadpool(list_silences, limit=limit, include_expired=include_expired)
+    return json_response(payload, PreflightSilencesResponse)
 
 
 @router.post("/diagnostics/preflight/alerts/silences", response_model=PreflightAlertSilenceResponse)
-def diagnostics_preflight_alerts_create_silence(
+@map_service_errors(_ALERT_INPUT_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_create_silence(
     payload: PreflightCreateSilenceRequest,
-    principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:operate")),
+    principal: DiagnosticsPrincipal = _DEP_OPERATE,
 ) -> PreflightAlertSilenceResponse:
-    try:
-        response_payload = create_silence(
-            actor=principal.actor,
-            starts_at=payload.starts_at,
-            ends_at=payload.ends_at,
-            reason=payload.reason,
-            policy_id=payload.policy_id,
-            source_name=payload.source_name,
-            severity=payload.severity,
-            rule_id=payload.rule_id,
-        )
-    except (DiagnosticsPayloadError, DiagnosticsNotFoundError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightAlertSilenceResponse.model_validate(response_payload)
+    response_payload = await run_in_threadpool(
+        create_silence,
+        actor=principal.actor,
+        starts_at=payload.starts_at,
+        ends_at=payload.ends_at,
+        reason=payload.reason,
+        policy_id=payload.policy_id,
+        source_name=payload.source_name,
+        severity=payload.severity,
+        rule_id=payload.rule_id,
+    )
+    return response_payload
 
 
 @router.post("/diagnostics/preflight/alerts/silences/{silence_id}/expire", response_model=PreflightAlertSilenceResponse)
-def diagnostics_preflight_alerts_expire_silence(
+@map_service_errors(_ALERT_MUTATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_expire_silence(
     silence_id: str,
-    principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:operate")),
+    principal: DiagnosticsPrincipal = _DEP_OPERATE,
 ) -> PreflightAlertSilenceResponse:
-    try:
-        response_payload = expire_silence_by_id(silence_id=silence_id, actor=principal.actor)
-    except DiagnosticsNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightAlertSilenceResponse.model_validate(response_payload)
+    return await run_in_threadpool(expire_silence_by_id, silence_id=silence_id, actor=principal.actor)
 
 
 @router.post("/diagnostics/preflight/alerts/{alert_id}/ack", response_model=PreflightAlertAcknowledgementResponse)
-def diagnostics_preflight_alerts_ack(
+@map_service_errors(_ALERT_MUTATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_ack(
     alert_id: str,
     payload: PreflightAcknowledgeAlertRequest,
-    principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:operate")),
+    principal: DiagnosticsPrincipal = _DEP_OPERATE,
 ) -> PreflightAlertAcknowledgementResponse:
-    try:
-        response_payload = acknowledge_alert(alert_id=alert_id, actor=principal.actor, note=payload.note)
-    except DiagnosticsNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightAlertAcknowledgementResponse.model_validate(response_payload)
+    response_payload = await run_in_threadpool(
+        acknowledge_alert,
+        alert_id=alert_id,
+        actor=principal.actor,
+        note=payload.note,
+    )
+    return response_payload
 
 
 @router.post("/diagnostics/preflight/alerts/{alert_id}/unack", response_model=PreflightAlertAcknowledgementResponse)
-def diagnostics_preflight_alerts_unack(
+@map_service_errors(_ALERT_MUTATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_unack(
     alert_id: str,
-    principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:operate")),
+    principal: DiagnosticsPrincipal = _DEP_OPERATE,
 ) -> PreflightAlertAcknowledgementResponse:
-    try:
-        response_payload = unacknowledge_alert(alert_id=alert_id, actor=principal.actor)
-    except DiagnosticsNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightAlertAcknowledgementResponse.model_validate(response_payload)
+    return await run_in_threadpool(unacknowledge_alert, alert_id=alert_id, actor=principal.actor)
 
 
 @router.get("/diagnostics/preflight/alerts/audit", response_model=PreflightAlertAuditResponse)
-def diagnostics_preflight_alerts_audit(
+@map_service_errors(_ALERT_INPUT_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_audit(
     limit: int = Query(default=50, ge=1, le=500),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightAlertAuditResponse:
-    try:
-        payload = list_alert_audit(limit=limit)
-    except (DiagnosticsPayloadError, DiagnosticsNotFoundError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightAlertAuditResponse.model_validate(payload)
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    return json_response(await run_in_threadpool(list_alert_audit, limit=limit), PreflightAlertAuditResponse)
 
 
 @router.post("/diagnostics/preflight/alerts/evaluate", response_model=PreflightAlertEvaluationResponse)
-def diagnostics_preflight_alerts_evaluate(
-    principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:admin")),
+@map_service_errors(_ALERT_READ_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_alerts_evaluate(
+    principal: DiagnosticsPrincipal = _DEP_ADMIN,
 ) -> PreflightAlertEvaluationResponse:
-    if str(os.getenv("PREFLIGHT_ALERTS_ALLOW_EVALUATE", "0")).strip().lower() not in {"1", "true", "yes"}:
+    if not _flag_enabled(os.getenv("PREFLIGHT_ALERTS_ALLOW_EVALUATE", "0")):
         raise HTTPException(
             status_code=403,
             detail="Manual alert evaluation is disabled. Set PREFLIGHT_ALERTS_ALLOW_EVALUATE=1 for local demo usage.",
         )
-    try:
-        payload = run_alert_evaluation(audit_actor=principal.actor)
-    except (DiagnosticsPayloadError, DiagnosticsNotFoundError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightAlertEvaluationResponse.model_validate(payload)
+    return await run_in_threadpool(run_alert_evaluation, audit_actor=principal.actor)
 
 
 @router.get("/diagnostics/preflight/notifications/outbox", response_model=PreflightNotificationOutboxResponse)
-def diagnostics_preflight_notifications_outbox(
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_outbox(
+    request: Request,
     limit: int = Query(default=50, ge=1, le=1000),
     status: str | None = Query(default=None),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightNotificationOutboxResponse:
-    try:
-        payload = get_notification_outbox(limit=limit, status=status)
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightNotificationOutboxResponse.model_validate(payload)
+    cursor: str | None = Query(default=None),
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    if _wants_ndjson(request):
+        rows = await run_in_threadpool(
+            stream_notification_outbox, limit=limit, status=status, cursor=cursor
+        )
+        return _ndjson_response(rows)
+    payload = await run_in_threadpool(get_notification_outbox, limit=limit, status=status, cursor=cursor)
+    return json_response(payload, PreflightNotificationOutboxResponse)
 
 
 @router.get("/diagnostics/preflight/notifications/history", response_model=PreflightNotificationOutboxResponse)
-def diagnostics_preflight_notifications_history(
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_history(
+    request: Request,
     limit: int = Query(default=50, ge=1, le=1000),
     status: str | None = Query(default=None),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightNotificationOutboxResponse:
-    try:
-        payload = get_notification_history(limit=limit, status=status)
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightNotificationOutboxResponse.model_validate(payload)
+    cursor: str | None = Query(default=None),
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    if _wants_ndjson(request):
+        rows = await run_in_threadpool(
+            stream_notification_outbox, limit=limit, status=status, cursor=cursor, history=True
+        )
+        return _ndjson_response(rows)
+    payload = await run_in_threadpool(get_notification_history, limit=limit, status=status, cursor=cursor)
+    return json_response(payload, PreflightNotificationOutboxResponse)
 
 
 @router.get("/diagnostics/preflight/notifications/stats", response_model=PreflightNotificationStatsResponse)
-def diagnostics_preflight_notifications_stats(
-    days: int | None = Query(default=None, ge=1, le=3650),
-    event_type: str | None = Query(default=None),
-    channel_target: str | None = Query(default=None),
-    status: str | None = Query(default=None),
-    date_from: str | None = Query(default=None),
-    date_to: str | None = Query(default=None),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightNotificationStatsResponse:
-    try:
-        payload = get_notification_stats(
-            days=days,
-            event_type=event_type,
-            channel_target=channel_target,
-            status=status,
-            date_from=date_from,
-            date_to=date_to,
-        )
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightNotificationStatsResponse.model_validate(payload)
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_stats(
+    request: Request,
+    filters: Annotated[PreflightNotificationAnalyticsQuery, Query()],
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await _cached_analytics(
+        get_notification_stats,
+        **filters.model_dump(),
+    )
+    return conditional_json(request, payload, PreflightNotificationStatsResponse)
 
 
 @router.get("/diagnostics/preflight/notifications/trends", response_model=PreflightNotificationTrendsResponse)
-def diagnostics_preflight_notifications_trends(
-    days: int | None = Query(default=None, ge=1, le=3650),
-    event_type: str | None = Query(default=None),
-    channel_target: str | None = Query(default=None),
-    status: str | None = Query(default=None),
-    date_from: str | None = Query(default=None),
-    date_to: str | None = Query(default=None),
-    bucket: Literal["day", "hour"] = Query(default="day"),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightNotificationTrendsResponse:
-    try:
-        payload = get_notification_trends(
-            days=days,
-            event_type=event_type,
-            channel_target=channel_target,
-            status=status,
-            date_from=date_from,
-            date_to=date_to,
-            bucket=bucket,
-        )
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightNotificationTrendsResponse.model_validate(payload)
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_trends(
+    request: Request,
+    filters: Annotated[PreflightNotificationTrendsQuery, Query()],
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await _cached_analytics(
+        get_notification_trends,
+        **filters.model_dump(),
+    )
+    return conditional_json(request, payload, PreflightNotificationTrendsResponse)
 
 
 @router.get("/diagnostics/preflight/notifications/channels", response_model=PreflightNotificationChannelsResponse)
-def diagnostics_preflight_notifications_channels(
-    days: int | None = Query(default=None, ge=1, le=3650),
-    event_type: str | None = Query(default=None),
-    channel_target: str | None = Query(default=None),
-    status: str | None = Query(default=None),
-    date_from: str | None = Query(default=None),
-    date_to: str | None = Query(default=None),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightNotificationChannelsResponse:
-    try:
-        payload = get_notification_channels(
-            days=days,
-            event_type=event_type,
-            channel_target=channel_target,
-            status=status,
-            date_from=date_from,
-            date_to=date_to,
-        )
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightNotificationChannelsResponse.model_validate(payload)
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_channels(
+    request: Request,
+    filters: Annotated[PreflightNotificationAnalyticsQuery, Query()],
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await _cached_analytics(
+        get_notification_channels,
+        **filters.model_dump(),
+    )
+    return conditional_json(request, payload, PreflightNotificationChannelsResponse)
+
+
+@router.get("/diagnostics/preflight/notifications/overview", response_model=PreflightNotificationOverviewResponse)
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_overview(
+    request: Request,
+    filters: Annotated[PreflightNotificationTrendsQuery, Query()],
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await _cached_analytics(
+        get_notification_overview,
+        **filters.model_dump(),
+    )
+    return conditional_json(request, payload, PreflightNotificationOverviewResponse)
 
 
 @router.get(
     "/diagnostics/preflight/notifications/endpoints",
     response_model=NotificationEndpointsResponse,
 )
-def diagnostics_preflight_notifications_endpoints(
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+@map_service_errors(_NOTIFICATION_CONFIG_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_endpoints(
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> NotificationEndpointsResponse:
-    try:
-        payload = get_notification_endpoints()
-    except (DiagnosticsPayloadError, ValueError, FileNotFoundError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return NotificationEndpointsResponse.model_validate(payload)
+    return await run_in_threadpool(get_notification_endpoints)
 
 
 @router.get(
     "/diagnostics/preflight/notifications/deliveries",
     response_model=NotificationDeliveryPageResponse,
 )
-def diagnostics_preflight_notifications_deliveries(
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_deliveries(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=25, ge=1, le=200),
     status: str | None = Query(default=None),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> NotificationDeliveryPageResponse:
-    try:
-        payload = get_notification_deliveries(page=page, page_size=page_size, status=status)
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return NotificationDeliveryPageResponse.model_validate(payload)
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    payload = await run_in_threadpool(get_notification_deliveries, page=page, page_size=page_size, status=status)
+    return json_response(payload, NotificationDeliveryPageResponse)
 
 
 @router.get("/diagnostics/preflight/notifications/attempts", response_model=PreflightNotificationAttemptsResponse)
-def diagnostics_preflight_notifications_attempts(
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_attempts(
+    request: Request,
     limit: int = Query(default=100, ge=1, le=1000),
     days: int | None = Query(default=None, ge=1, le=3650),
     event_type: str | None = Query(default=None),
@@ -614,208 +652,146 @@ def diagnostics_preflight_notifications_attempts(
     alert_id: str | None = Query(default=None),
     date_from: str | None = Query(default=None),
     date_to: str | None = Query(default=None),
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
-) -> PreflightNotificationAttemptsResponse:
-    try:
-        payload = get_notification_attempts(
-            limit=limit,
-            days=days,
-            event_type=event_type,
-            channel_target=channel_target,
-            attempt_status=attempt_status,
-            alert_id=alert_id,
-            date_from=date_from,
-            date_to=date_to,
-        )
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightNotificationAttemptsResponse.model_validate(payload)
+    cursor: str | None = Query(default=None),
+    _principal: DiagnosticsPrincipal = _DEP_READ,
+) -> Response:
+    filters = {
+        "limit": limit,
+        "days": days,
+        "event_type": event_type,
+        "channel_target": channel_target,
+        "attempt_status": attempt_status,
+        "alert_id": alert_id,
+        "date_from": date_from,
+        "date_to": date_to,
+        "cursor": cursor,
+    }
+    if _wants_ndjson(request):
+        return _ndjson_response(await run_in_threadpool(stream_notification_attempts, **filters))
+    payload = await run_in_threadpool(get_notification_attempts, **filters)
+    return json_response(payload, PreflightNotificationAttemptsResponse)
 
 
 @router.get(
     "/diagnostics/preflight/notifications/attempts/{attempt_id}",
     response_model=PreflightNotificationAttemptItemResponse,
 )
-def diagnostics_preflight_notifications_attempt_detail(
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_attempt_detail(
     attempt_id: str,
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> PreflightNotificationAttemptItemResponse:
-    try:
-        payload = get_notification_attempt_details(attempt_id)
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
+    payload = await run_in_threadpool(get_notification_attempt_details, attempt_id)
 
     if payload is None:
         raise HTTPException(status_code=404, detail=f"Notification attempt not found: {attempt_id}")
-    return PreflightNotificationAttemptItemResponse.model_validate(payload)
+    return payload
 
 
 @router.post("/diagnostics/preflight/notifications/dispatch", response_model=PreflightNotificationDispatchResponse)
-def diagnostics_preflight_notifications_dispatch(
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_dispatch(
     limit: int = Query(default=50, ge=1, le=1000),
-    principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:admin")),
+    principal: DiagnosticsPrincipal = _DEP_ADMIN,
 ) -> PreflightNotificationDispatchResponse:
-    try:
-        payload = run_notification_dispatch(limit=limit, actor=principal.actor)
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightNotificationDispatchResponse.model_validate(payload)
+    return await run_in_threadpool(run_notification_dispatch, limit=limit, actor=principal.actor)
 
 
 @router.post(
     "/diagnostics/preflight/notifications/outbox/{item_id}/replay",
     response_model=PreflightNotificationReplayResponse,
 )
-def diagnostics_preflight_notifications_replay_item(
+@map_service_errors(_REPLAY_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_replay_item(
     item_id: str,
-    principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:admin")),
+    principal: DiagnosticsPrincipal = _DEP_ADMIN,
 ) -> PreflightNotificationReplayResponse:
-    try:
-        payload = replay_notification_outbox_item(item_id=item_id, actor=principal.actor)
-    except LookupError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightNotificationReplayResponse.model_validate(payload)
+    return await run_in_threadpool(replay_notification_outbox_item, item_id=item_id, actor=principal.actor)
 
 
 @router.post(
     "/diagnostics/preflight/notifications/outbox/replay-dead",
     response_model=PreflightNotificationReplayResponse,
 )
-def diagnostics_preflight_notifications_replay_dead(
+@map_service_errors(_NOTIFICATION_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_notifications_replay_dead(
     limit: int = Query(default=50, ge=1, le=1000),
-    principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:admin")),
+    principal: DiagnosticsPrincipal = _DEP_ADMIN,
 ) -> PreflightNotificationReplayResponse:
-    try:
-        payload = replay_dead_notification_outbox(limit=limit, actor=principal.actor)
-    except (DiagnosticsPayloadError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightNotificationReplayResponse.model_validate(payload)
+    return await run_in_threadpool(replay_dead_notification_outbox, limit=limit, actor=principal.actor)
 
 
 @router.get(
     "/diagnostics/preflight/runs/{run_id}/sources/{source_name}/artifacts",
     response_model=PreflightSourceArtifactsResponse,
 )
-def diagnostics_preflight_source_artifacts(
+@map_service_errors(_ARTIFACT_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_source_artifacts(
     run_id: str,
-    source_name: Literal["train", "store"],
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+    source_name: _SourceName,
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> PreflightSourceArtifactsResponse:
-    try:
-        payload = get_preflight_source_artifacts(run_id=run_id, source_name=source_name)
-    except DiagnosticsNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except DiagnosticsAccessError as exc:
-        raise HTTPException(status_code=403, detail=str(exc)) from exc
-    except DiagnosticsPayloadError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightSourceArtifactsResponse.model_validate(payload)
+    return await _source_artifact("artifacts", run_id=run_id, source_name=source_name)
 
 
 @router.get(
     "/diagnostics/preflight/runs/{run_id}/sources/{source_name}/validation",
     response_model=PreflightValidationArtifactResponse,
 )
-def diagnostics_preflight_source_validation(
+@map_service_errors(_ARTIFACT_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_source_validation(
     run_id: str,
-    source_name: Literal["train", "store"],
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+    source_name: _SourceName,
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> PreflightValidationArtifactResponse:
-    try:
-        payload = get_preflight_source_validation(run_id=run_id, source_name=source_name)
-    except DiagnosticsNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except DiagnosticsAccessError as exc:
-        raise HTTPException(status_code=403, detail=str(exc)) from exc
-    except DiagnosticsPayloadError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightValidationArtifactResponse.model_validate(payload)
+    return await _source_artifact("validation", run_id=run_id, source_name=source_name)
 
 
 @router.get(
     "/diagnostics/preflight/runs/{run_id}/sources/{source_name}/semantic",
     response_model=PreflightSemanticArtifactResponse,
 )
-def diagnostics_preflight_source_semantic(
+@map_service_errors(_ARTIFACT_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_source_semantic(
     run_id: str,
-    source_name: Literal["train", "store"],
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+    source_name: _SourceName,
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> PreflightSemanticArtifactResponse:
-    try:
-        payload = get_preflight_source_semantic(run_id=run_id, source_name=source_name)
-    except DiagnosticsNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except DiagnosticsAccessError as exc:
-        raise HTTPException(status_code=403, detail=str(exc)) from exc
-    except DiagnosticsPayloadError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightSemanticArtifactResponse.model_validate(payload)
+    return await _source_artifact("semantic", run_id=run_id, source_name=source_name)
 
 
 @router.get(
     "/diagnostics/preflight/runs/{run_id}/sources/{source_name}/manifest",
     response_model=PreflightManifestArtifactResponse,
 )
-def diagnostics_preflight_source_manifest(
+@map_service_errors(_ARTIFACT_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_source_manifest(
     run_id: str,
-    source_name: Literal["train", "store"],
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+    source_name: _SourceName,
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> PreflightManifestArtifactResponse:
-    try:
-        payload = get_preflight_source_manifest(run_id=run_id, source_name=source_name)
-    except DiagnosticsNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except DiagnosticsAccessError as exc:
-        raise HTTPException(status_code=403, detail=str(exc)) from exc
-    except DiagnosticsPayloadError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-    return PreflightManifestArtifactResponse.model_validate(payload)
+    return await _source_artifact("manifest", run_id=run_id, source_name=source_name)
 
 
 @router.get("/diagnostics/preflight/runs/{run_id}/sources/{source_name}/download/{artifact_type}")
-def diagnostics_preflight_source_download(
+@map_service_errors(_ARTIFACT_ERRORS, fallback_detail=_FALLBACK_DETAIL)
+async def diagnostics_preflight_source_download(
     run_id: str,
-    source_name: Literal["train", "store"],
+    source_name: _SourceName,
     artifact_type: PreflightArtifactType,
-    _principal: DiagnosticsPrincipal = Depends(require_scope("diagnostics:read")),
+    _principal: DiagnosticsPrincipal = _DEP_READ,
 ) -> FileResponse:
-    try:
-        payload = get_preflight_source_artifact_download(
-            run_id=run_id,
-            source_name=source_name,
-            artifact_type=artifact_type,
-        )
-    except DiagnosticsNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except DiagnosticsAccessError as exc:
-        raise HTTPException(status_code=403, detail=str(exc)) from exc
-    except DiagnosticsPayloadError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Diagnostics error: {exc}") from exc
-
-    return FileResponse(
+    payload, stat_result = await run_in_threadpool(
+        _artifact_download,
+        run_id=run_id,
+        source_name=source_name,
+        artifact_type=artifact_type,
+    )
+
+    return _ArtifactFileResponse(
         path=payload["path"],
         media_type=payload["content_type"],
         filename=payload["file_name"],
+        stat_result=stat_result,
+        headers=_ARTIFACT_DOWNLOAD_HEADERS,
     )
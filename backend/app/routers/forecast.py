@@ -1,9 +1,8 @@
-﻿import logging
-
-from fastapi import APIRouter, HTTPException
-
-logger = logging.getLogger("app.routers.forecast")
+﻿from fastapi import APIRouter, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 
+from app.errors import map_service_errors
 from app.schemas import (
     ForecastBatchRequest,
     ForecastBatchResponse,
@@ -16,49 +15,41 @@ from app.services.forecast_service import forecast_batch_for_stores, forecast_fo
 
 router = APIRouter()
 
+_FORECAST_POINTS_ADAPTER = TypeAdapter(list[ForecastPoint])
+
+# A missing model artifact is a server-side problem, not a bad request.
+_FORECAST_ERRORS = ((ValueError, 400), (FileNotFoundError, 500))
+
 
 @router.post("/forecast", response_model=list[ForecastPoint])
-def forecast_sales(payload: ForecastRequest) -> list[ForecastPoint]:
-    try:
-        kwargs = {
-            "store_id": payload.store_id,
-            "horizon_days": payload.horizon_days,
-        }
-        if payload.data_source_id is not None:
-            kwargs["data_source_id"] = payload.data_source_id
-        return forecast_for_store(**kwargs)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        logger.exception("Unexpected error in /forecast: %s", exc)
-        raise HTTPException(status_code=500, detail="An unexpected error occurred while generating the forecast.") from exc
+@map_service_errors(_FORECAST_ERRORS, fallback_detail="An unexpected error occurred while generating the forecast.")
+async def forecast_sales(payload: ForecastRequest) -> Response:
+    kwargs = {
+        "store_id": payload.store_id,
+        "horizon_days": payload.horizon_days,
+    }
+    if payload.data_source_id is not None:
+        kwargs["data_source_id"] = payload.data_source_id
+    points = await run_in_threadpool(forecast_for_store, **kwargs)
+    body = _FORECAST_POINTS_ADAPTER.dump_json(_FORECAST_POINTS_ADAPTER.validate_python(points))
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/forecast/scenario", response_model=ForecastScenarioResponse)
-def forecast_sales_scenario(payload: ForecastScenarioRequest) -> ForecastScenarioResponse:
-    try:
-        kwargs = {
-            "store_id": payload.store_id,
-            "horizon_days": payload.horizon_days,
-            "promo_mode": payload.promo_mode,
-            "weekend_open": payload.weekend_open,
-            "school_holiday": payload.school_holiday,
-            "demand_shift_pct": payload.demand_shift_pct,
-            "confidence_level": payload.confidence_level,
-        }
-        if payload.data_source_id is not None:
-            kwargs["data_source_id"] = payload.data_source_id
-        result = forecast_scenario_for_store(**kwargs)
-        return ForecastScenarioResponse.model_validate(result)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        logger.exception("Unexpected error in /forecast/scenario: %s", exc)
-        raise HTTPException(status_code=500, detail="An unexpected error occurred while generating the scenario forecast.") from exc
+@map_service_errors(_FORECAST_ERRORS, fallback_detail="An unexpected error occurred while generating the scenario forecast.")
+async def forecast_sales_scenario(payload: ForecastScenarioRequest) -> ForecastScenarioResponse:
+    kwargs = {
+        "store_id": payload.store_id,
+        "horizon_days": payload.horizon_days,
+        "promo_mode": payload.promo_mode,
+        "weekend_open": payload.weekend_open,
+        "school_holiday": payload.school_holiday,
+        "demand_shift_pct": payload.demand_shift_pct,
+        "confidence_level": payload.confidence_level,
+    }
+    if payload.data_source_id is not None:
+        kwargs["data_source_id"] = payload.data_source_id
+    return await run_in_threadpool(forecast_scenario_for_store, **kwargs)
 
 
 @router.post(
@@ -66,20 +57,17 @@ def forecast_sales_scenario(payload: ForecastScenarioRequest) -> ForecastScenari
     response_model=ForecastBatchResponse,
     response_model_exclude_none=True,
 )
-def forecast_sales_batch(payload: ForecastBatchRequest) -> ForecastBatchResponse:
-    try:
-        kwargs = {
-            "store_ids": payload.store_ids,
-            "horizon_days": payload.horizon_days,
-        }
-        if payload.data_source_id is not None:
-            kwargs["data_source_id"] = payload.data_source_id
-        result = forecast_batch_for_stores(**kwargs)
-        return ForecastBatchResponse.model_validate(result)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        logger.exception("Unexpected error in /forecast/batch: %s", exc)
-        raise HTTPException(status_code=500, detail="An unexpected error occurred while generating the batch forecast.") from exc
+@map_service_errors(
+    _FORECAST_ERRORS,
+    fallback_detail="An unexpected error occurred while generating the batch forecast.",
+)
+async def forecast_sales_batch(payload: ForecastBatchRequest) -> Response:
+    kwargs = {
+        "store_ids": payload.store_ids,
+        "horizon_days": payload.horizon_days,
+    }
+    if payload.data_source_id is not None:
+        kwargs["data_source_id"] = payload.data_source_id
+    result = await run_in_threadpool(forecast_batch_for_stores, **kwargs)
+    body = ForecastBatchResponse.model_validate(result).model_dump_json(exclude_none=True)
+    return Response(content=body, media_type="application/json")
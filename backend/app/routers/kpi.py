@@ -1,25 +1,48 @@
 ﻿from datetime import date
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 
+from app.cache import async_ttl_cache
 from app.schemas import KpiSummaryResponse, PromoImpactPoint
 from app.services.kpi_service import get_kpi_summary, get_promo_impact
 
 router = APIRouter()
 
+_PROMO_IMPACT_ADAPTER = TypeAdapter(list[PromoImpactPoint])
+
+# Dashboards poll the same ranges; serialized bodies are reused across requests.
+_KPI_CACHE_TTL_SECONDS = 60.0
+
+_DATE_RANGE_DETAIL = "date_from cannot be greater than date_to"
+
+
+@async_ttl_cache(_KPI_CACHE_TTL_SECONDS)
+async def _kpi_summary_body(date_from: date, date_to: date, store_id: int | None) -> bytes:
+    summary = await run_in_threadpool(get_kpi_summary, date_from=date_from, date_to=date_to, store_id=store_id)
+    return KpiSummaryResponse.model_validate(summary).model_dump_json().encode("utf-8")
+
+
+@async_ttl_cache(_KPI_CACHE_TTL_SECONDS)
+async def _promo_impact_body(store_id: int | None) -> bytes:
+    points = await run_in_threadpool(get_promo_impact, store_id=store_id)
+    return _PROMO_IMPACT_ADAPTER.dump_json(_PROMO_IMPACT_ADAPTER.validate_python(points))
+
 
 @router.get("/kpi/summary", response_model=KpiSummaryResponse)
-def kpi_summary(
+async def kpi_summary(
     date_from: date = Query(...),
     date_to: date = Query(...),
     store_id: int | None = Query(default=None),
-) -> KpiSummaryResponse:
+) -> Response:
     if date_from > date_to:
-        raise HTTPException(status_code=400, detail="date_from cannot be greater than date_to")
+        raise HTTPException(status_code=400, detail=_DATE_RANGE_DETAIL)
 
-    return get_kpi_summary(date_from=date_from, date_to=date_to, store_id=store_id)
+    body = await _kpi_summary_body(date_from, date_to, store_id)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/kpi/promo-impact", response_model=list[PromoImpactPoint])
-def kpi_promo_impact(store_id: int | None = Query(default=None)) -> list[PromoImpactPoint]:
-    return get_promo_impact(store_id=store_id)
+async def kpi_promo_impact(store_id: int | None = Query(default=None)) -> Response:
+    return Response(content=await _promo_impact_body(store_id), media_type="application/json")
@@ -8,8 +8,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 
+from app.errors import map_service_errors
 from app.schemas import MLExperimentListItemResponse, MLExperimentsResponse
 from app.services.ml_experiment_service import get_ml_experiment, list_ml_experiments
 
@@ -19,9 +21,13 @@ _PROJECT_ROOT = Path(__file__).resolve().parents[3]
 _ML_CONFIG    = _PROJECT_ROOT / "ml" / "config.yaml"
 _PYTHON       = sys.executable          # same Python that runs the backend
 
+_EXPERIMENT_ERRORS = ((ValueError, 400),)
+_EXPERIMENT_FALLBACK_DETAIL = "ML experiment error"
+
 
 @router.post("/ml/retrain")
-def trigger_retrain() -> dict[str, Any]:
+@map_service_errors((), fallback_detail="Failed to start training")
+async def trigger_retrain() -> dict[str, Any]:
     """Launch ml/train.py in a background subprocess. Returns immediately."""
     if not _ML_CONFIG.exists():
         raise HTTPException(status_code=500, detail="ml/config.yaml not found")
@@ -31,29 +37,27 @@ def trigger_retrain() -> dict[str, Any]:
     env = os.environ.copy()
     env["PYTHONPATH"] = str(_PROJECT_ROOT)
 
-    try:
-        proc = subprocess.Popen(
-            [_PYTHON, str(_PROJECT_ROOT / "ml" / "train.py"), "--config", str(_ML_CONFIG)],
-            cwd=str(_PROJECT_ROOT),
-            env=env,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,
-        )
-        return {
-            "status": "started",
-            "pid": proc.pid,
-            "experiment_hint": experiment_id,
-            "message": "Training started in background. Check /ml/experiments for progress.",
-        }
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Failed to start training: {exc}") from exc
+    proc = await run_in_threadpool(
+        subprocess.Popen,
+        [_PYTHON, str(_PROJECT_ROOT / "ml" / "train.py"), "--config", str(_ML_CONFIG)],
+        cwd=str(_PROJECT_ROOT),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    return {
+        "status": "started",
+        "pid": proc.pid,
+        "experiment_hint": experiment_id,
+        "message": "Training started in background. Check /ml/experiments for progress.",
+    }
 
 
 @router.get("/ml/drift")
-def get_model_drift() -> dict[str, Any]:
+async def get_model_drift() -> dict[str, Any]:
     """Compare the two most recent COMPLETED experiments to detect metric drift."""
-    rows = list_ml_experiments(limit=10)
+    rows = await run_in_threadpool(list_ml_experiments, limit=10)
     completed = [r for r in rows if str(r.get("status", "")).upper() == "COMPLETED"]
     if len(completed) < 2:
         return {"status": "insufficient_data", "message": "Need at least 2 completed experiments to compare.", "drift": []}
@@ -104,33 +108,22 @@ def get_model_drift() -> dict[str, Any]:
 
 
 @router.get("/ml/experiments", response_model=MLExperimentsResponse)
-def get_experiments(
+@map_service_errors(_EXPERIMENT_ERRORS, fallback_detail=_EXPERIMENT_FALLBACK_DETAIL)
+async def get_experiments(
     limit: int = Query(default=100, ge=1, le=500),
     data_source_id: int | None = Query(default=None, gt=0),
-) -> MLExperimentsResponse:
-    try:
-        rows = list_ml_experiments(limit=limit, data_source_id=data_source_id)
-        return MLExperimentsResponse(
-            items=[MLExperimentListItemResponse.model_validate(item) for item in rows],
-            limit=limit,
-            data_source_id=data_source_id,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"ML experiment error: {exc}") from exc
+) -> Response:
+    rows = await run_in_threadpool(list_ml_experiments, limit=limit, data_source_id=data_source_id)
+    body = MLExperimentsResponse.model_validate(
+        {"items": rows, "limit": limit, "data_source_id": data_source_id}
+    ).model_dump_json()
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/ml/experiments/{experiment_id}", response_model=MLExperimentListItemResponse)
-def get_experiment(experiment_id: str) -> MLExperimentListItemResponse:
-    try:
-        payload = get_ml_experiment(experiment_id)
-        if payload is None:
-            raise HTTPException(status_code=404, detail=f"Experiment not found: {experiment_id}")
-        return MLExperimentListItemResponse.model_validate(payload)
-    except HTTPException:
-        raise
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"ML experiment error: {exc}") from exc
+@map_service_errors(_EXPERIMENT_ERRORS, fallback_detail=_EXPERIMENT_FALLBACK_DETAIL)
+async def get_experiment(experiment_id: str) -> MLExperimentListItemResponse:
+    payload = await run_in_threadpool(get_ml_experiment, experiment_id)
+    if payload is None:
+        raise HTTPException(status_code=404, detail=f"Experiment not found: {experiment_id}")
+    return payload
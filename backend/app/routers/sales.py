@@ -1,27 +1,44 @@
 ﻿from datetime import date
 from typing import Literal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 
+from app.cache import async_ttl_cache
 from app.schemas import SalesTimeseriesPoint
 from app.services.sales_service import get_sales_timeseries
 
 router = APIRouter()
 
+_TIMESERIES_ADAPTER = TypeAdapter(list[SalesTimeseriesPoint])
+
+_TIMESERIES_CACHE_TTL_SECONDS = 60.0
+
+_DATE_RANGE_DETAIL = "date_from cannot be greater than date_to"
+
+
+@async_ttl_cache(_TIMESERIES_CACHE_TTL_SECONDS)
+async def _timeseries_body(granularity: str, date_from: date, date_to: date, store_id: int | None) -> bytes:
+    points = await run_in_threadpool(
+        get_sales_timeseries,
+        granularity=granularity,
+        date_from=date_from,
+        date_to=date_to,
+        store_id=store_id,
+    )
+    return _TIMESERIES_ADAPTER.dump_json(_TIMESERIES_ADAPTER.validate_python(points))
+
 
 @router.get("/sales/timeseries", response_model=list[SalesTimeseriesPoint])
-def sales_timeseries(
+async def sales_timeseries(
     granularity: Literal["daily", "monthly"] = Query(default="daily"),
     date_from: date = Query(...),
     date_to: date = Query(...),
     store_id: int | None = Query(default=None),
-) -> list[SalesTimeseriesPoint]:
+) -> Response:
     if date_from > date_to:
-        raise HTTPException(status_code=400, detail="date_from cannot be greater than date_to")
+        raise HTTPException(status_code=400, detail=_DATE_RANGE_DETAIL)
 
-    return get_sales_timeseries(
-        granularity=granularity,
-        date_from=date_from,
-        date_to=date_to,
-        store_id=store_id,
-    )
+    body = await _timeseries_body(granularity, date_from, date_to, store_id)
+    return Response(content=body, media_type="application/json")
@@ -2,27 +2,50 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
+from app.cache import async_ttl_cache
+from app.http_cache import body_etag, conditional_response
 from app.schemas import StoreComparisonResponse, StoreItem, StoreListResponse
 from app.services.sales_service import get_store_by_id, get_store_comparison, list_stores_paginated
 
 router = APIRouter()
 
+# The store dimension only changes when the ETL reloads it.
+_STORE_LIST_CACHE_TTL_SECONDS = 3600.0
+_STORE_LIST_CACHE_CONTROL = "private, max-age=30"
+
+
+@async_ttl_cache(_STORE_LIST_CACHE_TTL_SECONDS)
+async def _store_list_body(
+    page: int, page_size: int, store_type: str | None, assortment: str | None
+) -> tuple[str, bytes]:
+    result = await run_in_threadpool(
+        list_stores_paginated,
+        page=page,
+        page_size=page_size,
+        store_type=store_type,
+        assortment=assortment,
+    )
+    body = StoreListResponse.model_validate(result).model_dump_json().encode("utf-8")
+    return body_etag(body), body
+
 
 @router.get("/stores", response_model=StoreListResponse)
-def get_stores(
+async def get_stores(
+    request: Request,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=100, ge=1, le=500),
     store_type: str | None = Query(default=None),
     assortment: str | None = Query(default=None),
-) -> StoreListResponse:
-    result = list_stores_paginated(page=page, page_size=page_size, store_type=store_type, assortment=assortment)
-    return StoreListResponse.model_validate(result)
+) -> Response:
+    etag, body = await _store_list_body(page, page_size, store_type, assortment)
+    return conditional_response(request, body, cache_control=_STORE_LIST_CACHE_CONTROL, etag=etag)
 
 
 @router.get("/stores/comparison", response_model=StoreComparisonResponse)
-def get_store_comparison_endpoint(
+async def get_store_comparison_endpoint(
     store_ids: str = Query(..., description="Comma-separated store IDs (1–10)"),
     date_from: date = Query(...),
     date_to: date = Query(...),
@@ -34,13 +57,13 @@ def get_store_comparison_endpoint(
         raise HTTPException(status_code=400, detail="Maximum 10 stores allowed for comparison")
     if date_from > date_to:
         raise HTTPException(status_code=400, detail="date_from cannot exceed date_to")
-    stores = get_store_comparison(store_ids=ids, date_from=date_from, date_to=date_to)
+    stores = await run_in_threadpool(get_store_comparison, store_ids=ids, date_from=date_from, date_to=date_to)
     return StoreComparisonResponse(date_from=date_from, date_to=date_to, stores=stores)
 
 
 @router.get("/stores/{store_id}", response_model=StoreItem)
-def get_store(store_id: int) -> StoreItem:
-    item = get_store_by_id(store_id)
+async def get_store(store_id: int) -> StoreItem:
+    item = await run_in_threadpool(get_store_by_id, store_id)
     if item is None:
         raise HTTPException(status_code=404, detail=f"Store not found: {store_id}")
     return item
@@ -1,25 +1,35 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
+from app.cache import async_ttl_cache
+from app.errors import map_service_errors
+from app.http_cache import body_etag, conditional_response
 from app.schemas import ModelMetadataResponse, SystemSummaryResponse
 from app.services.system_service import get_model_metadata, get_system_summary
 
 router = APIRouter()
 
+# Metadata only changes on retrain; pollers revalidate with If-None-Match and get a 304.
+_MODEL_METADATA_CACHE_TTL_SECONDS = 60.0
+_MODEL_METADATA_CACHE_CONTROL = "private, max-age=30"
+
+
+@async_ttl_cache(_MODEL_METADATA_CACHE_TTL_SECONDS)
+async def _model_metadata_body() -> tuple[str, bytes]:
+    metadata = await run_in_threadpool(get_model_metadata)
+    body = ModelMetadataResponse.model_validate(metadata).model_dump_json().encode("utf-8")
+    return body_etag(body), body
+
 
 @router.get("/system/summary", response_model=SystemSummaryResponse)
-def system_summary() -> SystemSummaryResponse:
-    try:
-        return SystemSummaryResponse.model_validate(get_system_summary())
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"System summary error: {exc}") from exc
+@map_service_errors((), fallback_detail="System summary error")
+async def system_summary() -> SystemSummaryResponse:
+    return await run_in_threadpool(get_system_summary)
 
 
 @router.get("/model/metadata", response_model=ModelMetadataResponse)
-def model_metadata() -> ModelMetadataResponse:
-    try:
-        return ModelMetadataResponse.model_validate(get_model_metadata())
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail=f"Model metadata error: {exc}") from exc
+@map_service_errors(((FileNotFoundError, 404),), fallback_detail="Model metadata error")
+async def model_metadata(request: Request) -> Response:
+    etag, body = await _model_metadata_body()
+    return conditional_response(request, body, cache_control=_MODEL_METADATA_CACHE_CONTROL, etag=etag)
 
@@ -1,8 +1,16 @@
 ﻿from datetime import date, datetime
-from typing import Any
+from typing import Annotated, Any
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, WithJsonSchema
+from pydantic.dataclasses import dataclass
+
+# Free-form JSON blobs the server already produced: passed through unvalidated, but
+# still documented as objects in the OpenAPI schema.
+JsonObject = Annotated[Any, WithJsonSchema({"type": "object", "additionalProperties": True})]
+
+PromoMode = Literal["as_is", "always_on", "weekends_only", "off"]
+TrendBucket = Literal["day", "hour"]
 
 
 class HealthResponse(BaseModel):
@@ -93,7 +101,10 @@ class KpiSummaryResponse(BaseModel):
     open_days: int
 
 
-class SalesTimeseriesPoint(BaseModel):
+# Per-day points are built by the thousand per response: slotted, frozen pydantic
+# dataclasses validate and serialize like models without a per-instance __dict__.
+@dataclass(slots=True, frozen=True)
+class SalesTimeseriesPoint:
     date: date
     store_id: int
     sales: float
@@ -102,7 +113,8 @@ class SalesTimeseriesPoint(BaseModel):
     open: int | None = None
 
 
-class PromoImpactPoint(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PromoImpactPoint:
     store_id: int
     promo_flag: str
     avg_sales: float
@@ -122,7 +134,8 @@ class ForecastBatchRequest(BaseModel):
     data_source_id: int | None = Field(default=None, gt=0)
 
 
-class ForecastPoint(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ForecastPoint:
     date: date
     predicted_sales: float
     predicted_lower: float | None = None
@@ -132,7 +145,7 @@ class ForecastPoint(BaseModel):
 class ForecastScenarioRequest(BaseModel):
     store_id: int = Field(..., gt=0)
     horizon_days: int = Field(30, ge=1, le=180)
-    promo_mode: Literal["as_is", "always_on", "weekends_only", "off"] = "as_is"
+    promo_mode: PromoMode = "as_is"
     weekend_open: bool = True
     school_holiday: int = Field(0, ge=0, le=1)
     demand_shift_pct: float = Field(0.0, ge=-50.0, le=50.0)
@@ -140,7 +153,8 @@ class ForecastScenarioRequest(BaseModel):
     data_source_id: int | None = Field(default=None, gt=0)
 
 
-class ForecastScenarioPoint(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ForecastScenarioPoint:
     date: date
     baseline_sales: float
     scenario_sales: float
@@ -186,9 +200,9 @@ class ForecastBatchPortfolioSummary(BaseModel):
 
 class ForecastBatchResponse(BaseModel):
     request: ForecastBatchRequest
-    store_summaries: list[ForecastBatchStoreSummary]
+    store_summaries: tuple[ForecastBatchStoreSummary, ...]
     portfolio_summary: ForecastBatchPortfolioSummary
-    portfolio_series: list[ForecastPoint]
+    portfolio_series: tuple[ForecastPoint, ...]
 
 
 class SystemSummaryResponse(BaseModel):
@@ -338,7 +352,7 @@ class PreflightValidationArtifactResponse(BaseModel):
     errors: list[str] = Field(default_factory=list)
     warnings: list[str] = Field(default_factory=list)
     summary: str | None = None
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: JsonObject = Field(default_factory=dict)
     artifact_path: str | None = None
 
 
@@ -349,7 +363,7 @@ class PreflightSemanticRuleResponse(BaseModel):
     status: str
     message: str
     target: list[str] = Field(default_factory=list)
-    observed: dict[str, Any] = Field(default_factory=dict)
+    observed: JsonObject = Field(default_factory=dict)
 
 
 class PreflightSemanticArtifactResponse(BaseModel):
@@ -370,7 +384,7 @@ class PreflightManifestArtifactResponse(BaseModel):
     validation_status: str | None = None
     renamed_columns: dict[str, str] = Field(default_factory=dict)
     extra_columns_dropped: list[str] = Field(default_factory=list)
-    coercion_stats: dict[str, Any] = Field(default_factory=dict)
+    coercion_stats: JsonObject = Field(default_factory=dict)
     final_canonical_columns: list[str] = Field(default_factory=list)
     retained_extra_columns: list[str] = Field(default_factory=list)
     output_row_count: int | None = None
@@ -379,6 +393,24 @@ class PreflightManifestArtifactResponse(BaseModel):
     artifact_path: str | None = None
 
 
+class PreflightAnalyticsQuery(BaseModel):
+    source_name: Literal["train", "store"] | None = None
+    data_source_id: int | None = Field(default=None, gt=0)
+    mode: Literal["off", "report_only", "enforce"] | None = None
+    final_status: Literal["PASS", "WARN", "FAIL"] | None = None
+    date_from: str | None = None
+    date_to: str | None = None
+    days: int | None = Field(default=None, ge=1, le=3650)
+
+
+class PreflightTrendsQuery(PreflightAnalyticsQuery):
+    bucket: TrendBucket = "day"
+
+
+class PreflightTopRulesQuery(PreflightAnalyticsQuery):
+    limit: int = Field(default=10, ge=1, le=100)
+
+
 class PreflightAnalyticsFilters(BaseModel):
     source_name: str | None = None
     data_source_id: int | None = None
@@ -413,7 +445,7 @@ class PreflightTrendBucket(BaseModel):
 
 
 class PreflightTrendsResponse(BaseModel):
-    bucket: Literal["day", "hour"]
+    bucket: TrendBucket
     items: list[PreflightTrendBucket] = Field(default_factory=list)
     filters: PreflightAnalyticsFilters
 
@@ -485,7 +517,7 @@ class PreflightAlertItemResponse(BaseModel):
     threshold: float | None = None
     message: str
     evaluated_at: datetime | None = None
-    evaluation_context_json: dict[str, Any] = Field(default_factory=dict)
+    evaluation_context_json: JsonObject = Field(default_factory=dict)
     policy: PreflightAlertPolicyResponse | None = None
     is_silenced: bool = False
     silence: PreflightAlertSilenceResponse | None = None
@@ -496,12 +528,12 @@ class PreflightAlertItemResponse(BaseModel):
 class PreflightActiveAlertsResponse(BaseModel):
     evaluated_at: datetime
     total_active: int
-    items: list[PreflightAlertItemResponse] = Field(default_factory=list)
+    items: tuple[PreflightAlertItemResponse, ...] = ()
 
 
 class PreflightAlertHistoryResponse(BaseModel):
     limit: int
-    items: list[PreflightAlertItemResponse] = Field(default_factory=list)
+    items: tuple[PreflightAlertItemResponse, ...] = ()
 
 
 class PreflightAlertPoliciesResponse(BaseModel):
@@ -545,7 +577,7 @@ class PreflightAlertAuditEventResponse(BaseModel):
     event_type: str
     actor: str
     event_at: datetime
-    payload_json: dict[str, Any] = Field(default_factory=dict)
+    payload_json: JsonObject = Field(default_factory=dict)
 
 
 class PreflightAlertAuditResponse(BaseModel):
@@ -563,7 +595,7 @@ class PreflightNotificationOutboxItemResponse(BaseModel):
     policy_id: str
     severity: str | None = None
     source_name: str | None = None
-    payload_json: dict[str, Any] = Field(default_factory=dict)
+    payload_json: JsonObject = Field(default_factory=dict)
     channel_type: str
     channel_target: str
     status: str
@@ -581,6 +613,7 @@ class PreflightNotificationOutboxItemResponse(BaseModel):
 class PreflightNotificationOutboxResponse(BaseModel):
     limit: int
     items: list[PreflightNotificationOutboxItemResponse] = Field(default_factory=list)
+    next_cursor: str | None = None
 
 
 class PreflightNotificationDispatchResponse(BaseModel):
@@ -599,6 +632,19 @@ class PreflightNotificationReplayResponse(BaseModel):
     items: list[PreflightNotificationOutboxItemResponse] = Field(default_factory=list)
 
 
+class PreflightNotificationAnalyticsQuery(BaseModel):
+    days: int | None = Field(default=None, ge=1, le=3650)
+    event_type: str | None = None
+    channel_target: str | None = None
+    status: str | None = None
+    date_from: str | None = None
+    date_to: str | None = None
+
+
+class PreflightNotificationTrendsQuery(PreflightNotificationAnalyticsQuery):
+    bucket: TrendBucket = "day"
+
+
 class PreflightNotificationAnalyticsFilters(BaseModel):
     days: int | None = None
     event_type: str | None = None
@@ -622,7 +668,7 @@ class PreflightNotificationStatsResponse(BaseModel):
     avg_delivery_latency_ms: float | None = None
     p95_delivery_latency_ms: float | None = None
     oldest_pending_age_seconds: int | None = None
-    runtime_observability: dict[str, Any] = Field(default_factory=dict)
+    runtime_observability: JsonObject = Field(default_factory=dict)
 
 
 class PreflightNotificationTrendBucket(BaseModel):
@@ -635,7 +681,7 @@ class PreflightNotificationTrendBucket(BaseModel):
 
 
 class PreflightNotificationTrendsResponse(BaseModel):
-    bucket: Literal["day", "hour"]
+    bucket: TrendBucket
     filters: PreflightNotificationAnalyticsFilters
     items: list[PreflightNotificationTrendBucket] = Field(default_factory=list)
 
@@ -664,6 +710,12 @@ class PreflightNotificationChannelsResponse(BaseModel):
     items: list[PreflightNotificationChannelSummary] = Field(default_factory=list)
 
 
+class PreflightNotificationOverviewResponse(BaseModel):
+    stats: PreflightNotificationStatsResponse
+    trends: PreflightNotificationTrendsResponse
+    channels: PreflightNotificationChannelsResponse
+
+
 class PreflightNotificationAttemptItemResponse(BaseModel):
     attempt_id: str
     outbox_item_id: str
@@ -691,6 +743,7 @@ class PreflightNotificationAttemptsResponse(BaseModel):
     limit: int
     filters: PreflightNotificationAnalyticsFilters
     items: list[PreflightNotificationAttemptItemResponse] = Field(default_factory=list)
+    next_cursor: str | None = None
 
 
 class DataSourceCreateRequest(BaseModel):
@@ -791,7 +844,7 @@ class ScenarioRunRequestV2(BaseModel):
     store_id: int | None = Field(default=None, gt=0)
     segment: ScenarioSegmentRequest | None = None
     price_change_pct: float = Field(default=0.0, ge=-80.0, le=200.0)
-    promo_mode: Literal["as_is", "always_on", "weekends_only", "off"] = "as_is"
+    promo_mode: PromoMode = "as_is"
     weekend_open: bool = True
     school_holiday: int = Field(default=0, ge=0, le=1)
     demand_shift_pct: float = Field(default=0.0, ge=-80.0, le=200.0)
@@ -842,27 +895,8 @@ class NotificationEndpointsResponse(BaseModel):
     items: list[NotificationEndpointResponse] = Field(default_factory=list)
 
 
-class NotificationDeliveryItemResponse(BaseModel):
-    attempt_id: str
-    outbox_item_id: str
-    event_id: str | None = None
-    delivery_id: str | None = None
-    replayed_from_id: str | None = None
-    channel_type: str
-    channel_target: str
-    event_type: str
-    alert_id: str
-    policy_id: str
-    source_name: str | None = None
-    attempt_number: int
-    attempt_status: str
-    started_at: datetime
-    completed_at: datetime | None = None
-    duration_ms: int | None = None
-    http_status: int | None = None
-    error_code: str | None = None
-    error_message_safe: str | None = None
-    created_at: datetime
+# Same row shape as a preflight notification attempt; one validator/serializer serves both.
+NotificationDeliveryItemResponse = PreflightNotificationAttemptItemResponse
 
 
 class NotificationDeliveryPageResponse(BaseModel):
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
-import sys
+import time
+from collections.abc import Collection
+from functools import cached_property, lru_cache, partial
 from typing import Any, Callable
 
-from fastapi import Depends, HTTPException, Request, Security
+from fastapi import BackgroundTasks, Depends, HTTPException, Request, Security
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import APIKeyHeader
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-PROJECT_ROOT = __import__("pathlib").Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
-from src.etl.diagnostics_api_key_registry import authenticate_api_key, touch_api_client_usage  # noqa: E402
+from src.etl.diagnostics_api_key_registry import authenticate_api_key, touch_api_client_usage
 
 _DIAGNOSTICS_KEY_HEADER = APIKeyHeader(name="X-API-Key", auto_error=False)
 
@@ -20,8 +21,24 @@ SCOPE_READ = "diagnostics:read"
 SCOPE_OPERATE = "diagnostics:operate"
 SCOPE_ADMIN = "diagnostics:admin"
 
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+# Principals for successful key lookups are reused for a short TTL, keyed by a BLAKE2b
+# digest of the key (never the key itself). Deactivated keys stop
+# working once their entry expires; failed lookups are never cached. Concurrent
+# lookups of the same key share one in-flight task; different keys never wait on
+# each other.
+_DEFAULT_AUTH_CACHE_TTL_SECONDS = 60.0
+_AUTH_CACHE: dict[bytes, tuple[float, "DiagnosticsPrincipal"]] = {}
+_AUTH_INFLIGHT: dict[bytes, "asyncio.Task[DiagnosticsPrincipal | None]"] = {}
+
 
 class DiagnosticsPrincipal(BaseModel):
+    # Frozen because cached principals are shared across requests; only built from
+    # trusted registry rows, so unknown fields are a bug rather than input to ignore.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     client_id: str
     name: str
     actor: str
@@ -29,33 +46,120 @@ class DiagnosticsPrincipal(BaseModel):
     is_authenticated: bool = True
     legacy_mode: bool = False
 
+    @cached_property
+    def normalized_scopes(self) -> frozenset[str]:
+        return frozenset(str(scope).strip() for scope in self.scopes)
+
+
+@lru_cache(maxsize=32)
+def _env_flag(raw: str, *, default: bool) -> bool:
+    # Keyed on the raw value, so a changed environment is still honoured while the
+    # per-request cost stays one getenv plus a cache hit.
+    value = raw.strip().lower()
+    return value not in _FALSE_VALUES if default else value in _TRUE_VALUES
+
 
 def _auth_enabled() -> bool:
-    value = str(os.getenv("DIAGNOSTICS_AUTH_ENABLED", "1")).strip().lower()
-    return value not in {"0", "false", "no", "off"}
+    return _env_flag(os.getenv("DIAGNOSTICS_AUTH_ENABLED", "1"), default=True)
 
 
 def _legacy_fallback_enabled() -> bool:
-    value = str(os.getenv("DIAGNOSTICS_AUTH_ALLOW_LEGACY_ACTOR", "0")).strip().lower()
-    return value in {"1", "true", "yes", "on"}
+    return _env_flag(os.getenv("DIAGNOSTICS_AUTH_ALLOW_LEGACY_ACTOR", "0"), default=False)
+
+
+def clear_auth_cache() -> None:
+    _AUTH_CACHE.clear()
+
+
+def _auth_cache_ttl_seconds() -> float:
+    raw = str(os.getenv("DIAGNOSTICS_AUTH_CACHE_TTL_SECONDS", "")).strip()
+    if not raw:
+        return _DEFAULT_AUTH_CACHE_TTL_SECONDS
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return _DEFAULT_AUTH_CACHE_TTL_SECONDS
+
+
+def _cached_principal(cache_key: bytes) -> DiagnosticsPrincipal | None:
+    cached = _AUTH_CACHE.get(cache_key)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    return cached[1]
+
+
+async def _authenticate_principal(api_key: str) -> DiagnosticsPrincipal | None:
+    client = await run_in_threadpool(authenticate_api_key, api_key)
+    return _principal_from_client(client) if client is not None else None
+
+
+async def _lookup_principal(api_key: str) -> tuple[DiagnosticsPrincipal | None, bool]:
+    """Return the principal for ``api_key`` and whether it came from the database."""
+
+    ttl_seconds = _auth_cache_ttl_seconds()
+    if ttl_seconds <= 0:
+        return await _authenticate_principal(api_key), True
+
+    cache_key = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).digest()
+    principal = _cached_principal(cache_key)
+    if principal is not None:
+        return principal, False
+
+    task = _AUTH_INFLIGHT.get(cache_key)
+    looked_up = task is None
+    if task is None:
+        task = asyncio.ensure_future(_authenticate_principal(api_key))
+        _AUTH_INFLIGHT[cache_key] = task
+        task.add_done_callback(partial(_store_principal, cache_key, ttl_seconds))
+    # Only the caller that started the lookup reports it, so usage is recorded once.
+    return await asyncio.shield(task), looked_up
+
+
+def _store_principal(
+    cache_key: bytes,
+    ttl_seconds: float,
+    task: asyncio.Task[DiagnosticsPrincipal | None],
+) -> None:
+    if _AUTH_INFLIGHT.get(cache_key) is task:
+        del _AUTH_INFLIGHT[cache_key]
+    if task.cancelled() or task.exception() is not None:  # also marks the error retrieved
+        return
+    principal = task.result()
+    if principal is None:
+        return
+    now = time.monotonic()
+    for stale_key in [key for key, (expires_at, _) in _AUTH_CACHE.items() if expires_at <= now]:
+        del _AUTH_CACHE[stale_key]
+    _AUTH_CACHE[cache_key] = (now + ttl_seconds, principal)
 
 
 def _normalize_scopes(value: Any) -> list[str]:
     if not isinstance(value, list):
         return []
-    scopes: list[str] = []
-    seen: set[str] = set()
-    for item in value:
-        scope = str(item).strip()
-        if not scope or scope in seen:
-            continue
-        seen.add(scope)
-        scopes.append(scope)
-    return scopes
+    # dict.fromkeys dedupes while keeping first-seen order.
+    return list(dict.fromkeys(scope for scope in (str(item).strip() for item in value) if scope))
+
+
+def _principal_from_client(client: dict[str, Any]) -> DiagnosticsPrincipal:
+    actor = str(client.get("name") or client.get("client_id") or "unknown-client").strip()
+    return DiagnosticsPrincipal(
+        client_id=str(client.get("client_id")),
+        name=str(client.get("name") or client.get("client_id")),
+        actor=actor,
+        scopes=_normalize_scopes(client.get("scopes")),
+        is_authenticated=True,
+        legacy_mode=False,
+    )
 
 
 def _legacy_principal(request: Request) -> DiagnosticsPrincipal:
-    actor = str(request.headers.get("X-Actor", "legacy-local")).strip() or "legacy-local"
+    return _legacy_principal_for((request.headers.get("X-Actor") or "").strip() or "legacy-local")
+
+
+@lru_cache(maxsize=64)
+def _legacy_principal_for(actor: str) -> DiagnosticsPrincipal:
+    # Principals are frozen, so legacy requests with the same actor share one instance.
+    # The actor comes from a client header, hence the bounded cache.
     return DiagnosticsPrincipal(
         client_id="legacy-local",
         name="legacy-local",
@@ -68,54 +172,67 @@ def _legacy_principal(request: Request) -> DiagnosticsPrincipal:
 
 async def authenticate_diagnostics_principal(
     request: Request,
+    background_tasks: BackgroundTasks,
     api_key: str | None = Security(_DIAGNOSTICS_KEY_HEADER),
+) -> DiagnosticsPrincipal:
+    # The principal is resolved once per request and reused by any later caller, so
+    # scope checks after the first are attribute reads rather than key lookups.
+    cached = getattr(request.state, "diagnostics_principal", None)
+    if isinstance(cached, DiagnosticsPrincipal):
+        return cached
+    principal = await _resolve_principal(request, background_tasks, api_key)
+    request.state.diagnostics_principal = principal
+    return principal
+
+
+def _record_client_usage(client_id: str, client_host: str | None) -> None:
+    try:
+        touch_api_client_usage(client_id, last_used_ip=client_host)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+async def _resolve_principal(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    api_key: str | None,
 ) -> DiagnosticsPrincipal:
     if not _auth_enabled():
         return _legacy_principal(request)
 
-    if not api_key or not str(api_key).strip():
+    key = api_key.strip() if api_key else ""
+    if not key:
         if _legacy_fallback_enabled():
             return _legacy_principal(request)
         raise HTTPException(status_code=401, detail="Missing X-API-Key header for diagnostics access.")
 
-    client = authenticate_api_key(str(api_key).strip())
-    if client is None:
+    principal, looked_up = await _lookup_principal(key)
+    if principal is None:
         raise HTTPException(status_code=401, detail="Invalid API key for diagnostics access.")
 
-    scopes = _normalize_scopes(client.get("scopes"))
-    actor = str(client.get("name") or client.get("client_id") or "unknown-client").strip()
-    principal = DiagnosticsPrincipal(
-        client_id=str(client.get("client_id")),
-        name=str(client.get("name") or client.get("client_id")),
-        actor=actor,
-        scopes=scopes,
-        is_authenticated=True,
-        legacy_mode=False,
-    )
+    if not looked_up:
+        # Usage was recorded when the cached lookup was made.
+        return principal
 
+    # Bookkeeping only: written after the response has been sent.
     client_host = request.client.host if request.client else None
-    try:
-        touch_api_client_usage(principal.client_id, last_used_ip=client_host)
-    except Exception:  # noqa: BLE001
-        pass
-
+    background_tasks.add_task(_record_client_usage, principal.client_id, client_host)
     return principal
 
 
-def _scope_allowed(required_scope: str, principal_scopes: list[str]) -> bool:
-    required = str(required_scope).strip()
-    if not required:
-        return True
-    if SCOPE_ADMIN in principal_scopes:
-        return True
-    return required in principal_scopes
+def _scope_allowed(required_scope: str, principal_scopes: Collection[str]) -> bool:
+    # ``required_scope`` is normalized once by require_scope, not per request.
+    return not required_scope or SCOPE_ADMIN in principal_scopes or required_scope in principal_scopes
 
 
+@lru_cache(maxsize=None)
 def require_scope(scope: str) -> Callable[..., DiagnosticsPrincipal]:
     required_scope = str(scope).strip()
 
+    # Kept ``async``: FastAPI sends sync dependencies to the threadpool, which costs
+    # far more than awaiting a coroutine that never suspends.
     async def _dependency(principal: DiagnosticsPrincipal = Depends(authenticate_diagnostics_principal)) -> DiagnosticsPrincipal:
-        if _scope_allowed(required_scope, principal.scopes):
+        if _scope_allowed(required_scope, principal.normalized_scopes):
             return principal
         raise HTTPException(
             status_code=403,
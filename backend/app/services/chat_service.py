@@ -1,28 +1,41 @@
 from __future__ import annotations
 
+import logging
 import re
+import time
+from collections.abc import Mapping, Sequence
 from datetime import date, timedelta
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import joblib
+import numpy as np
 import sqlalchemy as sa
 
-from app.config import get_settings
+from app.config import settings
 from app.db import fetch_all, fetch_one
 from app.schemas import ChatInsight, ChatResponse
 from app.services.forecast_service import forecast_for_store
 from app.services.kpi_service import get_kpi_summary
 from app.services.system_service import get_model_metadata, get_system_summary
 
+logger = logging.getLogger("app.chat")
+
 _DATE_PATTERN = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
 _STORE_PATTERN = re.compile(
     r"(?:store(?:_id)?\s*#?\s*|store_id\s*=?\s*|(?:ل)?(?:ل)?(?:ال)?متجر\s*#?\s*|(?:ال)?متجر\s*#?\s*)(\d+)",
     re.IGNORECASE,
 )
+_STORE_NUMBER_PATTERN = re.compile(r"\b(\d{1,4})\b")
 _HORIZON_PATTERN = re.compile(r"\b(\d{1,3})\s*(?:day|days|d|يوم|ايام)\b", re.IGNORECASE)
 
+# Most chat questions default to the last 30 days of data, and the latest loaded date
+# only moves when the ETL runs, so it is cached for a few minutes.
+_LATEST_DATA_DATE_TTL_SECONDS = 300.0
+_LATEST_DATA_DATE_CACHE_KEY = "latest"
+_LATEST_DATA_DATE_CACHE: dict[str, tuple[float, date]] = {}
+
 
 def _format_number(value: float) -> str:
     return f"{value:,.0f}"
@@ -42,7 +55,16 @@ def _extract_horizon(message: str, default_days: int = 30) -> int:
     return max(1, min(180, int(match.group(1))))
 
 
+def clear_latest_data_date_cache() -> None:
+    _LATEST_DATA_DATE_CACHE.clear()
+
+
 def _latest_data_date() -> date:
+    cached = _LATEST_DATA_DATE_CACHE.get(_LATEST_DATA_DATE_CACHE_KEY)
+    now = time.monotonic()
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     row = fetch_one(
         sa.text(
             """
@@ -55,6 +77,7 @@ def _latest_data_date() -> date:
     latest_date = row.get("latest_date") if row else None
     if latest_date is None:
         return date.today()
+    _LATEST_DATA_DATE_CACHE[_LATEST_DATA_DATE_CACHE_KEY] = (now + _LATEST_DATA_DATE_TTL_SECONDS, latest_date)
     return latest_date
 
 
@@ -65,12 +88,12 @@ def _extract_date_range(message: str) -> tuple[date, date]:
         second = date.fromisoformat(matches[1])
         return (first, second) if first <= second else (second, first)
 
-    latest = _latest_data_date()
     if len(matches) == 1:
         end_date = date.fromisoformat(matches[0])
         start_date = end_date - timedelta(days=29)
         return start_date, end_date
 
+    latest = _latest_data_date()
     return latest - timedelta(days=29), latest
 
 
@@ -164,6 +187,11 @@ def _chat_top_stores() -> ChatResponse:
     )
 
 
+def _promo_and_base_sales(rows: Sequence[Mapping[str, Any]]) -> tuple[float, float]:
+    by_flag = {row["promo_flag"]: float(row["avg_sales"]) for row in rows}
+    return by_flag.get("promo", 0.0), by_flag.get("no_promo", 0.0)
+
+
 def _chat_promo_impact(message: str) -> ChatResponse:
     store_id = _extract_store_id(message)
     if store_id is not None:
@@ -179,8 +207,7 @@ def _chat_promo_impact(message: str) -> ChatResponse:
         )
         if len(rows) < 2:
             return ChatResponse(answer=f"Promo impact is not available for store {store_id}.")
-        promo_sales = next((float(row["avg_sales"]) for row in rows if row["promo_flag"] == "promo"), 0.0)
-        base_sales = next((float(row["avg_sales"]) for row in rows if row["promo_flag"] == "no_promo"), 0.0)
+        promo_sales, base_sales = _promo_and_base_sales(rows)
         uplift = ((promo_sales - base_sales) / base_sales * 100.0) if base_sales > 0 else 0.0
         return ChatResponse(
             answer=(
@@ -208,8 +235,7 @@ def _chat_promo_impact(message: str) -> ChatResponse:
             """
         )
     )
-    promo_sales = next((float(row["avg_sales"]) for row in rows if row["promo_flag"] == "promo"), 0.0)
-    base_sales = next((float(row["avg_sales"]) for row in rows if row["promo_flag"] == "no_promo"), 0.0)
+    promo_sales, base_sales = _promo_and_base_sales(rows)
     uplift = ((promo_sales - base_sales) / base_sales * 100.0) if base_sales > 0 else 0.0
     return ChatResponse(
         answer=(
@@ -271,9 +297,10 @@ def _chat_forecast(message: str) -> ChatResponse:
     if not points:
         return ChatResponse(answer=f"No forecast output was generated for store {store_id}.")
 
-    total_sales = sum(float(point["predicted_sales"]) for point in points)
+    predicted = np.fromiter((point["predicted_sales"] for point in points), dtype=float, count=len(points))
+    total_sales = float(predicted.sum())
     avg_daily = total_sales / len(points)
-    peak_day = max(points, key=lambda point: float(point["predicted_sales"]))
+    peak_day = points[int(predicted.argmax())]
 
     return ChatResponse(
         answer=(
@@ -335,8 +362,7 @@ def _chat_data_status() -> ChatResponse:
 
 
 def _chat_compare_stores(message: str) -> ChatResponse:
-    import re
-    ids = re.findall(r'\b(\d{1,4})\b', message)
+    ids = _STORE_NUMBER_PATTERN.findall(message)
     ids_int = [int(i) for i in ids[:2]]
     if len(ids_int) < 2:
         return ChatResponse(
@@ -400,7 +426,6 @@ def _heuristic_intent(message: str) -> str:
 
 @lru_cache(maxsize=1)
 def _load_chat_intent_artifact() -> dict[str, Any] | None:
-    settings = get_settings()
     model_path = Path(settings.chat_model_path)
     if not model_path.is_absolute():
         model_path = (Path(__file__).resolve().parents[3] / model_path).resolve()
@@ -409,30 +434,56 @@ def _load_chat_intent_artifact() -> dict[str, Any] | None:
     return joblib.load(model_path)
 
 
-def _predict_intent(message: str) -> tuple[str | None, float]:
+@lru_cache(maxsize=1)
+def _chat_pipeline() -> tuple[Any, tuple[str, ...]] | None:
+    """Return the intent pipeline with its class labels, converted from NumPy once."""
     artifact = _load_chat_intent_artifact()
-    if not artifact:
-        return None, 0.0
+    pipeline = artifact.get("pipeline") if artifact else None
+    classes = getattr(pipeline, "classes_", None)
+    if classes is None:
+        return None
+    return pipeline, tuple(str(label) for label in classes.tolist())
+
+
+def preload_intent_model() -> dict[str, Any] | None:
+    """Load the intent artifact and run one warm-up prediction before serving traffic."""
+    try:
+        artifact = _load_chat_intent_artifact()
+        resolved = _chat_pipeline()
+        if resolved is not None:
+            resolved[0].predict_proba(["hello"])
+        return artifact
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Chat intent model not preloaded: %s", exc)
+        return None
 
-    pipeline = artifact.get("pipeline")
-    if pipeline is None:
+
+# Dashboards resend the same suggested prompts, so predictions are memoized per message.
+# The artifact itself is loaded once, so a cached answer never goes stale.
+@lru_cache(maxsize=2048)
+def _predict_intent(message: str) -> tuple[str | None, float]:
+    resolved = _chat_pipeline()
+    if resolved is None:
         return None, 0.0
 
+    pipeline, labels = resolved
     try:
         probs = pipeline.predict_proba([message])[0]
-        labels = pipeline.classes_.tolist()
         best_idx = int(probs.argmax())
-        return str(labels[best_idx]), float(probs[best_idx])
+        return labels[best_idx], float(probs[best_idx])
     except Exception:  # noqa: BLE001
         return None, 0.0
 
 
+@lru_cache(maxsize=1)
+def _confidence_threshold() -> float:
+    return max(settings.chat_min_confidence, 0.0)
+
+
 def _resolve_intent(message: str) -> tuple[str, float | None]:
     """Return (intent, confidence). confidence is None when heuristic fallback is used."""
     predicted_intent, confidence = _predict_intent(message)
-    settings = get_settings()
-    threshold = max(settings.chat_min_confidence, 0.0)
-    if predicted_intent and confidence >= threshold:
+    if predicted_intent and confidence >= _confidence_threshold():
         return predicted_intent, float(confidence)
     return _heuristic_intent(message), None
 
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 import os
-import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+from src.validation.input_contract_models import load_input_contract
 
-from src.validation.input_contract_models import load_input_contract  # noqa: E402
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
 
 DEFAULT_CONTRACT_REGISTRY_PATH = PROJECT_ROOT / "config" / "input_contract" / "contracts_registry.yaml"
 
+# libyaml's SafeLoader when PyYAML was built with it; same safe subset, much faster parse.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed registry per path, reused until the file's mtime or size changes. Treat the
+# cached payload as read-only: callers copy what they hand out.
+_REGISTRY_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 def _registry_path() -> Path:
     configured = str(os.getenv("CONTRACTS_REGISTRY_PATH", str(DEFAULT_CONTRACT_REGISTRY_PATH))).strip()
@@ -23,16 +28,34 @@ def _registry_path() -> Path:
 
 def _load_registry_payload() -> dict[str, Any]:
     path = _registry_path()
-    if not path.exists():
-        raise FileNotFoundError(f"Contracts registry file not found: {path}")
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Contracts registry file not found: {path}") from None
+    file_version = (stat.st_mtime_ns, stat.st_size)
+    cached = _REGISTRY_CACHE.get(str(path))
+    if cached is not None and cached[0] == file_version:
+        return cached[1]
+
     with open(path, encoding="utf-8") as file:
-        payload = yaml.safe_load(file) or {}
+        payload = yaml.load(file, Loader=_YAML_LOADER) or {}
     if not isinstance(payload, dict):
         raise ValueError("Contracts registry must be a top-level object")
     contracts = payload.get("contracts", [])
     if not isinstance(contracts, list):
         raise ValueError("Contracts registry field 'contracts' must be a list")
-    return {"version": str(payload.get("version", "v1")), "path": str(path), "contracts": contracts}
+    by_id: dict[str, dict[str, Any]] = {}
+    for item in contracts:
+        if isinstance(item, dict):
+            by_id.setdefault(str(item.get("id")), item)  # first entry wins, as in a linear scan
+    registry = {
+        "version": str(payload.get("version", "v1")),
+        "path": str(path),
+        "contracts": contracts,
+        "by_id": by_id,
+    }
+    _REGISTRY_CACHE[str(path)] = (file_version, registry)
+    return registry
 
 
 def _resolve_schema_path(raw_path: str) -> Path:
@@ -42,8 +65,9 @@ def _resolve_schema_path(raw_path: str) -> Path:
     return (PROJECT_ROOT / candidate).resolve()
 
 
-def _version_with_schema(version_item: dict[str, Any]) -> dict[str, Any]:
-    schema_path = _resolve_schema_path(str(version_item.get("schema_path", "")))
+@lru_cache(maxsize=64)
+def _schema_summary(schema_path: str, file_version: tuple[int, int] | None) -> tuple[str, dict[str, dict[str, Any]]]:
+    # ``file_version`` only keys the cache, so an edited schema file is loaded afresh.
     contract = load_input_contract(schema_path)
 
     profiles: dict[str, dict[str, Any]] = {}
@@ -56,10 +80,21 @@ def _version_with_schema(version_item: dict[str, Any]) -> dict[str, Any]:
             "aliases": aliases,
             "dtypes": dtypes,
         }
+    return contract.contract_version, profiles
+
+
+def _version_with_schema(version_item: dict[str, Any]) -> dict[str, Any]:
+    schema_path = _resolve_schema_path(str(version_item.get("schema_path", "")))
+    try:
+        stat = schema_path.stat()
+        file_version = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_version = None  # load_input_contract raises its own not-found error
+    contract_version, profiles = _schema_summary(str(schema_path), file_version)
 
     payload = dict(version_item)
     payload["schema_path"] = str(schema_path)
-    payload["contract_version"] = contract.contract_version
+    payload["contract_version"] = contract_version
     payload["profiles"] = profiles
     return payload
 
@@ -91,15 +126,12 @@ def list_contracts() -> list[dict[str, Any]]:
 
 
 def get_contract(contract_id: str) -> dict[str, Any] | None:
-    contracts = _load_registry_payload()["contracts"]
-    for item in contracts:
-        if not isinstance(item, dict):
-            continue
-        if str(item.get("id")) == str(contract_id):
-            payload = dict(item)
-            payload["versions"] = item.get("versions", []) if isinstance(item.get("versions"), list) else []
-            return payload
-    return None
+    item = _load_registry_payload()["by_id"].get(str(contract_id))
+    if item is None:
+        return None
+    payload = dict(item)
+    payload["versions"] = item.get("versions", []) if isinstance(item.get("versions"), list) else []
+    return payload
 
 
 def list_contract_versions(contract_id: str) -> list[dict[str, Any]]:
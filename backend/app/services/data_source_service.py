@@ -1,63 +1,18 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from pathlib import Path
-import sys
 from typing import Any
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from src.etl.data_source_registry import (
     create_data_source,
     get_data_source,
     list_data_sources,
     resolve_data_source_id,
 )
-from src.etl.preflight_registry import list_preflight_runs
-
-
-def _parse_created_at(value: Any) -> datetime | None:
-    if isinstance(value, datetime):
-        if value.tzinfo is None:
-            return value.replace(tzinfo=timezone.utc)
-        return value.astimezone(timezone.utc)
-    if isinstance(value, str):
-        text = value.strip().replace("Z", "+00:00")
-        if not text:
-            return None
-        try:
-            parsed = datetime.fromisoformat(text)
-        except ValueError:
-            return None
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=timezone.utc)
-        return parsed.astimezone(timezone.utc)
-    return None
-
+from src.etl.preflight_registry import list_latest_preflight_runs_by_data_source, list_preflight_runs
 
-def _latest_preflight_by_data_source(limit: int = 2000) -> dict[int, dict[str, Any]]:
-    rows = list_preflight_runs(limit=limit)
-    latest_by_source: dict[int, dict[str, Any]] = {}
-    for row in rows:
-        ds_id_raw = row.get("data_source_id")
-        if ds_id_raw is None:
-            continue
-        try:
-            ds_id = int(ds_id_raw)
-        except (TypeError, ValueError):
-            continue
 
-        created_at = _parse_created_at(row.get("created_at"))
-        existing = latest_by_source.get(ds_id)
-        if existing is None:
-            latest_by_source[ds_id] = row
-            continue
-        existing_created_at = _parse_created_at(existing.get("created_at"))
-        if created_at is not None and (existing_created_at is None or created_at > existing_created_at):
-            latest_by_source[ds_id] = row
-    return latest_by_source
+def _latest_preflight_by_data_source() -> dict[int, dict[str, Any]]:
+    return {int(row["data_source_id"]): row for row in list_latest_preflight_runs_by_data_source()}
 
 
 def list_data_sources_with_health(*, include_inactive: bool = True) -> list[dict[str, Any]]:
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import os
-import sys
 from collections import defaultdict
 from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
@@ -12,10 +11,6 @@ from urllib.parse import quote
 
 import sqlalchemy as sa
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from app.db import fetch_all, fetch_one
 from src.etl.preflight_registry import (
     get_latest_preflight,
@@ -24,6 +19,8 @@ from src.etl.preflight_registry import (
     query_preflight_runs,
 )
 
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
 PreflightArtifactType = Literal["validation", "semantic", "manifest", "preflight", "unified_csv"]
 ARTIFACT_TYPES: tuple[PreflightArtifactType, ...] = ("validation", "semantic", "manifest", "preflight", "unified_csv")
 ARTIFACT_CONTENT_TYPES: dict[PreflightArtifactType, str] = {
@@ -699,11 +696,7 @@ def list_preflight_run_summaries(
     return [_compact_record(record) for record in records]
 
 
-def get_preflight_run_details(run_id: str) -> dict[str, Any] | None:
-    payload = get_preflight_run(run_id)
-    if payload is None:
-        return None
-
+def _run_details(payload: dict[str, Any]) -> dict[str, Any]:
     records = [_compact_record(record) for record in payload.get("records", [])]
     return {
         "run_id": payload.get("run_id"),
@@ -715,14 +708,19 @@ def get_preflight_run_details(run_id: str) -> dict[str, Any] | None:
     }
 
 
-def get_latest_preflight_run(data_source_id: int | None = None) -> dict[str, Any] | None:
-    payload = get_latest_preflight(source_name=None, data_source_id=data_source_id)
+def get_preflight_run_details(run_id: str) -> dict[str, Any] | None:
+    payload = get_preflight_run(run_id)
     if payload is None:
         return None
-    run_id = payload.get("run_id")
-    if not run_id:
+    return _run_details(payload)
+
+
+def get_latest_preflight_run(data_source_id: int | None = None) -> dict[str, Any] | None:
+    # get_latest_preflight already returns the grouped run, so no second lookup by run_id.
+    payload = get_latest_preflight(source_name=None, data_source_id=data_source_id)
+    if payload is None or not payload.get("run_id"):
         return None
-    return get_preflight_run_details(str(run_id))
+    return _run_details(payload)
 
 
 def get_latest_preflight_for_source(
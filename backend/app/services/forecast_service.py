@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import logging
 import math
+import threading
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import NormalDist
 from typing import Any
 import uuid
-import sys
 
 logger = logging.getLogger("app.forecast")
 
@@ -18,29 +19,28 @@ import numpy as np
 import pandas as pd
 import sqlalchemy as sa
 
-from app.config import get_settings
+from app.config import settings
 from app.db import engine
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from src.etl.data_source_registry import resolve_data_source_id
 from src.etl.forecast_run_registry import upsert_forecast_run
 
-settings = get_settings()
-
 # ── In-memory model artifact cache (invalidates on file mtime change) ─────────
 _ARTIFACT_CACHE: dict[str, object] = {
     "path": None,
     "mtime": None,
     "payload": None,
 }
+_ARTIFACT_LOCK = threading.Lock()  # batch forecasts fan out; only one thread may run joblib.load
 
 # ── Short-lived forecast cache (keyed by (store_id, horizon, date)) ──────────
 # LRU OrderedDict: most-recently-used at the end; evicts from the front at 500 entries.
 _FORECAST_CACHE: OrderedDict[tuple, tuple[datetime, list[dict]]] = OrderedDict()
 _FORECAST_CACHE_TTL_SECONDS = 300  # 5-minute TTL
+_FORECAST_CACHE_LOCK = threading.Lock()  # batch forecasts touch the cache from several threads
+
+# Per-store forecasts in a batch are independent; run this many at once.
+_BATCH_FORECAST_WORKERS = 8
 
 
 @dataclass(frozen=True)
@@ -368,18 +368,28 @@ def _load_artifact() -> dict:
         raise FileNotFoundError(f"Model not found: {model_path}")
 
     current_mtime = model_path.stat().st_mtime
-    if (
-        _ARTIFACT_CACHE["payload"] is not None
-        and _ARTIFACT_CACHE["path"] == model_path
-        and _ARTIFACT_CACHE["mtime"] == current_mtime
-    ):
-        return _ARTIFACT_CACHE["payload"]  # type: ignore[return-value]
-
-    payload = joblib.load(model_path)
-    _ARTIFACT_CACHE["path"] = model_path
-    _ARTIFACT_CACHE["mtime"] = current_mtime
-    _ARTIFACT_CACHE["payload"] = payload
-    return payload
+    with _ARTIFACT_LOCK:
+        if (
+            _ARTIFACT_CACHE["payload"] is not None
+            and _ARTIFACT_CACHE["path"] == model_path
+            and _ARTIFACT_CACHE["mtime"] == current_mtime
+        ):
+            return _ARTIFACT_CACHE["payload"]  # type: ignore[return-value]
+
+        payload = joblib.load(model_path)
+        _ARTIFACT_CACHE["path"] = model_path
+        _ARTIFACT_CACHE["mtime"] = current_mtime
+        _ARTIFACT_CACHE["payload"] = payload
+        return payload
+
+
+def preload_artifact() -> dict | None:
+    """Warm the artifact cache at startup so the first request skips joblib.load."""
+    try:
+        return _load_artifact()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Forecast model artifact not preloaded: %s", exc)
+        return None
 
 
 class _EnsembleWrapper:
@@ -438,25 +448,27 @@ def _record_forecast_run(
 
 def _forecast_cache_get(key: tuple) -> list[dict] | None:
     """Return cached forecast if within TTL, else None. Moves hit to MRU position."""
-    entry = _FORECAST_CACHE.get(key)
-    if entry is None:
-        return None
-    cached_at, result = entry
-    age = (datetime.now(timezone.utc) - cached_at).total_seconds()
-    if age > _FORECAST_CACHE_TTL_SECONDS:
-        _FORECAST_CACHE.pop(key, None)
-        return None
-    _FORECAST_CACHE.move_to_end(key)
-    return result
+    with _FORECAST_CACHE_LOCK:
+        entry = _FORECAST_CACHE.get(key)
+        if entry is None:
+            return None
+        cached_at, result = entry
+        age = (datetime.now(timezone.utc) - cached_at).total_seconds()
+        if age > _FORECAST_CACHE_TTL_SECONDS:
+            _FORECAST_CACHE.pop(key, None)
+            return None
+        _FORECAST_CACHE.move_to_end(key)
+        return result
 
 
 def _forecast_cache_set(key: tuple, result: list[dict]) -> None:
     """Insert or refresh entry; evict LRU entries beyond 500-item cap."""
-    if key in _FORECAST_CACHE:
-        _FORECAST_CACHE.move_to_end(key)
-    _FORECAST_CACHE[key] = (datetime.now(timezone.utc), result)
-    while len(_FORECAST_CACHE) > 500:
-        _FORECAST_CACHE.popitem(last=False)  # evict least-recently-used
+    with _FORECAST_CACHE_LOCK:
+        if key in _FORECAST_CACHE:
+            _FORECAST_CACHE.move_to_end(key)
+        _FORECAST_CACHE[key] = (datetime.now(timezone.utc), result)
+        while len(_FORECAST_CACHE) > 500:
+            _FORECAST_CACHE.popitem(last=False)  # evict least-recently-used
 
 
 # ── Public service functions ──────────────────────────────────────────────────
@@ -600,37 +612,44 @@ def forecast_batch_for_stores(
     )
 
     try:
-        store_series: dict[int, list[dict]] = {}
-        for store_id in normalized_store_ids:
-            store_series[store_id] = forecast_for_store(
+        def _store_forecast(store_id: int) -> list[dict]:
+            return forecast_for_store(
                 store_id=store_id,
                 horizon_days=horizon_days,
                 data_source_id=resolved_data_source_id,
                 _record_run=False,
             )
 
+        workers = min(_BATCH_FORECAST_WORKERS, len(normalized_store_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="forecast-batch") as executor:
+            store_series = dict(zip(normalized_store_ids, executor.map(_store_forecast, normalized_store_ids)))
+
         store_summaries = [_summarize_store_series(sid, pts) for sid, pts in store_series.items()]
 
-        portfolio_series: list[dict] = []
-        for index in range(horizon_days):
-            date_value = next(iter(store_series.values()))[index]["date"]
-            portfolio_series.append(
-                {
-                    "date": date_value,
-                    "predicted_sales": float(sum(pts[index]["predicted_sales"] for pts in store_series.values())),
-                    "predicted_lower": float(sum(pts[index]["predicted_lower"] for pts in store_series.values())),
-                    "predicted_upper": float(sum(pts[index]["predicted_upper"] for pts in store_series.values())),
-                }
-            )
+        # (stores, horizon, [sales, lower, upper]) reduced over stores in one pass.
+        series_values = np.array(
+            [
+                [(row["predicted_sales"], row["predicted_lower"], row["predicted_upper"]) for row in pts[:horizon_days]]
+                for pts in store_series.values()
+            ],
+            dtype=float,
+        )
+        portfolio_totals = series_values.sum(axis=0)
+        portfolio_dates = [row["date"] for row in next(iter(store_series.values()))[:horizon_days]]
+        portfolio_series: list[dict] = [
+            {
+                "date": date_value,
+                "predicted_sales": sales,
+                "predicted_lower": lower,
+                "predicted_upper": upper,
+            }
+            for date_value, (sales, lower, upper) in zip(portfolio_dates, portfolio_totals.tolist())
+        ]
 
-        portfolio_total = float(sum(row["predicted_sales"] for row in portfolio_series))
+        portfolio_total = float(portfolio_totals[:, 0].sum())
         portfolio_avg_daily = float(portfolio_total / horizon_days) if horizon_days > 0 else 0.0
-        portfolio_peak = max(portfolio_series, key=lambda r: r["predicted_sales"]) if portfolio_series else None
-        interval_widths = [
-            row["predicted_upper"] - row["predicted_lower"]
-            for row in portfolio_series
-            if row.get("predicted_upper") is not None and row.get("predicted_lower") is not None
-        ]
+        portfolio_peak = portfolio_series[int(portfolio_totals[:, 0].argmax())] if portfolio_series else None
+        interval_widths = portfolio_totals[:, 2] - portfolio_totals[:, 1]
 
         response = {
             "request": request_json,
@@ -642,7 +661,7 @@ def forecast_batch_for_stores(
                 "avg_daily_sales": portfolio_avg_daily,
                 "peak_date": portfolio_peak["date"] if portfolio_peak else None,
                 "peak_sales": float(portfolio_peak["predicted_sales"]) if portfolio_peak else 0.0,
-                "avg_interval_width": float(np.mean(interval_widths)) if interval_widths else 0.0,
+                "avg_interval_width": float(interval_widths.mean()) if interval_widths.size else 0.0,
             },
             "portfolio_series": portfolio_series,
         }
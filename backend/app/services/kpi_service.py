@@ -1,10 +1,13 @@
 ﻿from datetime import date
 
 import sqlalchemy as sa
+from pydantic import TypeAdapter
 
 from app.db import fetch_all, fetch_one
 from app.schemas import KpiSummaryResponse, PromoImpactPoint
 
+_PROMO_IMPACT_ADAPTER = TypeAdapter(list[PromoImpactPoint])
+
 
 def get_kpi_summary(date_from: date, date_to: date, store_id: int | None = None) -> KpiSummaryResponse:
     filters = ["full_date BETWEEN :date_from AND :date_to"]
@@ -59,5 +62,5 @@ def get_promo_impact(store_id: int | None = None) -> list[PromoImpactPoint]:
         params["store_id"] = store_id
     query += " ORDER BY store_id, promo_flag"
 
-    rows = fetch_all(sa.text(query), params=params)
-    return [PromoImpactPoint(**row) for row in rows]
+    # Pydantic dataclasses only accept dicts, not the RowMapping objects fetch_all returns.
+    return _PROMO_IMPACT_ADAPTER.validate_python([dict(row) for row in fetch_all(sa.text(query), params=params)])
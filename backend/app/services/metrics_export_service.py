@@ -1,28 +1,23 @@
 from __future__ import annotations
 
+import functools
 import logging
 import math
 import os
-import sys
 import threading
 from collections import defaultdict
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TypeVar
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
-from src.etl.preflight_alert_registry import (  # noqa: E402
+from src.etl.preflight_alert_registry import (
     count_active_silences,
     count_alert_audit_events_by_type,
     get_scheduler_lease,
     list_active_alert_states,
 )
-from src.etl.preflight_notification_attempt_registry import aggregate_delivery_attempt_metrics  # noqa: E402
-from src.etl.preflight_notification_outbox_registry import count_outbox_items, get_oldest_outbox_created_at  # noqa: E402
-from src.etl.preflight_registry import aggregate_preflight_run_metrics  # noqa: E402
+from src.etl.preflight_notification_attempt_registry import aggregate_delivery_attempt_metrics
+from src.etl.preflight_notification_outbox_registry import count_outbox_items, get_oldest_outbox_created_at
+from src.etl.preflight_registry import aggregate_preflight_run_metrics
 
 logger = logging.getLogger("preflight.metrics")
 
@@ -41,8 +36,34 @@ _NOTIFICATION_LATENCY_BUCKETS_MS: tuple[float, ...] = (
 )
 
 _METRICS_RENDER_ERRORS_TOTAL = 0
+_METRICS_VERSION = 0
 _METRICS_LOCK = threading.Lock()
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def metrics_version() -> int:
+    return _METRICS_VERSION
+
+
+def mark_metrics_dirty() -> None:
+    global _METRICS_VERSION
+    with _METRICS_LOCK:
+        _METRICS_VERSION += 1
+
+
+def marks_metrics_dirty(func: _F) -> _F:
+    """Bump the metrics version after ``func`` runs, so cached renders are not reused."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        finally:
+            mark_metrics_dirty()
+
+    return wrapper  # type: ignore[return-value]
+
 
 def _normalize_optional_text(value: Any) -> str | None:
     if value is None:
@@ -1,13 +1,7 @@
 from __future__ import annotations
 
-from pathlib import Path
-import sys
 from typing import Any
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from src.etl.ml_experiment_registry import get_experiment, list_experiments
 
 
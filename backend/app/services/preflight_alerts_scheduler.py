@@ -3,30 +3,23 @@ from __future__ import annotations
 import logging
 import os
 import socket
-import sys
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any
 
 from app.services.preflight_alerts_service import AUDIT_ACTOR_SCHEDULER, run_alert_evaluation
 from app.services.preflight_notifications_service import run_notification_dispatch
+from src.etl.preflight_alert_registry import (
+    acquire_scheduler_lease,
+    release_scheduler_lease,
+)
 
 try:
     from apscheduler.schedulers.asyncio import AsyncIOScheduler
 except Exception:  # noqa: BLE001
     AsyncIOScheduler = None  # type: ignore[assignment]
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
-from src.etl.preflight_alert_registry import (  # noqa: E402
-    acquire_scheduler_lease,
-    release_scheduler_lease,
-)
-
 logger = logging.getLogger("preflight.alerts.scheduler")
 
 DEFAULT_LEASE_NAME = "preflight_alerts_scheduler"
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import logging
 import os
-import sys
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -16,17 +15,14 @@ from app.services.diagnostics_service import (
     _load_semantic_payload_with_fallback,
     _normalize_semantic_payload,
 )
+from app.services.metrics_export_service import marks_metrics_dirty
 from app.services.preflight_notifications_service import (
     EVENT_ALERT_FIRING,
     EVENT_ALERT_RESOLVED,
     enqueue_alert_transition_notifications,
 )
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
-from src.etl.preflight_alert_registry import (  # noqa: E402
+from src.etl.preflight_alert_registry import (
     acknowledge_alert as save_alert_acknowledgement,
     create_silence as save_alert_silence,
     delete_alert_state,
@@ -44,7 +40,9 @@ from src.etl.preflight_alert_registry import (  # noqa: E402
     unacknowledge_alert as clear_alert_acknowledgement,
     upsert_alert_state,
 )
-from src.etl.preflight_registry import query_preflight_runs  # noqa: E402
+from src.etl.preflight_registry import query_preflight_runs
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
 
 logger = logging.getLogger("preflight.alerts")
 
@@ -552,6 +550,7 @@ def _decorate_alert_items_with_overlays(items: list[dict[str, Any]], *, now: dat
     return items
 
 
+@marks_metrics_dirty
 def evaluate_alert_policies(
     *,
     policy_path: str | Path | None = None,
@@ -772,6 +771,7 @@ def list_alert_policies(*, policy_path: str | Path | None = None) -> dict[str, A
     }
 
 
+@marks_metrics_dirty
 def create_silence(
     *,
     actor: str,
@@ -830,6 +830,7 @@ def create_silence(
     return silence
 
 
+@marks_metrics_dirty
 def expire_silence_by_id(*, silence_id: str, actor: str) -> dict[str, Any]:
     normalized_actor = str(actor).strip()
     if not normalized_actor:
@@ -880,6 +881,7 @@ def list_silences(
     }
 
 
+@marks_metrics_dirty
 def acknowledge_alert(
     *,
     alert_id: str,
@@ -915,6 +917,7 @@ def acknowledge_alert(
     return acknowledgement
 
 
+@marks_metrics_dirty
 def unacknowledge_alert(
     *,
     alert_id: str,
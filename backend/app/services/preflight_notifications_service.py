@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import base64
 import hashlib
 import hmac
 import ipaddress
@@ -7,7 +8,6 @@ import json
 import logging
 import os
 import socket
-import sys
 import threading
 from functools import lru_cache
 import urllib.error
@@ -17,19 +17,17 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 from urllib.parse import urlparse
 
 import yaml
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
-from src.etl.preflight_notification_outbox_registry import (  # noqa: E402
+from app.services.metrics_export_service import marks_metrics_dirty
+from src.etl.preflight_notification_outbox_registry import (
     clone_outbox_item_for_replay,
     get_outbox_item,
     insert_outbox_event,
+    iter_outbox_history,
     list_due_outbox_items,
     list_outbox_history,
     mark_outbox_dead,
@@ -37,14 +35,17 @@ from src.etl.preflight_notification_outbox_registry import (  # noqa: E402
     mark_outbox_sent,
     query_outbox_items,
 )
-from src.etl.preflight_notification_attempt_registry import (  # noqa: E402
+from src.etl.preflight_notification_attempt_registry import (
     count_delivery_attempts,
     complete_delivery_attempt,
     get_delivery_attempt,
     insert_delivery_attempt_started,
+    iter_delivery_attempts,
     query_delivery_attempts,
 )
 
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
 logger = logging.getLogger("preflight.notifications")
 
 EVENT_ALERT_FIRING = "ALERT_FIRING"
@@ -593,6 +594,7 @@ def _build_webhook_payload(
     }
 
 
+@marks_metrics_dirty
 def enqueue_alert_transition_notifications(
     *,
     event_type: str,
@@ -852,6 +854,7 @@ def _compute_retry_delay_seconds(base_backoff_seconds: int, attempt_count: int)
     return min(normalized_base * (2 ** (normalized_attempt - 1)), 24 * 3600)
 
 
+@marks_metrics_dirty
 def dispatch_due_notifications(
     *,
     limit: int = 50,
@@ -1123,6 +1126,7 @@ def run_notification_dispatch(
     return dispatch_due_notifications(limit=limit, actor=actor)
 
 
+@marks_metrics_dirty
 def replay_notification_outbox_item(
     *,
     item_id: str,
@@ -1171,6 +1175,7 @@ def replay_notification_outbox_item(
     }
 
 
+@marks_metrics_dirty
 def replay_dead_notification_outbox(
     *,
     limit: int = 50,
@@ -1211,26 +1216,86 @@ def replay_dead_notification_outbox(
     }
 
 
+_ACTIVE_OUTBOX_STATUSES = ("PENDING", "RETRYING")
+_FINISHED_OUTBOX_STATUSES = ("SENT", "FAILED", "DEAD")
+
+
+def _encode_page_cursor(row: dict[str, Any], *, date_field: str, id_field: str) -> str:
+    raw = json.dumps([row.get(date_field), row.get(id_field)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_page_cursor(cursor: str | None) -> tuple[datetime, str] | None:
+    text = _normalize_optional_text(cursor)
+    if text is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+        position_at, position_id = json.loads(raw)
+        parsed_at = _parse_datetime(position_at)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid pagination cursor.") from exc
+    if parsed_at is None or not isinstance(position_id, str):
+        raise ValueError("Invalid pagination cursor.")
+    return parsed_at, position_id
+
+
+def _outbox_page(
+    *,
+    limit: int,
+    statuses: tuple[str, ...],
+    cursor: str | None,
+) -> dict[str, Any]:
+    normalized_limit = max(1, min(int(limit), 1000))
+    items = list_outbox_history(limit=normalized_limit, statuses=statuses, before=_decode_page_cursor(cursor))
+    next_cursor = (
+        _encode_page_cursor(items[-1], date_field="created_at", id_field="id")
+        if len(items) == normalized_limit
+        else None
+    )
+    return {"limit": normalized_limit, "items": items, "next_cursor": next_cursor}
+
+
+def _outbox_statuses(status: str | None, *, default: tuple[str, ...]) -> tuple[str, ...]:
+    return (str(status).strip().upper(),) if status else default
+
+
 def get_notification_outbox(
     *,
     limit: int = 50,
     status: str | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
-    normalized_limit = max(1, min(int(limit), 1000))
-    statuses = (str(status).strip().upper(),) if status else ("PENDING", "RETRYING")
-    items = list_outbox_history(limit=normalized_limit, statuses=statuses)
-    return {"limit": normalized_limit, "items": items}
+    statuses = _outbox_statuses(status, default=_ACTIVE_OUTBOX_STATUSES)
+    return _outbox_page(limit=limit, statuses=statuses, cursor=cursor)
 
 
 def get_notification_history(
     *,
     limit: int = 50,
     status: str | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
-    normalized_limit = max(1, min(int(limit), 1000))
-    statuses = (str(status).strip().upper(),) if status else ("SENT", "FAILED", "DEAD")
-    items = list_outbox_history(limit=normalized_limit, statuses=statuses)
-    return {"limit": normalized_limit, "items": items}
+    statuses = _outbox_statuses(status, default=_FINISHED_OUTBOX_STATUSES)
+    return _outbox_page(limit=limit, statuses=statuses, cursor=cursor)
+
+
+def stream_notification_outbox(
+    *,
+    limit: int = 50,
+    status: str | None = None,
+    cursor: str | None = None,
+    history: bool = False,
+) -> Iterator[dict[str, Any]]:
+    statuses = _outbox_statuses(
+        status,
+        default=_FINISHED_OUTBOX_STATUSES if history else _ACTIVE_OUTBOX_STATUSES,
+    )
+    return iter_outbox_history(
+        limit=max(1, min(int(limit), 1000)),
+        statuses=statuses,
+        before=_decode_page_cursor(cursor),
+    )
 
 
 def _parse_row_datetime(value: Any) -> datetime | None:
@@ -1272,7 +1337,35 @@ def _query_notification_attempt_rows(
     alert_id: str | None = None,
     date_from: str | None = None,
     date_to: str | None = None,
+    limit: int | None = None,
+    descending: bool = False,
+    before: tuple[datetime, str] | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    query_kwargs, filters = _resolve_attempt_query(
+        days=days,
+        event_type=event_type,
+        channel_target=channel_target,
+        status=status,
+        attempt_status=attempt_status,
+        alert_id=alert_id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    rows = query_delivery_attempts(**query_kwargs, limit=limit, descending=descending, before=before)
+    return rows, filters
+
+
+def _resolve_attempt_query(
+    *,
+    days: int | None,
+    event_type: str | None,
+    channel_target: str | None,
+    status: str | None,
+    attempt_status: str | None,
+    alert_id: str | None,
+    date_from: str | None,
+    date_to: str | None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
     normalized_event_type = _normalize_event_type_filter(event_type)
     normalized_channel_target = _normalize_optional_text(channel_target)
     normalized_alert_id = _normalize_optional_text(alert_id)
@@ -1289,17 +1382,15 @@ def _query_notification_attempt_rows(
         days=days,
     )
 
-    rows = query_delivery_attempts(
-        attempt_statuses=attempt_statuses,
-        event_type=normalized_event_type,
-        channel_target=normalized_channel_target,
-        alert_id=normalized_alert_id,
-        date_from=parsed_from,
-        date_to=parsed_to,
-        date_field="started_at",
-        limit=None,
-        descending=False,
-    )
+    query_kwargs = {
+        "attempt_statuses": attempt_statuses,
+        "event_type": normalized_event_type,
+        "channel_target": normalized_channel_target,
+        "alert_id": normalized_alert_id,
+        "date_from": parsed_from,
+        "date_to": parsed_to,
+        "date_field": "started_at",
+    }
 
     filters = {
         "days": normalized_days,
@@ -1311,7 +1402,7 @@ def _query_notification_attempt_rows(
         "date_from": _isoformat_utc(parsed_from) if parsed_from else None,
         "date_to": _isoformat_utc(parsed_to) if parsed_to else None,
     }
-    return rows, filters
+    return query_kwargs, filters
 
 
 def _query_pending_outbox_rows(
@@ -1338,25 +1429,11 @@ def _query_pending_outbox_rows(
     )
 
 
-def get_notification_stats(
-    *,
-    days: int | None = None,
-    event_type: str | None = None,
-    channel_target: str | None = None,
-    status: str | None = None,
-    date_from: str | None = None,
-    date_to: str | None = None,
+def _build_notification_stats(
+    attempt_rows: list[dict[str, Any]],
+    pending_rows: list[dict[str, Any]],
+    filters: dict[str, Any],
 ) -> dict[str, Any]:
-    attempt_rows, filters = _query_notification_attempt_rows(
-        days=days,
-        event_type=event_type,
-        channel_target=channel_target,
-        status=status,
-        date_from=date_from,
-        date_to=date_to,
-    )
-    now = datetime.now(timezone.utc)
-
     sent_count = sum(1 for row in attempt_rows if str(row.get("attempt_status", "")).upper() == "SENT")
     retry_count = sum(1 for row in attempt_rows if str(row.get("attempt_status", "")).upper() == "RETRY")
     dead_count = sum(1 for row in attempt_rows if str(row.get("attempt_status", "")).upper() == "DEAD")
@@ -1371,15 +1448,7 @@ def get_notification_stats(
     avg_delivery_latency_ms = float(sum(delivery_latencies) / len(delivery_latencies)) if delivery_latencies else None
     p95_delivery_latency_ms = _percentile(delivery_latencies, 95.0) if delivery_latencies else None
 
-    parsed_from = _parse_datetime(filters.get("date_from"))
-    parsed_to = _parse_datetime(filters.get("date_to"))
-    pending_rows = _query_pending_outbox_rows(
-        event_type=filters.get("event_type"),
-        channel_target=filters.get("channel_target"),
-        date_from=parsed_from,
-        date_to=parsed_to,
-        status=filters.get("status"),
-    )
+    now = datetime.now(timezone.utc)
     pending_count = len(pending_rows)
     pending_ages_seconds = []
     for row in pending_rows:
@@ -1405,35 +1474,18 @@ def get_notification_stats(
     }
 
 
-def get_notification_trends(
+def _build_notification_trends(
+    attempt_rows: list[dict[str, Any]],
+    filters: dict[str, Any],
     *,
-    days: int | None = None,
-    event_type: str | None = None,
-    channel_target: str | None = None,
-    status: str | None = None,
-    date_from: str | None = None,
-    date_to: str | None = None,
-    bucket: str = "day",
+    bucket: str,
 ) -> dict[str, Any]:
-    normalized_bucket = str(bucket).strip().lower() or "day"
-    if normalized_bucket not in {"day", "hour"}:
-        raise ValueError("bucket must be one of: day, hour")
-
-    attempt_rows, filters = _query_notification_attempt_rows(
-        days=days,
-        event_type=event_type,
-        channel_target=channel_target,
-        status=status,
-        date_from=date_from,
-        date_to=date_to,
-    )
-
     bucketed: dict[datetime, dict[str, Any]] = {}
     for row in attempt_rows:
         started_at = _parse_row_datetime(row.get("started_at"))
         if started_at is None:
             continue
-        bucket_start = _bucket_datetime(started_at, bucket=normalized_bucket)
+        bucket_start = _bucket_datetime(started_at, bucket=bucket)
         if bucket_start not in bucketed:
             bucketed[bucket_start] = {
                 "bucket_start": bucket_start,
@@ -1468,39 +1520,17 @@ def get_notification_trends(
         items.append(payload)
 
     return {
-        "bucket": normalized_bucket,
+        "bucket": bucket,
         "filters": filters,
         "items": items,
     }
 
 
-def get_notification_channels(
-    *,
-    days: int | None = None,
-    event_type: str | None = None,
-    channel_target: str | None = None,
-    status: str | None = None,
-    date_from: str | None = None,
-    date_to: str | None = None,
+def _build_notification_channels(
+    attempt_rows: list[dict[str, Any]],
+    pending_rows: list[dict[str, Any]],
+    filters: dict[str, Any],
 ) -> dict[str, Any]:
-    attempt_rows, filters = _query_notification_attempt_rows(
-        days=days,
-        event_type=event_type,
-        channel_target=channel_target,
-        status=status,
-        date_from=date_from,
-        date_to=date_to,
-    )
-
-    parsed_from = _parse_datetime(filters.get("date_from"))
-    parsed_to = _parse_datetime(filters.get("date_to"))
-    pending_rows = _query_pending_outbox_rows(
-        event_type=filters.get("event_type"),
-        channel_target=filters.get("channel_target"),
-        date_from=parsed_from,
-        date_to=parsed_to,
-        status=filters.get("status"),
-    )
     pending_by_channel: dict[str, int] = defaultdict(int)
     for row in pending_rows:
         target = str(row.get("channel_target", "")).strip() or "unknown"
@@ -1590,6 +1620,113 @@ def get_notification_channels(
     }
 
 
+def _query_notification_pending_rows(filters: dict[str, Any]) -> list[dict[str, Any]]:
+    return _query_pending_outbox_rows(
+        event_type=filters.get("event_type"),
+        channel_target=filters.get("channel_target"),
+        date_from=_parse_datetime(filters.get("date_from")),
+        date_to=_parse_datetime(filters.get("date_to")),
+        status=filters.get("status"),
+    )
+
+
+def get_notification_stats(
+    *,
+    days: int | None = None,
+    event_type: str | None = None,
+    channel_target: str | None = None,
+    status: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> dict[str, Any]:
+    attempt_rows, filters = _query_notification_attempt_rows(
+        days=days,
+        event_type=event_type,
+        channel_target=channel_target,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return _build_notification_stats(attempt_rows, _query_notification_pending_rows(filters), filters)
+
+
+def get_notification_trends(
+    *,
+    days: int | None = None,
+    event_type: str | None = None,
+    channel_target: str | None = None,
+    status: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    bucket: str = "day",
+) -> dict[str, Any]:
+    normalized_bucket = str(bucket).strip().lower() or "day"
+    if normalized_bucket not in {"day", "hour"}:
+        raise ValueError("bucket must be one of: day, hour")
+
+    attempt_rows, filters = _query_notification_attempt_rows(
+        days=days,
+        event_type=event_type,
+        channel_target=channel_target,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return _build_notification_trends(attempt_rows, filters, bucket=normalized_bucket)
+
+
+def get_notification_channels(
+    *,
+    days: int | None = None,
+    event_type: str | None = None,
+    channel_target: str | None = None,
+    status: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> dict[str, Any]:
+    attempt_rows, filters = _query_notification_attempt_rows(
+        days=days,
+        event_type=event_type,
+        channel_target=channel_target,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return _build_notification_channels(attempt_rows, _query_notification_pending_rows(filters), filters)
+
+
+def get_notification_overview(
+    *,
+    days: int | None = None,
+    event_type: str | None = None,
+    channel_target: str | None = None,
+    status: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    bucket: str = "day",
+) -> dict[str, Any]:
+    """Stats, trends and channels for one filter set from a single pair of queries."""
+
+    normalized_bucket = str(bucket).strip().lower() or "day"
+    if normalized_bucket not in {"day", "hour"}:
+        raise ValueError("bucket must be one of: day, hour")
+
+    attempt_rows, filters = _query_notification_attempt_rows(
+        days=days,
+        event_type=event_type,
+        channel_target=channel_target,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    pending_rows = _query_notification_pending_rows(filters)
+    return {
+        "stats": _build_notification_stats(attempt_rows, pending_rows, filters),
+        "trends": _build_notification_trends(attempt_rows, filters, bucket=normalized_bucket),
+        "channels": _build_notification_channels(attempt_rows, pending_rows, filters),
+    }
+
+
 def get_notification_attempts(
     *,
     limit: int = 100,
@@ -1600,6 +1737,7 @@ def get_notification_attempts(
     alert_id: str | None = None,
     date_from: str | None = None,
     date_to: str | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     normalized_limit = max(1, min(int(limit), 1000))
     rows, filters = _query_notification_attempt_rows(
@@ -1610,14 +1748,53 @@ def get_notification_attempts(
         alert_id=alert_id,
         date_from=date_from,
         date_to=date_to,
+        limit=normalized_limit,
+        descending=True,
+        before=_decode_page_cursor(cursor),
+    )
+    next_cursor = (
+        _encode_page_cursor(rows[-1], date_field="started_at", id_field="attempt_id")
+        if len(rows) == normalized_limit
+        else None
     )
     return {
         "limit": normalized_limit,
         "filters": filters,
-        "items": list(rows)[-normalized_limit:][::-1],
+        "items": rows,
+        "next_cursor": next_cursor,
     }
 
 
+def stream_notification_attempts(
+    *,
+    limit: int = 100,
+    days: int | None = None,
+    event_type: str | None = None,
+    channel_target: str | None = None,
+    attempt_status: str | None = None,
+    alert_id: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    cursor: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    query_kwargs, _ = _resolve_attempt_query(
+        days=days,
+        event_type=event_type,
+        channel_target=channel_target,
+        status=None,
+        attempt_status=attempt_status,
+        alert_id=alert_id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return iter_delivery_attempts(
+        **query_kwargs,
+        limit=max(1, min(int(limit), 1000)),
+        descending=True,
+        before=_decode_page_cursor(cursor),
+    )
+
+
 def get_notification_attempt_details(attempt_id: str) -> dict[str, Any] | None:
     normalized_attempt_id = str(attempt_id).strip()
     if not normalized_attempt_id:
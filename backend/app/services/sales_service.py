@@ -2,10 +2,15 @@
 from typing import Literal
 
 import sqlalchemy as sa
+from pydantic import TypeAdapter
 
 from app.db import fetch_all, fetch_one
 from app.schemas import SalesTimeseriesPoint, StoreComparisonMetrics, StoreItem
 
+# One pydantic-core pass per result set rather than one model call per row.
+_STORE_LIST_ADAPTER = TypeAdapter(list[StoreItem])
+_TIMESERIES_ADAPTER = TypeAdapter(list[SalesTimeseriesPoint])
+
 
 def list_stores() -> list[StoreItem]:
     """Return all stores — used by internal services (forecast, chat)."""
@@ -16,8 +21,7 @@ def list_stores() -> list[StoreItem]:
         ORDER BY store_id;
         """
     )
-    rows = fetch_all(query)
-    return [StoreItem(**row) for row in rows]
+    return _STORE_LIST_ADAPTER.validate_python(fetch_all(query))
 
 
 def list_stores_paginated(
@@ -48,7 +52,7 @@ def list_stores_paginated(
         ),
         params=data_params,
     )
-    return {"items": [StoreItem(**r) for r in rows], "total": total, "page": page, "page_size": page_size}
+    return {"items": _STORE_LIST_ADAPTER.validate_python(rows), "total": total, "page": page, "page_size": page_size}
 
 
 def get_store_by_id(store_id: int) -> StoreItem | None:
@@ -142,5 +146,5 @@ def get_sales_timeseries(
         """
     )
 
-    rows = fetch_all(query, params=params)
-    return [SalesTimeseriesPoint(**row) for row in rows]
+    # Pydantic dataclasses only accept dicts, not the RowMapping objects fetch_all returns.
+    return _TIMESERIES_ADAPTER.validate_python([dict(row) for row in fetch_all(query, params=params)])
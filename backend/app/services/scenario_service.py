@@ -3,8 +3,6 @@ from __future__ import annotations
 import os
 import uuid
 from datetime import datetime, timezone
-from pathlib import Path
-import sys
 from typing import Any
 
 import sqlalchemy as sa
@@ -12,10 +10,6 @@ import sqlalchemy as sa
 from app.db import engine
 from app.services.forecast_service import forecast_scenario_for_store
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from src.etl.data_source_registry import resolve_data_source_id
 from src.etl.forecast_run_registry import upsert_forecast_run
 
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import sqlalchemy as sa
 
-from app.config import get_settings
+from app.config import settings
 from app.db import fetch_one
 
 
@@ -47,7 +47,6 @@ def get_system_summary() -> dict:
 
 
 def get_model_metadata() -> dict:
-    settings = get_settings()
     metadata_path = _resolve_model_metadata_path(settings.model_metadata_path)
     model_path = _resolve_model_path(settings.model_path)
 
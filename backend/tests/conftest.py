@@ -2,6 +2,8 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
@@ -17,6 +19,10 @@ os.environ.setdefault("PREFLIGHT_ALERTS_SCHEDULER_ENABLED", "0")
 # Override JWT auth for all unit/integration tests so routes are reachable
 # without a real database user or signed token.
 from app.main import app  # noqa: E402  (must come after env setup)
+from app.cache import clear_async_ttl_caches  # noqa: E402
+from app.routers.diagnostics import clear_metrics_cache  # noqa: E402
+from app.security.diagnostics_auth import clear_auth_cache  # noqa: E402
+from app.services.chat_service import clear_latest_data_date_cache  # noqa: E402
 from app.security.jwt import get_current_user  # noqa: E402
 
 _TEST_USER = {
@@ -27,3 +33,19 @@ _TEST_USER = {
     "is_active": True,
 }
 app.dependency_overrides[get_current_user] = lambda: _TEST_USER
+
+
+def _clear_process_caches() -> None:
+    # Cache keys do not include DATABASE_URL, and most tests point it at a fresh
+    # SQLite file, so nothing cached may leak from one test into the next.
+    clear_async_ttl_caches()
+    clear_auth_cache()
+    clear_metrics_cache()
+    clear_latest_data_date_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_caches():
+    _clear_process_caches()
+    yield
+    _clear_process_caches()
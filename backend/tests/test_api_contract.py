@@ -1,6 +1,9 @@
+import logging
+
 from fastapi.testclient import TestClient
 
-from app.main import app
+import app.routers.contracts as contracts_router
+from app.main import _next_request_id, app
 
 
 def test_health_endpoint_has_security_and_request_headers():
@@ -16,6 +19,16 @@ def test_health_endpoint_has_security_and_request_headers():
     assert response.headers.get("referrer-policy") == "no-referrer"
 
 
+def test_client_request_id_is_echoed_and_blank_one_is_replaced():
+    client = TestClient(app)
+
+    echoed = client.get("/api/v1/health", headers={"X-Request-ID": "client-id-1"})
+    replaced = client.get("/api/v1/health", headers={"X-Request-ID": ""})
+
+    assert echoed.headers.get("x-request-id") == "client-id-1"
+    assert len(replaced.headers.get("x-request-id", "")) == 32
+
+
 def test_contract_by_id_returns_404_on_file_not_found(monkeypatch):
     monkeypatch.setattr(
         "app.services.contract_service.get_contract",
@@ -34,3 +47,111 @@ def test_contract_versions_returns_404_when_contract_missing(monkeypatch):
     client = TestClient(app)
     resp = client.get("/api/v1/contracts/no_such/versions")
     assert resp.status_code == 404
+
+
+def test_unhandled_error_returns_500_with_request_id(monkeypatch):
+    def boom(**_):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("app.routers.kpi.get_kpi_summary", boom)
+    client = TestClient(app)
+    resp = client.get(
+        "/api/v1/kpi/summary?date_from=2015-01-01&date_to=2015-01-31",
+        headers={"X-Request-ID": "req-123"},
+    )
+    assert resp.status_code == 500
+    assert resp.json() == {"detail": "Internal server error", "request_id": "req-123"}
+    assert resp.headers.get("x-request-id") == "req-123"
+    assert resp.headers.get("x-content-type-options") == "nosniff"
+
+
+def test_unhandled_error_body_escapes_client_request_id(monkeypatch):
+    def boom(**_):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("app.routers.kpi.get_kpi_summary", boom)
+    client = TestClient(app)
+    resp = client.get(
+        "/api/v1/kpi/summary?date_from=2015-01-01&date_to=2015-01-31",
+        headers={"X-Request-ID": 'a"b\\c'},
+    )
+    assert resp.status_code == 500
+    assert resp.json()["request_id"] == 'a"b\\c'
+
+
+def test_health_checks_are_not_access_logged(caplog):
+    client = TestClient(app)
+
+    with caplog.at_level(logging.INFO, logger="app.api"):
+        client.get("/api/v1/health")
+        client.get("/api/v1/unknown-route")
+
+    completed = [record.getMessage() for record in caplog.records if "Request completed" in record.getMessage()]
+    assert len(completed) == 1
+    assert "path=/api/v1/unknown-route" in completed[0]
+
+
+def test_generated_request_ids_are_unique_across_buffer_refills():
+    ids = [_next_request_id() for _ in range(1000)]
+
+    assert len(set(ids)) == len(ids)
+    assert all(len(item) == 32 and int(item, 16) >= 0 for item in ids)
+
+
+def test_contract_list_supports_etag_revalidation(monkeypatch):
+    calls: list[int] = []
+
+    def fake_list_contracts():
+        calls.append(1)
+        return [
+            {
+                "id": "rossmann_input_contract",
+                "name": "Rossmann",
+                "description": None,
+                "is_active": True,
+                "latest_version": "v1",
+                "versions_count": 1,
+            }
+        ]
+
+    monkeypatch.setattr(contracts_router, "list_contracts", fake_list_contracts)
+    contracts_router.clear_contract_list_cache()
+    client = TestClient(app)
+
+    first = client.get("/api/v1/contracts")
+    etag = first.headers.get("etag")
+    second = client.get("/api/v1/contracts", headers={"If-None-Match": etag})
+    contracts_router.clear_contract_list_cache()
+
+    assert first.status_code == 200
+    assert first.json()[0]["id"] == "rossmann_input_contract"
+    assert etag
+    assert second.status_code == 304
+    assert second.content == b""
+    assert len(calls) == 1
+
+
+def test_large_json_responses_are_gzip_compressed(monkeypatch):
+    rows = [
+        {
+            "id": f"contract_{index}",
+            "name": "Rossmann",
+            "description": None,
+            "is_active": True,
+            "latest_version": "v1",
+            "versions_count": 1,
+        }
+        for index in range(50)
+    ]
+    monkeypatch.setattr(contracts_router, "list_contracts", lambda: rows)
+    contracts_router.clear_contract_list_cache()
+    client = TestClient(app)
+
+    compressed = client.get("/api/v1/contracts", headers={"Accept-Encoding": "gzip"})
+    small = client.get("/api/v1/health", headers={"Accept-Encoding": "gzip"})
+    contracts_router.clear_contract_list_cache()
+
+    assert compressed.headers.get("content-encoding") == "gzip"
+    assert "accept-encoding" in compressed.headers.get("vary", "").lower()
+    assert len(compressed.json()) == 50
+    assert "content-encoding" not in small.headers
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.cache import async_ttl_cache
+
+
+def test_async_ttl_cache_shares_concurrent_misses_and_reuses_result():
+    calls: list[str] = []
+
+    @async_ttl_cache(60.0)
+    async def load(name: str) -> dict[str, str]:
+        calls.append(name)
+        await asyncio.sleep(0.01)
+        return {"name": name}
+
+    async def scenario() -> None:
+        first, second = await asyncio.gather(load("train"), load("train"))
+        assert first is second
+        assert await load("train") is first
+        await load(name="store")
+
+    asyncio.run(scenario())
+    assert calls == ["train", "store"]
+
+    load.cache_clear()
+    asyncio.run(load("train"))
+    assert calls == ["train", "store", "train"]
+
+
+def test_async_ttl_cache_does_not_store_failures():
+    attempts: list[int] = []
+
+    @async_ttl_cache(60.0)
+    async def flaky() -> int:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ValueError("boom")
+        return len(attempts)
+
+    async def scenario() -> None:
+        try:
+            await flaky()
+        except ValueError:
+            pass
+        assert await flaky() == 2
+
+    asyncio.run(scenario())
+
+
+def test_async_ttl_cache_leader_cancellation_does_not_cancel_followers():
+    calls: list[str] = []
+
+    @async_ttl_cache(60.0)
+    async def load(name: str) -> dict[str, str]:
+        calls.append(name)
+        await asyncio.sleep(0.05)
+        return {"name": name}
+
+    async def scenario() -> dict[str, str]:
+        leader = asyncio.create_task(load("train"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(load("train"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        result = await follower
+        assert leader.cancelled()
+        assert await load("train") is result
+        return result
+
+    assert asyncio.run(scenario()) == {"name": "train"}
+    assert calls == ["train"]
@@ -1,6 +1,10 @@
+from datetime import date
+
+import numpy as np
 from fastapi.testclient import TestClient
 
 import app.routers.chat as chat_router
+import app.services.chat_service as chat_service
 from app.main import app
 from app.schemas import ChatInsight, ChatResponse
 
@@ -69,3 +73,64 @@ def test_chat_query_intent_is_none_for_heuristic_fallback(monkeypatch):
     body = resp.json()
     assert body["detected_intent"] == "help"
     assert body["confidence_score"] is None
+
+
+def test_chat_date_range_caches_latest_data_date(monkeypatch):
+    queries: list[str] = []
+
+    def fake_fetch_one(query, *_args, **_kwargs):
+        queries.append(str(query))
+        return {"latest_date": date(2015, 7, 31)}
+
+    monkeypatch.setattr(chat_service, "fetch_one", fake_fetch_one)
+    chat_service.clear_latest_data_date_cache()
+
+    assert chat_service._extract_date_range("kpi summary") == (date(2015, 7, 2), date(2015, 7, 31))
+    assert chat_service._extract_date_range("sales last month") == (date(2015, 7, 2), date(2015, 7, 31))
+    assert chat_service._extract_date_range("sales until 2015-06-30") == (date(2015, 6, 1), date(2015, 6, 30))
+    chat_service.clear_latest_data_date_cache()
+
+    assert len(queries) == 1
+
+
+def test_chat_promo_impact_reads_rows_by_flag(monkeypatch):
+    rows = [{"promo_flag": "no_promo", "avg_sales": 4000.0}, {"promo_flag": "promo", "avg_sales": 5000.0}]
+    monkeypatch.setattr(chat_service, "fetch_all", lambda *_args, **_kwargs: rows)
+
+    store_answer = chat_service._chat_promo_impact("promo impact for store 7")
+    overall_answer = chat_service._chat_promo_impact("promo impact")
+
+    assert "store 7" in store_answer.answer and "(+25.0% uplift)" in store_answer.answer
+    assert overall_answer.insights[-1].value == "+25.0%"
+
+
+def test_chat_forecast_summarizes_total_and_peak(monkeypatch):
+    points = [
+        {"date": "2015-08-01", "predicted_sales": 100.0},
+        {"date": "2015-08-02", "predicted_sales": 300.0},
+        {"date": "2015-08-03", "predicted_sales": 300.0},
+    ]
+    monkeypatch.setattr(chat_service, "forecast_for_store", lambda **_kwargs: points)
+
+    response = chat_service._chat_forecast("forecast store 3 for 3 days")
+
+    assert "total projected sales 700" in response.answer
+    assert "Peak expected day is 2015-08-02 with 300." in response.answer
+
+
+def test_chat_intent_prediction_uses_cached_pipeline_labels(monkeypatch):
+    class FakePipeline:
+        classes_ = np.array(["forecast", "kpi_summary"])
+
+        def predict_proba(self, messages):
+            return np.array([[0.2, 0.8] for _ in messages])
+
+    monkeypatch.setattr(chat_service, "_load_chat_intent_artifact", lambda: {"pipeline": FakePipeline()})
+    chat_service._chat_pipeline.cache_clear()
+    chat_service._predict_intent.cache_clear()
+    try:
+        assert chat_service._predict_intent("total sales last month") == ("kpi_summary", 0.8)
+        assert chat_service._resolve_intent("total sales last month") == ("kpi_summary", 0.8)
+    finally:
+        chat_service._chat_pipeline.cache_clear()
+        chat_service._predict_intent.cache_clear()
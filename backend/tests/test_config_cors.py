@@ -1,3 +1,5 @@
+import re
+
 from app.config import Settings
 
 
@@ -9,10 +11,10 @@ def test_production_cors_uses_only_explicit_allowlist() -> None:
         frontend_port=5173,
     )
 
-    assert settings.cors_list == [
+    assert settings.cors_list == (
         "https://app.example.com",
         "https://stg-app.example.com",
-    ]
+    )
 
 
 def test_development_cors_adds_localhost_origins() -> None:
@@ -26,3 +28,37 @@ def test_development_cors_adds_localhost_origins() -> None:
     assert "https://app.example.com" in settings.cors_list
     assert "http://localhost:5179" in settings.cors_list
     assert "http://127.0.0.1:5179" in settings.cors_list
+
+
+def test_cors_list_is_computed_once_per_settings_instance() -> None:
+    settings = Settings(
+        database_url="postgresql+psycopg2://u:p@localhost:5432/db",
+        environment="production",
+        cors_origins="https://app.example.com",
+    )
+
+    assert settings.cors_list is settings.cors_list
+
+
+def test_large_cors_allowlist_is_matched_by_regex() -> None:
+    origins = [f"https://app{i}.example.com" for i in range(12)]
+    settings = Settings(
+        database_url="postgresql+psycopg2://u:p@localhost:5432/db",
+        environment="production",
+        cors_origins=",".join(origins),
+    )
+
+    pattern = re.compile(settings.cors_origin_regex)
+    assert all(pattern.fullmatch(origin) for origin in origins)
+    assert pattern.fullmatch("https://app1.example.com.evil.test") is None
+    assert pattern.fullmatch("https://appX.example.com") is None
+
+
+def test_small_cors_allowlist_keeps_plain_origin_list() -> None:
+    settings = Settings(
+        database_url="postgresql+psycopg2://u:p@localhost:5432/db",
+        environment="production",
+        cors_origins="https://app.example.com",
+    )
+
+    assert settings.cors_origin_regex is None
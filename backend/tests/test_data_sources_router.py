@@ -0,0 +1,51 @@
+from fastapi.testclient import TestClient
+
+import app.routers.data_sources as data_sources_router
+from app.main import app
+
+
+def _raise(exc: Exception):
+    def _fail(*_args, **_kwargs):
+        raise exc
+
+    return _fail
+
+
+def test_data_source_lookup_error_maps_to_404(monkeypatch):
+    monkeypatch.setattr(data_sources_router, "get_data_source_by_id", _raise(LookupError("data source not found: 9")))
+    client = TestClient(app)
+
+    resp = client.get("/api/v1/data-sources/9")
+
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == "data source not found: 9"
+
+
+def test_data_source_value_error_maps_to_400(monkeypatch):
+    monkeypatch.setattr(data_sources_router, "list_data_source_preflight_runs", _raise(ValueError("bad id")))
+    client = TestClient(app)
+
+    resp = client.get("/api/v1/data-sources/1/preflight-runs?limit=5")
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "bad id"
+
+
+def test_data_source_unexpected_error_maps_to_500(monkeypatch, caplog):
+    monkeypatch.setattr(data_sources_router, "list_data_sources_with_health", _raise(RuntimeError("db down")))
+    client = TestClient(app)
+
+    with caplog.at_level("ERROR", logger="app.errors"):
+        resp = client.get("/api/v1/data-sources")
+
+    assert resp.status_code == 500
+    assert resp.json()["detail"] == "Data source error"
+    assert any(record.exc_info and "db down" in str(record.exc_info[1]) for record in caplog.records)
+
+
+def test_data_source_query_params_are_still_validated():
+    client = TestClient(app)
+
+    resp = client.get("/api/v1/data-sources/1/preflight-runs?limit=0")
+
+    assert resp.status_code == 422
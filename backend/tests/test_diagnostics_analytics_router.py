@@ -221,6 +221,20 @@ def test_stats_endpoint_returns_expected_aggregates(monkeypatch, tmp_path: Path)
     assert payload["by_source"]["store"]["total_runs"] == 1
 
 
+def test_stats_endpoint_supports_etag_revalidation(monkeypatch, tmp_path: Path):
+    client, _, headers = _seed_registry(monkeypatch, tmp_path)
+    url = "/api/v1/diagnostics/preflight/stats?date_from=2026-02-20&date_to=2026-02-22"
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["cache-control"].startswith("private, max-age=5")
+    etag = response.headers["etag"]
+
+    revalidated = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+
 def test_stats_endpoint_filters(monkeypatch, tmp_path: Path):
     client, _, headers = _seed_registry(monkeypatch, tmp_path)
     response = client.get(
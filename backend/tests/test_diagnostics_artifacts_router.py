@@ -203,6 +203,9 @@ def test_artifact_endpoints_return_validation_semantic_manifest(monkeypatch, tmp
     )
     assert download_response.status_code == 200
     assert download_response.headers["content-type"].startswith("application/json")
+    assert download_response.headers["x-accel-buffering"] == "no"
+    assert int(download_response.headers["content-length"]) == len(download_response.content)
+    assert "content-encoding" not in download_response.headers
 
 
 def test_missing_artifact_returns_404(monkeypatch, tmp_path: Path):
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import time
 
+from fastapi import BackgroundTasks, Request
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
+import pytest
 import yaml
 
 from app.main import app
+from app.security import diagnostics_auth
 from backend.tests.diagnostics_auth_helpers import create_auth_headers
 from src.etl.preflight_notification_outbox_registry import insert_outbox_event
 
@@ -216,3 +222,117 @@ def test_notifications_endpoints_require_read_and_admin_scopes(monkeypatch, tmp_
     assert replay_payload["replayed_count"] == 1
     assert replay_payload["items"][0]["event_id"] == dead_item["event_id"]
     assert replay_payload["items"][0]["delivery_id"] != dead_item["delivery_id"]
+
+
+def test_principal_is_resolved_once_per_request(monkeypatch, tmp_path: Path):
+    _prepare_env(monkeypatch, tmp_path)
+    lookups: list[str] = []
+
+    def _fake_authenticate(api_key: str) -> dict[str, object]:
+        lookups.append(api_key)
+        return {"client_id": "client-1", "name": "reader", "scopes": ["diagnostics:read"]}
+
+    monkeypatch.setattr(diagnostics_auth, "authenticate_api_key", _fake_authenticate)
+    monkeypatch.setattr(diagnostics_auth, "touch_api_client_usage", lambda *args, **kwargs: None)
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": [], "client": ("127.0.0.1", 1)})
+
+    background_tasks = BackgroundTasks()
+
+    async def _authenticate_twice() -> tuple[object, object]:
+        first = await diagnostics_auth.authenticate_diagnostics_principal(request, background_tasks, api_key="key-1")
+        second = await diagnostics_auth.authenticate_diagnostics_principal(request, background_tasks, api_key="key-1")
+        return first, second
+
+    first, second = asyncio.run(_authenticate_twice())
+    assert first is second
+    assert lookups == ["key-1"]
+
+
+def test_api_key_lookups_are_cached_across_requests(monkeypatch, tmp_path: Path):
+    _prepare_env(monkeypatch, tmp_path)
+    monkeypatch.setenv("DIAGNOSTICS_AUTH_CACHE_TTL_SECONDS", "60")
+    lookups: list[str] = []
+    touches: list[str] = []
+
+    def _fake_authenticate(api_key: str) -> dict[str, object] | None:
+        lookups.append(api_key)
+        if api_key != "good-key":
+            return None
+        return {"client_id": "client-1", "name": "reader", "scopes": ["diagnostics:read"]}
+
+    monkeypatch.setattr(diagnostics_auth, "authenticate_api_key", _fake_authenticate)
+    monkeypatch.setattr(diagnostics_auth, "touch_api_client_usage", lambda client_id, **kwargs: touches.append(client_id))
+    diagnostics_auth.clear_auth_cache()
+    client = TestClient(app)
+
+    for _ in range(3):
+        assert client.get("/api/v1/diagnostics/preflight/runs?limit=5", headers={"X-API-Key": "good-key"}).status_code == 200
+    for _ in range(2):
+        assert client.get("/api/v1/diagnostics/preflight/runs?limit=5", headers={"X-API-Key": "bad-key"}).status_code == 401
+    assert lookups == ["good-key", "bad-key", "bad-key"]
+    assert touches == ["client-1"]
+
+    diagnostics_auth.clear_auth_cache()
+    assert client.get("/api/v1/diagnostics/preflight/runs?limit=5", headers={"X-API-Key": "good-key"}).status_code == 200
+    assert lookups[-1] == "good-key" and len(lookups) == 4
+
+
+def test_cached_principal_is_shared_and_frozen(monkeypatch):
+    monkeypatch.setenv("DIAGNOSTICS_AUTH_CACHE_TTL_SECONDS", "60")
+    client_row = {"client_id": "client-1", "name": " reader ", "scopes": [" diagnostics:read ", "diagnostics:read"]}
+    monkeypatch.setattr(diagnostics_auth, "authenticate_api_key", lambda api_key: client_row)
+    diagnostics_auth.clear_auth_cache()
+
+    async def _lookup_twice():
+        return await diagnostics_auth._lookup_principal("good-key"), await diagnostics_auth._lookup_principal("good-key")
+
+    (first, first_looked_up), (second, second_looked_up) = asyncio.run(_lookup_twice())
+    diagnostics_auth.clear_auth_cache()
+
+    assert (first_looked_up, second_looked_up) == (True, False)
+    assert second is first
+    assert first == diagnostics_auth.DiagnosticsPrincipal.model_validate(
+        {"client_id": "client-1", "name": " reader ", "actor": "reader", "scopes": ["diagnostics:read"]}
+    )
+    with pytest.raises(ValidationError):
+        first.actor = "someone-else"
+
+
+def test_legacy_principal_is_reused_per_actor():
+    def _request(headers: dict[str, str]) -> Request:
+        raw_headers = [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+        return Request({"type": "http", "headers": raw_headers})
+
+    default = diagnostics_auth._legacy_principal(_request({}))
+    assert diagnostics_auth._legacy_principal(_request({"X-Actor": "  "})) is default
+    assert default.actor == "legacy-local" and default.legacy_mode
+
+    named = diagnostics_auth._legacy_principal(_request({"X-Actor": " ops "}))
+    assert named.actor == "ops"
+    assert diagnostics_auth._legacy_principal(_request({"X-Actor": "ops"})) is named
+
+
+def test_principal_lookups_share_one_call_per_key_and_run_concurrently_across_keys(monkeypatch):
+    monkeypatch.setenv("DIAGNOSTICS_AUTH_CACHE_TTL_SECONDS", "60")
+    lookups: list[str] = []
+
+    def slow_authenticate(api_key: str) -> None:
+        lookups.append(api_key)
+        time.sleep(0.2)
+        return None
+
+    monkeypatch.setattr(diagnostics_auth, "authenticate_api_key", slow_authenticate)
+    diagnostics_auth.clear_auth_cache()
+
+    async def _lookup_all():
+        keys = ["bad-1", "bad-2", "bad-3", "bad-4", "same", "same"]
+        return await asyncio.gather(*(diagnostics_auth._lookup_principal(key) for key in keys))
+
+    started = time.perf_counter()
+    results = asyncio.run(_lookup_all())
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.6
+    assert sorted(lookups) == ["bad-1", "bad-2", "bad-3", "bad-4", "same"]
+    assert [principal for principal, _ in results] == [None] * 6
+    assert [looked_up for _, looked_up in results] == [True, True, True, True, True, False]
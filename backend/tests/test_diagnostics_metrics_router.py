@@ -6,6 +6,7 @@ from pathlib import Path
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.services.metrics_export_service import mark_metrics_dirty
 from backend.tests.diagnostics_auth_helpers import create_auth_headers
 from src.etl.preflight_alert_registry import (
     acquire_scheduler_lease,
@@ -377,8 +378,11 @@ def test_metrics_endpoint_outputs_expected_series(monkeypatch, tmp_path: Path):
     )
 
     client = TestClient(app)
-    response = client.get("/api/v1/diagnostics/metrics", headers=headers)
+    response = client.get("/api/v1/diagnostics/metrics", headers={**headers, "Accept-Encoding": "gzip"})
     assert response.status_code == 200
+    # Scrapers expect plain text; the body is large enough that GZip would otherwise apply.
+    assert "content-encoding" not in response.headers
+    assert len(response.content) > 1024
     payload = response.text
 
     assert "# HELP preflight_runs_total" in payload
@@ -439,3 +443,38 @@ def test_metrics_endpoint_empty_state_is_valid(monkeypatch, tmp_path: Path):
     assert "preflight_notifications_outbox_pending 0" in payload
     assert "preflight_notifications_outbox_dead 0" in payload
     assert "preflight_notifications_delivery_latency_ms_count 0" in payload
+
+
+def test_metrics_endpoint_reuses_rendered_payload_within_ttl(monkeypatch, tmp_path: Path):
+    from app.routers import diagnostics as diagnostics_router
+
+    _configure_env(monkeypatch, tmp_path, db_name="diagnostics_metrics_cache.db")
+    monkeypatch.setenv("DIAGNOSTICS_METRICS_AUTH_DISABLED", "1")
+    monkeypatch.setenv("DIAGNOSTICS_METRICS_CACHE_TTL_SECONDS", "60")
+    diagnostics_router.clear_metrics_cache()
+
+    calls: list[int] = []
+
+    def fake_render() -> str:
+        calls.append(1)
+        return f"preflight_metrics_render_calls {len(calls)}\n"
+
+    monkeypatch.setattr(diagnostics_router, "render_prometheus_metrics", fake_render)
+
+    client = TestClient(app)
+    first = client.get("/api/v1/diagnostics/metrics")
+    second = client.get("/api/v1/diagnostics/metrics")
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-store"
+    assert second.text == first.text == "preflight_metrics_render_calls 1\n"
+    assert len(calls) == 1
+
+    mark_metrics_dirty()
+    third = client.get("/api/v1/diagnostics/metrics")
+    assert third.text == "preflight_metrics_render_calls 2\n"
+    assert client.get("/api/v1/diagnostics/metrics").text == third.text
+
+    monkeypatch.setenv("DIAGNOSTICS_METRICS_CACHE_TTL_SECONDS", "0")
+    fourth = client.get("/api/v1/diagnostics/metrics")
+    assert fourth.text == "preflight_metrics_render_calls 3\n"
+    diagnostics_router.clear_metrics_cache()
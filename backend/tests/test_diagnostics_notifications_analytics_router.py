@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
+import app.routers.diagnostics as diagnostics_router
 from app.main import app
 from backend.tests.diagnostics_auth_helpers import create_auth_headers
 from src.etl.preflight_notification_attempt_registry import (
@@ -326,6 +328,25 @@ def test_notification_channels_summary(monkeypatch, tmp_path: Path):
     assert channel_b["top_error_codes"][0]["error_code"] == "NETWORK_ERROR"
 
 
+def test_notification_overview_matches_individual_endpoints(monkeypatch, tmp_path: Path):
+    client, headers = _seed_notification_data(monkeypatch, tmp_path)
+    query = "date_from=2026-02-20&date_to=2026-02-22&bucket=day"
+    response = client.get(f"/api/v1/diagnostics/preflight/notifications/overview?{query}", headers=headers)
+    assert response.status_code == 200
+    payload = response.json()
+
+    for section in ("trends", "channels"):
+        individual = client.get(f"/api/v1/diagnostics/preflight/notifications/{section}?{query}", headers=headers)
+        assert payload[section] == individual.json()
+
+    stats = client.get(f"/api/v1/diagnostics/preflight/notifications/stats?{query}", headers=headers).json()
+    # Observability counters and pending age move between the two requests.
+    for volatile_key in ("runtime_observability", "oldest_pending_age_seconds"):
+        stats.pop(volatile_key)
+        payload["stats"].pop(volatile_key)
+    assert payload["stats"] == stats
+
+
 def test_notification_attempts_endpoints(monkeypatch, tmp_path: Path):
     client, headers = _seed_notification_data(monkeypatch, tmp_path)
 
@@ -351,6 +372,59 @@ def test_notification_attempts_endpoints(monkeypatch, tmp_path: Path):
     assert detail_payload["duration_ms"] >= 0
 
 
+def test_malformed_service_payload_is_a_server_error_not_a_bad_request(monkeypatch, tmp_path: Path):
+    client, headers = _seed_notification_data(monkeypatch, tmp_path)
+    monkeypatch.setattr(diagnostics_router, "get_notification_attempts", lambda **filters: {"limit": "many"})
+
+    response = client.get("/api/v1/diagnostics/preflight/notifications/attempts", headers=headers)
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Diagnostics error"
+
+
+def test_notification_attempts_cursor_pagination(monkeypatch, tmp_path: Path):
+    client, headers = _seed_notification_data(monkeypatch, tmp_path)
+    base_url = "/api/v1/diagnostics/preflight/notifications/attempts?date_from=2026-02-20&date_to=2026-02-22&limit=2"
+
+    seen: list[str] = []
+    started: list[str] = []
+    cursor = None
+    for _ in range(5):
+        url = base_url if cursor is None else f"{base_url}&cursor={cursor}"
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        payload = response.json()
+        seen.extend(item["attempt_id"] for item in payload["items"])
+        started.extend(item["started_at"] for item in payload["items"])
+        cursor = payload["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 5
+    assert started == sorted(started, reverse=True)
+
+    invalid = client.get(f"{base_url}&cursor=not-a-cursor", headers=headers)
+    assert invalid.status_code == 400
+
+
+def test_notification_attempts_ndjson_stream_matches_json_page(monkeypatch, tmp_path: Path):
+    client, headers = _seed_notification_data(monkeypatch, tmp_path)
+    url = "/api/v1/diagnostics/preflight/notifications/attempts?date_from=2026-02-20&date_to=2026-02-22"
+
+    page = client.get(url, headers=headers)
+    assert page.status_code == 200
+
+    streamed = client.get(url, headers={**headers, "Accept": "application/x-ndjson", "Accept-Encoding": "gzip"})
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    assert "content-encoding" not in streamed.headers
+    rows = [json.loads(line) for line in streamed.text.splitlines()]
+    assert [row["attempt_id"] for row in rows] == [item["attempt_id"] for item in page.json()["items"]]
+
+    invalid = client.get(f"{url}&attempt_status=NOT_A_STATUS", headers={**headers, "Accept": "application/x-ndjson"})
+    assert invalid.status_code == 400
+
+
 def test_notification_stats_empty_window_and_invalid_filters(monkeypatch, tmp_path: Path):
     client, headers = _seed_notification_data(monkeypatch, tmp_path)
 
@@ -51,6 +51,26 @@ def test_forecast_batch_route_returns_expected_shape(monkeypatch):
     assert len(payload["portfolio_series"]) == 1
 
 
+def test_forecast_route_serializes_points(monkeypatch):
+    client = TestClient(app)
+
+    def fake_forecast(store_id: int, horizon_days: int) -> list[dict]:
+        return [
+            {"date": "2025-01-01", "predicted_sales": 35.0, "predicted_lower": 30.0, "predicted_upper": 40.0},
+            {"date": "2025-01-02", "predicted_sales": 36.5},
+        ]
+
+    monkeypatch.setattr(forecast_router, "forecast_for_store", fake_forecast)
+    response = client.post("/api/v1/forecast", json={"store_id": 1, "horizon_days": 2})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [
+        {"date": "2025-01-01", "predicted_sales": 35.0, "predicted_lower": 30.0, "predicted_upper": 40.0},
+        {"date": "2025-01-02", "predicted_sales": 36.5, "predicted_lower": None, "predicted_upper": None},
+    ]
+
+
 def test_forecast_batch_route_validates_payload():
     client = TestClient(app)
     response = client.post("/api/v1/forecast/batch", json={"store_ids": [], "horizon_days": 7})
@@ -92,3 +112,123 @@ def test_forecast_cache_get_promotes_to_mru():
     last_key = next(reversed(_FORECAST_CACHE))
     assert last_key == (1, 7, "2025-01-01"), "Hit key should be moved to MRU position"
     _FORECAST_CACHE.clear()
+
+
+def test_forecast_batch_runs_store_forecasts_concurrently(monkeypatch):
+    import threading
+
+    import app.services.forecast_service as forecast_service
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_forecast(store_id: int, horizon_days: int, data_source_id=None, *, _record_run=True) -> list[dict]:
+        barrier.wait()  # only passes when all three stores are in flight together
+        return [
+            {
+                "date": f"2025-01-0{day + 1}",
+                "predicted_sales": float(store_id),
+                "predicted_lower": float(store_id) - 1,
+                "predicted_upper": float(store_id) + 1,
+            }
+            for day in range(horizon_days)
+        ]
+
+    monkeypatch.setattr(forecast_service, "forecast_for_store", fake_forecast)
+    monkeypatch.setattr(forecast_service, "resolve_data_source_id", lambda data_source_id: None)
+    monkeypatch.setattr(forecast_service, "_record_forecast_run", lambda **kwargs: None)
+
+    result = forecast_service.forecast_batch_for_stores(store_ids=[3, 1, 2], horizon_days=2)
+
+    assert [item["store_id"] for item in result["store_summaries"]] == [3, 1, 2]
+    assert result["portfolio_series"][0]["predicted_sales"] == 6.0
+
+
+def test_load_artifact_deserializes_once_for_concurrent_callers(monkeypatch, tmp_path):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    import app.services.forecast_service as forecast_service
+
+    model_path = tmp_path / "model.joblib"
+    model_path.write_bytes(b"stub")
+    load_calls: list[object] = []
+
+    def fake_load(path):
+        load_calls.append(path)
+        time.sleep(0.05)  # widen the window in which an unlocked check-and-load would race
+        return {"model": object()}
+
+    monkeypatch.setattr(forecast_service, "_resolve_model_path", lambda: model_path)
+    monkeypatch.setattr(forecast_service.joblib, "load", fake_load)
+    for key in ("path", "mtime", "payload"):
+        monkeypatch.setitem(forecast_service._ARTIFACT_CACHE, key, None)
+
+    barrier = threading.Barrier(8, timeout=5)
+
+    def load_together(_):
+        barrier.wait()
+        return forecast_service._load_artifact()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        payloads = list(pool.map(load_together, range(8)))
+
+    assert len(load_calls) == 1
+    assert all(payload is payloads[0] for payload in payloads)
+
+
+def test_forecast_batch_portfolio_aggregates_pin_dict_shape(monkeypatch):
+    import app.services.forecast_service as forecast_service
+
+    daily_sales = {1: [10.0, 30.0, 20.0], 2: [5.0, 15.0, 40.0]}
+
+    def fake_forecast(store_id: int, horizon_days: int, data_source_id=None, *, _record_run=True) -> list[dict]:
+        return [
+            {
+                "date": f"2025-01-0{day + 1}",
+                "predicted_sales": sales,
+                "predicted_lower": sales - 2.0,
+                "predicted_upper": sales + 2.0,
+            }
+            for day, sales in enumerate(daily_sales[store_id][:horizon_days])
+        ]
+
+    monkeypatch.setattr(forecast_service, "forecast_for_store", fake_forecast)
+    monkeypatch.setattr(forecast_service, "resolve_data_source_id", lambda data_source_id: None)
+    monkeypatch.setattr(forecast_service, "_record_forecast_run", lambda **kwargs: None)
+
+    result = forecast_service.forecast_batch_for_stores(store_ids=[1, 2], horizon_days=3)
+
+    assert result["portfolio_series"] == [
+        {"date": "2025-01-01", "predicted_sales": 15.0, "predicted_lower": 11.0, "predicted_upper": 19.0},
+        {"date": "2025-01-02", "predicted_sales": 45.0, "predicted_lower": 41.0, "predicted_upper": 49.0},
+        {"date": "2025-01-03", "predicted_sales": 60.0, "predicted_lower": 56.0, "predicted_upper": 64.0},
+    ]
+    assert all(type(row["predicted_sales"]) is float for row in result["portfolio_series"])
+    assert result["portfolio_summary"] == {
+        "stores_count": 2,
+        "horizon_days": 3,
+        "total_predicted_sales": 120.0,
+        "avg_daily_sales": 40.0,
+        "peak_date": "2025-01-03",
+        "peak_sales": 60.0,
+        "avg_interval_width": 8.0,
+    }
+
+
+def test_forecast_errors_map_to_status_codes(monkeypatch):
+    def fake_forecast(store_id: int, horizon_days: int) -> list[dict]:
+        if store_id == 1:
+            raise ValueError("store 1 has no history")
+        raise RuntimeError("model server unreachable")
+
+    monkeypatch.setattr(forecast_router, "forecast_for_store", fake_forecast)
+    client = TestClient(app)
+
+    bad_request = client.post("/api/v1/forecast", json={"store_id": 1, "horizon_days": 7})
+    failed = client.post("/api/v1/forecast", json={"store_id": 2, "horizon_days": 7})
+
+    assert bad_request.status_code == 400
+    assert bad_request.json()["detail"] == "store 1 has no history"
+    assert failed.status_code == 500
+    assert failed.json()["detail"] == "An unexpected error occurred while generating the forecast."
@@ -49,3 +49,31 @@ def test_promo_impact_returns_list(monkeypatch):
     assert isinstance(body, list)
     assert len(body) == 2
     assert body[0]["promo_flag"] == "promo"
+
+
+def test_kpi_summary_reuses_cached_body_for_repeated_ranges(monkeypatch):
+    calls = []
+
+    def fake_kpi(date_from, date_to, store_id=None):
+        calls.append((date_from, date_to, store_id))
+        return KpiSummaryResponse(
+            date_from=date_from,
+            date_to=date_to,
+            store_id=store_id,
+            total_sales=10.0,
+            total_customers=2.0,
+            avg_daily_sales=1.0,
+            promo_days=1,
+            open_days=2,
+        )
+
+    monkeypatch.setattr(kpi_router, "get_kpi_summary", fake_kpi)
+    client = TestClient(app)
+    url = "/api/v1/kpi/summary?date_from=2015-01-01&date_to=2015-01-31"
+    first = client.get(url)
+    second = client.get(url)
+    other_store = client.get(f"{url}&store_id=3")
+
+    assert first.status_code == second.status_code == other_store.status_code == 200
+    assert first.content == second.content
+    assert len(calls) == 2
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from fastapi.testclient import TestClient
+
+from app.main import app
 from app.services.preflight_alerts_scheduler import PreflightAlertsScheduler
 
 
@@ -25,3 +28,15 @@ def test_scheduler_handles_missing_apscheduler(monkeypatch):
     assert started is False
     assert scheduler.is_running is False
     scheduler.shutdown()
+
+
+def test_app_lifespan_keeps_scheduler_on_app_state(monkeypatch):
+    monkeypatch.setenv("PREFLIGHT_ALERTS_SCHEDULER_ENABLED", "0")
+    shutdown_calls: list[bool] = []
+    monkeypatch.setattr(PreflightAlertsScheduler, "shutdown", lambda self: shutdown_calls.append(True))
+
+    with TestClient(app):
+        assert isinstance(app.state.preflight_scheduler, PreflightAlertsScheduler)
+        assert shutdown_calls == []
+
+    assert shutdown_calls == [True]
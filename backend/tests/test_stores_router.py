@@ -38,6 +38,18 @@ def test_get_stores_filter_by_store_type(monkeypatch):
     assert all(s["store_type"] == "a" for s in body["items"])
 
 
+def test_get_stores_revalidates_with_etag(monkeypatch):
+    monkeypatch.setattr(stores_router, "list_stores_paginated", _fake_paginated)
+    client = TestClient(app)
+    first = client.get("/api/v1/stores")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, max-age=30"
+
+    resp = client.get("/api/v1/stores", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
 def test_get_store_by_id_returns_item(monkeypatch):
     monkeypatch.setattr(stores_router, "get_store_by_id", lambda sid: StoreItem(store_id=sid, store_type="c", assortment="a"))
     client = TestClient(app)
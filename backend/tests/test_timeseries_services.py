@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import date
+
+import sqlalchemy as sa
+
+import app.services.kpi_service as kpi_service
+import app.services.sales_service as sales_service
+
+
+def _row_mappings(select_sql: str) -> list:
+    # Real RowMapping objects, as app.db.fetch_all returns them from the database.
+    engine = sa.create_engine("sqlite://")
+    with engine.connect() as conn:
+        return conn.execute(sa.text(select_sql)).mappings().all()
+
+
+def test_sales_timeseries_validates_row_mappings(monkeypatch):
+    rows = _row_mappings(
+        "SELECT '2015-07-01' AS date, 1 AS store_id, 5263.0 AS sales, 555.0 AS customers, 1 AS promo, 1 AS open"
+    )
+    monkeypatch.setattr(sales_service, "fetch_all", lambda *_args, **_kwargs: rows)
+
+    points = sales_service.get_sales_timeseries(
+        granularity="daily", date_from=date(2015, 7, 1), date_to=date(2015, 7, 31), store_id=1
+    )
+
+    assert len(points) == 1
+    assert points[0].date == date(2015, 7, 1)
+    assert points[0].sales == 5263.0
+
+
+def test_promo_impact_validates_row_mappings(monkeypatch):
+    rows = _row_mappings(
+        "SELECT 1 AS store_id, 'promo' AS promo_flag, 5000.0 AS avg_sales, 600.0 AS avg_customers, 30 AS num_days"
+    )
+    monkeypatch.setattr(kpi_service, "fetch_all", lambda *_args, **_kwargs: rows)
+
+    points = kpi_service.get_promo_impact(store_id=1)
+
+    assert [(point.store_id, point.promo_flag, point.num_days) for point in points] == [(1, "promo", 30)]
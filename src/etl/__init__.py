@@ -52,6 +52,7 @@ from .preflight_registry import (
     get_latest_preflight,
     get_preflight_run,
     insert_preflight_run,
+    list_latest_preflight_runs_by_data_source,
     list_preflight_runs,
     query_preflight_runs,
 )
@@ -85,6 +86,7 @@ __all__ = [
     "insert_preflight_run",
     "get_preflight_run",
     "list_preflight_runs",
+    "list_latest_preflight_runs_by_data_source",
     "query_preflight_runs",
     "get_latest_preflight",
     "create_api_client_key",
@@ -6,6 +6,8 @@ from typing import Any
 
 import sqlalchemy as sa
 
+from .registry_engine import create_registry_engine
+
 _TABLE_NAME = "forecast_run_registry"
 _METADATA = sa.MetaData()
 
@@ -40,7 +42,7 @@ def _resolve_database_url(database_url: str | None = None) -> str:
 
 def _get_engine(database_url: str) -> sa.Engine:
     if database_url not in _ENGINES:
-        _ENGINES[database_url] = sa.create_engine(database_url, future=True, pool_pre_ping=True)
+        _ENGINES[database_url] = create_registry_engine(database_url)
     return _ENGINES[database_url]
 
 
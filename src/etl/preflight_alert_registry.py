@@ -7,6 +7,8 @@ from typing import Any
 
 import sqlalchemy as sa
 
+from .registry_engine import create_registry_engine
+
 _STATE_TABLE_NAME = "preflight_alert_state"
 _HISTORY_TABLE_NAME = "preflight_alert_history"
 _SILENCE_TABLE_NAME = "preflight_alert_silence"
@@ -132,7 +134,7 @@ def _resolve_database_url(database_url: str | None = None) -> str:
 
 def _get_engine(database_url: str) -> sa.Engine:
     if database_url not in _ENGINES:
-        _ENGINES[database_url] = sa.create_engine(database_url, future=True, pool_pre_ping=True)
+        _ENGINES[database_url] = create_registry_engine(database_url)
     return _ENGINES[database_url]
 
 
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import os
 import uuid
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any
 
 import sqlalchemy as sa
 
+from .registry_engine import create_registry_engine
+
 _ATTEMPT_TABLE_NAME = "preflight_notification_delivery_attempt"
 _METADATA = sa.MetaData()
 
@@ -56,7 +59,7 @@ def _resolve_database_url(database_url: str | None = None) -> str:
 
 def _get_engine(database_url: str) -> sa.Engine:
     if database_url not in _ENGINES:
-        _ENGINES[database_url] = sa.create_engine(database_url, future=True, pool_pre_ping=True)
+        _ENGINES[database_url] = create_registry_engine(database_url)
     return _ENGINES[database_url]
 
 
@@ -221,7 +224,7 @@ def get_delivery_attempt(attempt_id: str, database_url: str | None = None) -> di
     return _serialize_row(dict(row))
 
 
-def query_delivery_attempts(
+def _build_delivery_attempts_query(
     *,
     attempt_statuses: tuple[str, ...] | None = None,
     event_type: str | None = None,
@@ -233,10 +236,8 @@ def query_delivery_attempts(
     limit: int | None = None,
     offset: int | None = None,
     descending: bool = True,
-    database_url: str | None = None,
-) -> list[dict[str, Any]]:
-    engine = _ensure_attempt_table(database_url)
-
+    before: tuple[datetime | str, str] | None = None,
+) -> sa.sql.Select:
     date_column_map = {
         "started_at": _ATTEMPT_TABLE.c.started_at,
         "completed_at": _ATTEMPT_TABLE.c.completed_at,
@@ -257,17 +258,97 @@ def query_delivery_attempts(
         date_column=selected_date_column,
     )
 
-    query = query.order_by(selected_date_column.desc() if descending else selected_date_column.asc())
+    if before is not None:
+        before_at = _ensure_datetime(before[0], default_now=False)
+        before_id = str(before[1])
+        query = query.where(
+            sa.or_(
+                selected_date_column < before_at,
+                sa.and_(selected_date_column == before_at, _ATTEMPT_TABLE.c.attempt_id < before_id),
+            )
+        )
+
+    if descending:
+        query = query.order_by(selected_date_column.desc(), _ATTEMPT_TABLE.c.attempt_id.desc())
+    else:
+        query = query.order_by(selected_date_column.asc(), _ATTEMPT_TABLE.c.attempt_id.asc())
     if limit is not None:
         query = query.limit(max(1, min(int(limit), 100000)))
     if offset is not None:
         query = query.offset(max(0, int(offset)))
+    return query
+
 
+def query_delivery_attempts(
+    *,
+    attempt_statuses: tuple[str, ...] | None = None,
+    event_type: str | None = None,
+    channel_target: str | None = None,
+    alert_id: str | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    date_field: str = "started_at",
+    limit: int | None = None,
+    offset: int | None = None,
+    descending: bool = True,
+    before: tuple[datetime | str, str] | None = None,
+    database_url: str | None = None,
+) -> list[dict[str, Any]]:
+    engine = _ensure_attempt_table(database_url)
+    query = _build_delivery_attempts_query(
+        attempt_statuses=attempt_statuses,
+        event_type=event_type,
+        channel_target=channel_target,
+        alert_id=alert_id,
+        date_from=date_from,
+        date_to=date_to,
+        date_field=date_field,
+        limit=limit,
+        offset=offset,
+        descending=descending,
+        before=before,
+    )
     with engine.connect() as conn:
         rows = conn.execute(query).mappings().all()
     return [_serialize_row(dict(row)) for row in rows]
 
 
+def iter_delivery_attempts(
+    *,
+    attempt_statuses: tuple[str, ...] | None = None,
+    event_type: str | None = None,
+    channel_target: str | None = None,
+    alert_id: str | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    date_field: str = "started_at",
+    limit: int | None = None,
+    offset: int | None = None,
+    descending: bool = True,
+    before: tuple[datetime | str, str] | None = None,
+    batch_size: int = 200,
+    database_url: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    engine = _ensure_attempt_table(database_url)
+    query = _build_delivery_attempts_query(
+        attempt_statuses=attempt_statuses,
+        event_type=event_type,
+        channel_target=channel_target,
+        alert_id=alert_id,
+        date_from=date_from,
+        date_to=date_to,
+        date_field=date_field,
+        limit=limit,
+        offset=offset,
+        descending=descending,
+        before=before,
+    )
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(query)
+        for row in result.mappings():
+            yield _serialize_row(dict(row))
+
+
 def _apply_attempt_filters(
     query: sa.sql.Select,
     *,
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import os
 import uuid
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any
 
 import sqlalchemy as sa
 
+from .registry_engine import create_registry_engine
+
 _OUTBOX_TABLE_NAME = "preflight_notification_outbox"
 _METADATA = sa.MetaData()
 
@@ -65,7 +68,7 @@ def _resolve_database_url(database_url: str | None = None) -> str:
 
 def _get_engine(database_url: str) -> sa.Engine:
     if database_url not in _ENGINES:
-        _ENGINES[database_url] = sa.create_engine(database_url, future=True, pool_pre_ping=True)
+        _ENGINES[database_url] = create_registry_engine(database_url)
     return _ENGINES[database_url]
 
 
@@ -368,15 +371,14 @@ def mark_outbox_dead(
     return _serialize_row(dict(row)) if row else None
 
 
-def list_outbox_history(
+def _build_outbox_history_query(
     *,
     limit: int = 100,
     statuses: tuple[str, ...] | None = None,
     event_type: str | None = None,
     channel_target: str | None = None,
-    database_url: str | None = None,
-) -> list[dict[str, Any]]:
-    engine = _ensure_outbox_table(database_url)
+    before: tuple[datetime | str, str] | None = None,
+) -> sa.sql.Select:
     normalized_limit = max(1, min(int(limit), 1000))
 
     query = sa.select(_OUTBOX_TABLE)
@@ -388,12 +390,65 @@ def list_outbox_history(
     if channel_target:
         query = query.where(_OUTBOX_TABLE.c.channel_target == str(channel_target).strip())
 
-    query = query.order_by(_OUTBOX_TABLE.c.created_at.desc()).limit(normalized_limit)
+    if before is not None:
+        before_at = _ensure_datetime(before[0])
+        before_id = str(before[1])
+        query = query.where(
+            sa.or_(
+                _OUTBOX_TABLE.c.created_at < before_at,
+                sa.and_(_OUTBOX_TABLE.c.created_at == before_at, _OUTBOX_TABLE.c.id < before_id),
+            )
+        )
+
+    return query.order_by(_OUTBOX_TABLE.c.created_at.desc(), _OUTBOX_TABLE.c.id.desc()).limit(normalized_limit)
+
+
+def list_outbox_history(
+    *,
+    limit: int = 100,
+    statuses: tuple[str, ...] | None = None,
+    event_type: str | None = None,
+    channel_target: str | None = None,
+    before: tuple[datetime | str, str] | None = None,
+    database_url: str | None = None,
+) -> list[dict[str, Any]]:
+    engine = _ensure_outbox_table(database_url)
+    query = _build_outbox_history_query(
+        limit=limit,
+        statuses=statuses,
+        event_type=event_type,
+        channel_target=channel_target,
+        before=before,
+    )
     with engine.connect() as conn:
         rows = conn.execute(query).mappings().all()
     return [_serialize_row(dict(row)) for row in rows]
 
 
+def iter_outbox_history(
+    *,
+    limit: int = 100,
+    statuses: tuple[str, ...] | None = None,
+    event_type: str | None = None,
+    channel_target: str | None = None,
+    before: tuple[datetime | str, str] | None = None,
+    batch_size: int = 200,
+    database_url: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    engine = _ensure_outbox_table(database_url)
+    query = _build_outbox_history_query(
+        limit=limit,
+        statuses=statuses,
+        event_type=event_type,
+        channel_target=channel_target,
+        before=before,
+    )
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(query)
+        for row in result.mappings():
+            yield _serialize_row(dict(row))
+
+
 def query_outbox_items(
     *,
     statuses: tuple[str, ...] | None = None,
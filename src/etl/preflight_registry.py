@@ -6,6 +6,8 @@ from typing import Any
 
 import sqlalchemy as sa
 
+from .registry_engine import create_registry_engine
+
 _TABLE_NAME = "preflight_run_registry"
 _METADATA = sa.MetaData()
 _REGISTRY_TABLE = sa.Table(
@@ -56,7 +58,7 @@ def _resolve_database_url(database_url: str | None = None) -> str:
 
 def _get_engine(database_url: str) -> sa.Engine:
     if database_url not in _ENGINES:
-        _ENGINES[database_url] = sa.create_engine(database_url, future=True, pool_pre_ping=True)
+        _ENGINES[database_url] = create_registry_engine(database_url)
     return _ENGINES[database_url]
 
 
@@ -157,6 +159,34 @@ def list_preflight_runs(
     return [_serialize_row(dict(row)) for row in rows]
 
 
+def list_latest_preflight_runs_by_data_source(database_url: str | None = None) -> list[dict[str, Any]]:
+    """Return the most recent preflight record for each data source, reduced in the database."""
+
+    engine = _ensure_registry_table(database_url)
+    rank = (
+        sa.func.row_number()
+        .over(
+            partition_by=_REGISTRY_TABLE.c.data_source_id,
+            order_by=(
+                _REGISTRY_TABLE.c.created_at.desc(),
+                _REGISTRY_TABLE.c.run_id.desc(),
+                _REGISTRY_TABLE.c.source_name.asc(),
+            ),
+        )
+        .label("recency_rank")
+    )
+    ranked = (
+        sa.select(_REGISTRY_TABLE, rank)
+        .where(_REGISTRY_TABLE.c.data_source_id.is_not(None))
+        .subquery()
+    )
+    query = sa.select(*(ranked.c[column.name] for column in _REGISTRY_TABLE.columns)).where(ranked.c.recency_rank == 1)
+
+    with engine.connect() as conn:
+        rows = conn.execute(query).mappings().all()
+    return [_serialize_row(dict(row)) for row in rows]
+
+
 def query_preflight_runs(
     *,
     source_name: str | None = None,
@@ -246,19 +276,7 @@ def aggregate_preflight_run_metrics(database_url: str | None = None) -> dict[str
     }
 
 
-def get_preflight_run(run_id: str, database_url: str | None = None) -> dict[str, Any] | None:
-    """Get all source records for a specific run_id."""
-
-    engine = _ensure_registry_table(database_url)
-    query = (
-        sa.select(_REGISTRY_TABLE)
-        .where(_REGISTRY_TABLE.c.run_id == run_id)
-        .order_by(_REGISTRY_TABLE.c.source_name.asc())
-    )
-
-    with engine.connect() as conn:
-        rows = conn.execute(query).mappings().all()
-
+def _grouped_run(run_id: str, rows: list[Any]) -> dict[str, Any] | None:
     if not rows:
         return None
 
@@ -285,6 +303,21 @@ def get_preflight_run(run_id: str, database_url: str | None = None) -> dict[str,
     }
 
 
+def get_preflight_run(run_id: str, database_url: str | None = None) -> dict[str, Any] | None:
+    """Get all source records for a specific run_id."""
+
+    engine = _ensure_registry_table(database_url)
+    query = (
+        sa.select(_REGISTRY_TABLE)
+        .where(_REGISTRY_TABLE.c.run_id == run_id)
+        .order_by(_REGISTRY_TABLE.c.source_name.asc())
+    )
+
+    with engine.connect() as conn:
+        rows = conn.execute(query).mappings().all()
+    return _grouped_run(run_id, rows)
+
+
 def get_latest_preflight(
     source_name: str | None = None,
     data_source_id: int | None = None,
@@ -301,12 +334,19 @@ def get_latest_preflight(
         )
         return rows[0] if rows else None
 
-    rows = list_preflight_runs(
-        limit=1,
-        source_name=None,
-        data_source_id=data_source_id,
-        database_url=database_url,
+    # Resolve the latest run_id and load all of its source records in one round trip.
+    engine = _ensure_registry_table(database_url)
+    latest_run_id = sa.select(_REGISTRY_TABLE.c.run_id).order_by(_REGISTRY_TABLE.c.created_at.desc()).limit(1)
+    if data_source_id is not None:
+        latest_run_id = latest_run_id.where(_REGISTRY_TABLE.c.data_source_id == int(data_source_id))
+    query = (
+        sa.select(_REGISTRY_TABLE)
+        .where(_REGISTRY_TABLE.c.run_id == latest_run_id.scalar_subquery())
+        .order_by(_REGISTRY_TABLE.c.source_name.asc())
     )
+
+    with engine.connect() as conn:
+        rows = conn.execute(query).mappings().all()
     if not rows:
         return None
-    return get_preflight_run(str(rows[0]["run_id"]), database_url=database_url)
+    return _grouped_run(str(rows[0]["run_id"]), rows)
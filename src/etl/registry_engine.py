@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import os
+
+import sqlalchemy as sa
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = str(os.getenv(name, "")).strip()
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def _float_env(name: str, default: float) -> float:
+    raw = str(os.getenv(name, "")).strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def create_registry_engine(database_url: str) -> sa.Engine:
+    options: dict[str, object] = {"future": True, "pool_pre_ping": True}
+    # Each registry keeps its own pool, so keep them small and fail fast when
+    # exhausted instead of stalling requests on SQLAlchemy's 30s default timeout.
+    if sa.engine.make_url(database_url).get_backend_name() != "sqlite":
+        options["pool_size"] = _int_env("REGISTRY_DB_POOL_SIZE", 5)
+        options["max_overflow"] = _int_env("REGISTRY_DB_MAX_OVERFLOW", 10)
+        options["pool_timeout"] = _float_env("DB_POOL_TIMEOUT", 5.0)
+        options["pool_recycle"] = _int_env("DB_POOL_RECYCLE", 1800)
+    return sa.create_engine(database_url, **options)
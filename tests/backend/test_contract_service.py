@@ -11,6 +11,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from backend.app.services.contract_service import (  # noqa: E402
+    _load_registry_payload,
     get_contract,
     get_contract_version,
     list_contracts,
@@ -68,3 +69,22 @@ def test_contract_registry_parsing_and_schema_summary(tmp_path: Path):
             os.environ.pop("CONTRACTS_REGISTRY_PATH", None)
         else:
             os.environ["CONTRACTS_REGISTRY_PATH"] = previous
+
+
+def test_contract_registry_is_reparsed_only_when_file_changes(tmp_path: Path, monkeypatch):
+    registry_path = tmp_path / "contracts_registry.yaml"
+    registry_path.write_text(
+        yaml.safe_dump({"contracts": [{"id": "c1", "name": "First", "versions": []}]}), encoding="utf-8"
+    )
+    monkeypatch.setenv("CONTRACTS_REGISTRY_PATH", str(registry_path))
+
+    first = _load_registry_payload()
+    assert _load_registry_payload() is first
+
+    registry_path.write_text(
+        yaml.safe_dump({"contracts": [{"id": "c1", "name": "Renamed", "versions": []}]}), encoding="utf-8"
+    )
+    stat = registry_path.stat()
+    os.utime(registry_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert get_contract("c1")["name"] == "Renamed"
@@ -8,8 +8,11 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+BACKEND_PATH = PROJECT_ROOT / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
 
-from backend.app.services.preflight_notifications_service import get_notification_deliveries  # noqa: E402
+from app.services.preflight_notifications_service import get_notification_deliveries  # noqa: E402
 from src.etl.preflight_notification_attempt_registry import (  # noqa: E402
     complete_delivery_attempt,
     insert_delivery_attempt_started,
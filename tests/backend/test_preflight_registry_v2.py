@@ -11,6 +11,7 @@ if str(PROJECT_ROOT) not in sys.path:
 from src.etl.preflight_registry import (  # noqa: E402
     get_latest_preflight,
     insert_preflight_run,
+    list_latest_preflight_runs_by_data_source,
     list_preflight_runs,
 )
 
@@ -67,3 +68,34 @@ def test_preflight_registry_keeps_legacy_rows_and_v2_fields(tmp_path: Path):
     latest_for_ds = get_latest_preflight(data_source_id=5, database_url=db_url)
     assert latest_for_ds is not None
     assert latest_for_ds["run_id"] == "v2_run"
+
+
+def test_get_latest_preflight_groups_all_sources_of_latest_run(tmp_path: Path):
+    db_url = _sqlite_url(tmp_path, "preflight_registry_latest.db")
+    older = datetime(2026, 2, 20, 8, 0, tzinfo=timezone.utc)
+    newer = datetime(2026, 2, 21, 8, 0, tzinfo=timezone.utc)
+
+    insert_preflight_run(_build_record("run_old", created_at=older), database_url=db_url)
+    insert_preflight_run(_build_record("run_new", source_name="store", created_at=newer), database_url=db_url)
+    failing = _build_record("run_new", source_name="train", created_at=newer)
+    failing["final_status"] = "FAIL"
+    insert_preflight_run(failing, database_url=db_url)
+
+    latest = get_latest_preflight(database_url=db_url)
+    assert latest is not None
+    assert latest["run_id"] == "run_new"
+    assert latest["final_status"] == "FAIL"
+    assert [record["source_name"] for record in latest["records"]] == ["store", "train"]
+
+
+def test_list_latest_preflight_runs_by_data_source_returns_one_row_per_source(tmp_path: Path):
+    db_url = _sqlite_url(tmp_path, "preflight_registry_latest_by_source.db")
+    for run_id, data_source_id, day in (("a1", 1, 1), ("a2", 1, 3), ("b1", 2, 2), ("legacy", None, 4)):
+        record = _build_record(run_id, created_at=datetime(2026, 3, day, tzinfo=timezone.utc))
+        record["data_source_id"] = data_source_id
+        insert_preflight_run(record, database_url=db_url)
+
+    rows = list_latest_preflight_runs_by_data_source(database_url=db_url)
+
+    assert sorted((row["data_source_id"], row["run_id"]) for row in rows) == [(1, "a2"), (2, "b1")]
+    assert next(row for row in rows if row["run_id"] == "a2")["created_at"] == "2026-03-03T00:00:00Z"